@@ -5,5 +5,5 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-from .main import Config, set_mtype, set_approx
-__all__ = ['Config', 'set_mtype', 'set_approx']
+from .main import Config, set_mtype, set_arch, set_approx, set_tolerance, set_hesitant_cap
+__all__ = ['Config', 'set_mtype', 'set_arch', 'set_approx', 'set_tolerance', 'set_hesitant_cap']
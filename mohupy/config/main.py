@@ -13,6 +13,9 @@ class Config:
     mtype = 'qrofn'
     enable_backprop = True
 
+    hesitant_cap = None
+    hesitant_prune = 'quantile'
+
     mtype_dict = FuzzType
 
 
@@ -22,6 +25,25 @@ def set_mtype(mtype: str):
     Config.mtype = mtype
 
 
+def set_arch(arch: str, param=None):
+    """
+        Set the Archimedean norm of the fuzzy operations. For the parameterized
+        generator families ('hamacher', 'frank', 'dombi'), 'param' sets the
+        parameter of the family.
+    """
+    from ..core import archimedeanDict
+    if param is not None:
+        from ..core.operationLib.generator import normFamily
+        from ..core import register_norm
+        if arch not in normFamily:
+            raise ValueError(f'Archimedean norm \'{arch}\' has no parameter. Please choose from {set(normFamily)}')
+        tau, inv_tau, _ = normFamily[arch]
+        register_norm(arch, tau, inv_tau, param)
+    if arch not in archimedeanDict:
+        raise ValueError(f'Archimedean norm \'{arch}\' does not exist. Please choose from {set(archimedeanDict)}')
+    Config.arch = arch
+
+
 def set_approx(approx):
     if approx <= 0:
         raise ValueError(f'Invalid approximation value: {approx}.')
@@ -29,3 +51,31 @@ def set_approx(approx):
     Approx.round = approx
 
 
+def set_tolerance(tolerance):
+    """
+        Set the tolerance of the equality comparison of fuzzy numbers, two
+        fuzzy numbers are equal if their degrees differ by at most 'tolerance'.
+    """
+    if tolerance < 0:
+        raise ValueError(f'Invalid tolerance value: {tolerance}.')
+    from ..core import Approx
+    Approx.tolerance = tolerance
+
+
+def set_hesitant_cap(cap, strategy='quantile'):
+    """
+        Bound the number of hesitant degrees of the results of the hesitant
+        fuzzy operations. After every addition and multiplication, the degrees
+        are deduplicated at 'Approx.round' decimals and the elements with more
+        than 'cap' degrees are pruned by the strategy: 'quantile', 'kmeans',
+        'topk' or 'unique' (deduplication, then the quantiles for the elements
+        that still exceed the cap). 'cap=None' removes the bound.
+        The results report the approximation in their 'pruning' attribute.
+    """
+    from ..core.prune import pruneStrategy
+    if cap is not None and (int(cap) != cap or cap < 1):
+        raise ValueError(f'Invalid hesitant cap: {cap}.')
+    if strategy not in pruneStrategy:
+        raise ValueError(f'Pruning strategy \'{strategy}\' does not exist. Please choose from {set(pruneStrategy)}')
+    Config.hesitant_cap = None if cap is None else int(cap)
+    Config.hesitant_prune = strategy
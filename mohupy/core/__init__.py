@@ -12,15 +12,24 @@ from .fuzzarray import Fuzzarray
 from .fuzznums import Fuzznum
 
 from .regedit import Registry
-from .operationLib import archimedeanDict
+from .operationLib import archimedeanDict, register_norm
 
 from .operationpackage import *
 
 __all__ += ['FuzzType', 'Fuzzarray', 'Fuzznum',
-            'Registry', 'archimedeanDict']
+            'Registry', 'archimedeanDict', 'register_norm']
 
 from .construct import fuzznum, fuzzset
 __all__ += ['fuzznum', 'fuzzset']
 
+from .reducer import Reducer
+__all__ += ['Reducer']
+
 from .constant import Approx
 __all__ += ['Approx']
+
+from .prune import PruneReport, pruneStrategy
+__all__ += ['PruneReport', 'pruneStrategy']
+
+from .semiring import fuzzSemiring, Semiring
+__all__ += ['fuzzSemiring', 'Semiring']
@@ -12,6 +12,7 @@ import numpy as np
 from .base import Attribute
 from .fuzznums import Fuzznum
 from .fuzzarray import Fuzzarray
+from .ragged import Ragged
 
 from .constant import Approx
 
@@ -67,6 +68,52 @@ class Str(Attribute):
         raise TypeError(f'Unsupported data types:{type(x)}.')
 
 
+class MeanPower(Attribute):
+    """
+        The mean q-th powers (m, n) of the membership and non-membership
+        degrees of every element of a fuzzy array, as float64 arrays of the
+        shape of the fuzzy array. For q-rung orthopair fuzzy numbers they are
+        md^q and nmd^q, for interval-valued fuzzy numbers the means over the
+        two bounds, and for hesitant fuzzy numbers the means over the ragged
+        hesitant elements (NaN for an empty hesitant element).
+    """
+
+    def function(self, x: Fuzzarray):
+        q = x.qrung
+        columns = x.columns
+        if columns is not None:
+            md, nmd = columns
+            if x.mtype == 'ivfn':
+                return (md ** q).mean(axis=-1), (nmd ** q).mean(axis=-1)
+            return md ** q, nmd ** q
+        if x.ragged is not None:
+            md, nmd = x.ragged
+            m = md.with_values(md.values ** q).mean()
+            n = nmd.with_values(nmd.values ** q).mean()
+            return m.reshape(x.shape), n.reshape(x.shape)
+
+        flatten = x.array.ravel()
+        if x.mtype == 'ivfn':
+            md = np.array([e.md for e in flatten], dtype=np.float64).reshape(-1, 2)
+            nmd = np.array([e.nmd for e in flatten], dtype=np.float64).reshape(-1, 2)
+            m, n = (md ** q).mean(axis=-1), (nmd ** q).mean(axis=-1)
+        elif x.mtype == 'qrohfn':
+            def __ragged(degrees):
+                lengths = np.fromiter((len(d) for d in degrees), dtype=np.int64, count=len(degrees))
+                values = np.concatenate([np.asarray(d, dtype=np.float64).ravel() for d in degrees] + [np.empty(0)])
+                segments = np.repeat(np.arange(len(degrees)), lengths)
+                sums = np.bincount(segments, weights=values ** q, minlength=len(degrees))
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    return sums / lengths
+
+            m = __ragged([e.md for e in flatten])
+            n = __ragged([e.nmd for e in flatten])
+        else:
+            m = np.fromiter((e.md for e in flatten), dtype=np.float64, count=flatten.size) ** q
+            n = np.fromiter((e.nmd for e in flatten), dtype=np.float64, count=flatten.size) ** q
+        return m.reshape(x.shape), n.reshape(x.shape)
+
+
 class Score(Attribute):
     def function(self, x):
         if isinstance(x, Fuzznum):
@@ -84,8 +131,8 @@ class Score(Attribute):
                     nn = ((x.nmd ** x.qrung).sum()) / len(x.nmd)
                     return mm - nn
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = MeanPower()(x)
+            return m - n
 
 
 class Accuracy(Attribute):
@@ -105,8 +152,8 @@ class Accuracy(Attribute):
                     nn = ((x.nmd ** x.qrung).sum()) / len(x.nmd)
                     return mm + nn
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = MeanPower()(x)
+            return m + n
 
 
 class Indeterminacy(Attribute):
@@ -121,7 +168,7 @@ class Indeterminacy(Attribute):
             if x.mtype == 'ivfn':
                 m = x.md[0] ** x.qrung + x.md[1] ** x.qrung
                 n = x.nmd[0] ** x.qrung + x.nmd[1] ** x.qrung
-                if m + n:
+                if (m + n) / 2 == 1.:
                     return np.round(0., Approx.round)
                 else:
                     return (1. - (m + n) / 2) ** (1. / x.qrung)
@@ -136,8 +183,10 @@ class Indeterminacy(Attribute):
                     else:
                         return (1. - mm - nn) ** (1. / x.qrung)
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = MeanPower()(x)
+            acc = m + n
+            with np.errstate(invalid='ignore'):
+                return np.where(acc == 1., 0., (1. - acc) ** (1. / x.qrung))
 
 
 class Complement(Attribute):
@@ -166,5 +215,21 @@ class Complement(Attribute):
                     newfn.nmd = x.md
                 return newfn
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            newset = Fuzzarray(x.qrung)
+            columns = x.columns
+            if columns is not None:
+                newset.mtype = x.mtype
+                newset.columns = columns[1], columns[0]
+            elif x.ragged is not None:
+                # If one side is empty, the other side is complemented, otherwise
+                # the two sides are swapped.
+                md, nmd = x.ragged
+                a = (md.lengths == 0) & (nmd.lengths != 0)
+                b = (md.lengths != 0) & (nmd.lengths == 0)
+                newset.mtype = x.mtype
+                newset.ragged = (Ragged.choose(a, md, Ragged.choose(b, md.with_values(1. - md.values), nmd)),
+                                 Ragged.choose(a, nmd.with_values(1. - nmd.values), Ragged.choose(b, nmd, md)),
+                                 x.shape)
+            else:
+                newset.array = np.vectorize(Complement())(x.array)
+            return newset
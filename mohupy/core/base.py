@@ -72,3 +72,13 @@ class Construct:
 
 
 FuzzType = {'qrofn', 'ivfn', 'qrohfn'}
+
+# Fuzzy types whose Fuzzarray is stored column by column instead of as an object array.
+ColumnarType = {'qrofn', 'ivfn'}
+
+# The trailing shape of the degree columns of every columnar fuzzy type, the
+# interval-valued degrees keep their (lower, upper) bounds in a last axis.
+ColumnarShape = {'qrofn': (), 'ivfn': (2,)}
+
+# Fuzzy types whose Fuzzarray is stored as ragged (CSR) degree buffers instead of as an object array.
+RaggedType = {'qrohfn'}
@@ -34,6 +34,7 @@ ONE_16 = np.float_(1 - 1e-16)
 
 class Approx:
     round = 6
+    tolerance = 0.
 
     ZERO_1 = ZERO_1
     ZERO_2 = ZERO_2
@@ -12,7 +12,8 @@ import numpy as np
 from .fuzznums import Fuzznum
 from .fuzzarray import Fuzzarray
 
-from .base import Construct
+from .base import Construct, ColumnarType
+from .constant import Approx
 
 
 class FuzzNum(Construct):
@@ -45,7 +46,7 @@ class FuzzSet(Construct):
         if isinstance(x, Union[list, tuple, np.ndarray]):
             y = np.asarray(x, dtype=object)
 
-            t = np.random.choice(y)
+            t = y.ravel()[0]
             qrung = t.qrung
 
             def checkdata(data: Fuzznum):
@@ -91,9 +92,82 @@ class FuzzSet(Construct):
         # raise TypeError(f'Unsupported type: {type(x)}.')
 
 
+class FuzzSetArrays(Construct):
+    """
+        Build a fuzzy array directly from the arrays of membership and
+        non-membership degrees, without creating a 'Fuzznum' for every element.
+        The domain of the degrees and the constraint md^q + nmd^q <= 1 are
+        checked with one vectorized mask over the whole arrays, and all the
+        offending indices are reported at once.
+
+        For 'ivfn', the last axis of md and nmd holds the (lower, upper) bounds.
+    """
+
+    def function(self, md, nmd, qrung, mtype):
+        from ..config import Config
+        mtype = Config.mtype if mtype is None else mtype
+        assert qrung is not None and qrung > 0, f'Qrung must be greater than 0, qrung:{qrung}.'
+        if mtype not in ColumnarType:
+            raise TypeError(f'Unsupported fuzzy type for array construction: {mtype}.')
+
+        md = np.asarray(md, dtype=np.float64)
+        nmd = np.asarray(nmd, dtype=np.float64)
+        assert md.shape == nmd.shape, f'md and nmd shapes do not match({md.shape} and {nmd.shape}).'
+
+        with np.errstate(invalid='ignore'):
+            valid = (0. <= md) & (md <= 1.) & (0. <= nmd) & (nmd <= 1.) & (md ** qrung + nmd ** qrung <= 1.)
+        if mtype == 'ivfn':
+            assert md.ndim >= 1 and md.shape[-1] == 2, \
+                f'The last axis of ivfn degrees must hold the lower and upper bounds, shape:{md.shape}.'
+            valid = np.all(valid, axis=-1) & (md[..., 0] <= md[..., 1]) & (nmd[..., 0] <= nmd[..., 1])
+
+        if not np.all(valid):
+            bad = np.argwhere(~valid)
+            index = [tuple(int(i) for i in b) for b in bad[:10]]
+            rule = '0 <= md, nmd <= 1 and md ** qrung + nmd ** qrung <= 1'
+            if mtype == 'ivfn':
+                rule += ' for both bounds, and lower <= upper'
+            raise ValueError(f'ERROR: {len(bad)} elements are invalid fuzzy numbers of {mtype} with qrung {qrung} '
+                             f'({rule}), at indices {index}{" ..." if len(bad) > 10 else ""}.')
+
+        md = np.round(md, Approx.round)
+        nmd = np.round(nmd, Approx.round)
+
+        newset = Fuzzarray(qrung)
+        newset.mtype = mtype
+        newset.columns = md, nmd
+        return newset
+
+
 def fuzznum(qrung=None, md=None, nmd=None) -> Fuzznum:
     return FuzzNum()(qrung, md, nmd)
 
 
 def fuzzset(x=None) -> Fuzzarray:
     return FuzzSet()(x)
+
+
+def from_arrays(md, nmd, qrung, mtype=None) -> Fuzzarray:
+    """
+        Build a fuzzy array from the arrays of membership and non-membership
+        degrees, also available as 'fuzzset.from_arrays'.
+
+        Parameters
+        ----------
+            md : array_like
+                The membership degrees. For 'ivfn' the last axis is (lower, upper).
+            nmd : array_like
+                The non-membership degrees, of the same shape as md.
+            qrung : int
+                The q-rung of the fuzzy numbers.
+            mtype : str or None
+                The fuzzy type, 'qrofn' or 'ivfn'. None uses 'Config.mtype'.
+
+        Examples
+        --------
+            In [1]: fuzzset.from_arrays(np.array([0.5, 0.6]), np.array([0.3, 0.2]), 2, 'qrofn')
+    """
+    return FuzzSetArrays()(md, nmd, qrung, mtype)
+
+
+fuzzset.from_arrays = from_arrays
@@ -147,6 +147,23 @@ class FuzzValidity(Function):
         if isinstance(x, Fuzzarray):
             if x.size == 0:
                 return True
+            if x.ragged is not None:
+                # An element with an empty side is valid, otherwise the
+                # largest degrees must satisfy the q-rung constraint.
+                md, nmd = x.ragged
+                empty = (md.lengths == 0) | (nmd.lengths == 0)
+                with np.errstate(invalid='ignore'):
+                    valid = (md.min() >= 0.) & (nmd.min() >= 0.) & \
+                            (md.max() ** x.qrung + nmd.max() ** x.qrung <= 1.)
+                return (empty | valid).reshape(x.shape)
+            if x.columns is not None:
+                md, nmd = x.columns
+                valid = (0. <= md) & (md <= 1.) & (0. <= nmd) & (nmd <= 1.) & \
+                        (md ** x.qrung + nmd ** x.qrung <= 1.)
+                if x.mtype == 'ivfn':
+                    # 区间的下界不大于上界
+                    return np.all(valid, axis=-1) & (md[..., 0] <= md[..., 1]) & (nmd[..., 0] <= nmd[..., 1])
+                return valid
             vec_func = np.vectorize(lambda u: FuzzValidity()(u))
             return vec_func(x.array)
 
@@ -236,6 +253,12 @@ class FuzzQsort(Function):
             else:
                 return x
         if isinstance(x, Fuzzarray):
+            if x.ragged is not None:
+                md, nmd = x.ragged
+                newset = Fuzzarray(x.qrung)
+                newset.mtype = x.mtype
+                newset.ragged = md.sort(not self.reverse), nmd.sort(not self.reverse), x.shape
+                return newset
             vec_func = np.vectorize(lambda u: FuzzQsort(self.reverse)(u))
             newset = Fuzzarray(x.qrung)
             newset.array = vec_func(x.array)
@@ -260,6 +283,12 @@ class FuzzUnique(Function):
             else:
                 return x
         if isinstance(x, Fuzzarray):
+            if self.onlyfn and x.ragged is not None:
+                md, nmd = x.ragged
+                newset = Fuzzarray(x.qrung)
+                newset.mtype = x.mtype
+                newset.ragged = md.unique(), nmd.unique(), x.shape
+                return newset
             if self.onlyfn:
                 vec_func = np.vectorize(lambda u: FuzzUnique(self.onlyfn)(u))
                 newset = Fuzzarray(x.qrung)
@@ -272,18 +301,24 @@ class FuzzUnique(Function):
                 return newset
 
 
+class FuzzIndex(Function):
+    """
+        The flat element indices of a fuzzy array, arranged in its shape.
+        Structural methods (transpose, reshape, squeeze, etc.) are applied to
+        the indices and the elements are then gathered with 'Fuzzarray.take',
+        so that columnar arrays never create their element objects.
+    """
+
+    def function(self, x):
+        return np.arange(x.size).reshape(x.shape)
+
+
 class FuzzTranspose(Function):
     def function(self, x):
         if isinstance(x, Fuzznum):
             return copy.copy(x)
         if isinstance(x, Fuzzarray):
-            st = x.array
-            s = st.T
-
-            newset = Fuzzarray(x.qrung)
-            newset.array = s
-            del st, s
-            return newset
+            return x.take(FuzzIndex()(x).T)
 
 
 class FuzzAppend(Function):
@@ -382,9 +417,7 @@ class FuzzReshape(Function):
             newset.array = np.reshape(x, *self.shape)
             return newset
         if isinstance(x, Fuzzarray):
-            newset = Fuzzarray(x.qrung)
-            newset.array = x.array.reshape(*self.shape)
-            return newset
+            return x.take(FuzzIndex()(x).reshape(*self.shape))
 
 
 class FuzzSqueeze(Function):
@@ -396,9 +429,7 @@ class FuzzSqueeze(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
-            newset = Fuzzarray(x.qrung)
-            newset.array = np.squeeze(x.array, self.axis)
-            return newset
+            return x.take(np.squeeze(FuzzIndex()(x), self.axis))
 
 
 class FuzzBroadcast(Function):
@@ -412,9 +443,7 @@ class FuzzBroadcast(Function):
             newset.array = np.broadcast_to(x, self.shape)
             return newset
         if isinstance(x, Fuzzarray):
-            newset = Fuzzarray(x.qrung)
-            newset.array = np.broadcast_to(x.array, self.shape)
-            return newset
+            return x.take(np.broadcast_to(FuzzIndex()(x), self.shape))
 
 
 class FuzzClear(Function):
@@ -437,9 +466,7 @@ class FuzzRavel(Function):
             newset.array = np.ravel(x)
             return newset
         if isinstance(x, Fuzzarray):
-            newset = Fuzzarray(x.qrung)
-            newset.array = np.ravel(x.array)
-            return newset
+            return x.take(np.ravel(FuzzIndex()(x)))
 
 
 class FuzzFlatten(Function):
@@ -449,9 +476,7 @@ class FuzzFlatten(Function):
             newset.array = np.array([x])
             return newset
         if isinstance(x, Fuzzarray):
-            newset = Fuzzarray(x.qrung)
-            newset.array = x.array.flatten()
-            return newset
+            return x.take(FuzzIndex()(x).flatten())
 
 
 class FuzzGetMax(Function):
@@ -566,6 +591,33 @@ class FuzzGetFmin(Function):
                     return newset
 
 
+class FuzzReduce(Function):
+    """
+        Reduction of a columnar fuzzy array along the axis. The md/nmd columns
+        are accumulated at once in the generator space of the current
+        Archimedean norm (see 'Reducer') instead of folding the elements
+        pairwise. The mean is the sum with the accumulator scaled by 1/n.
+
+        Returns None if the fuzzy array is not columnar or the norm has no
+        reduction for the fuzzy type.
+    """
+
+    def __init__(self, op, axis, keepdims):
+        self.op = op
+        self.axis = axis
+        self.keepdims = keepdims
+
+    def function(self, x):
+        from .operationLib import archimedeanDict
+        from .reducer import Reducer
+        norm = archimedeanDict[Config.arch]
+        if x.columns is None or x.size == 0:
+            return None
+        if 'accum' not in norm or x.mtype not in norm['accum']:
+            return None
+        return Reducer(self.op, self.axis, self.keepdims).update(x).result()
+
+
 class FuzzGetSum(Function):
 
     def __init__(self, axis, keepdims):
@@ -576,6 +628,9 @@ class FuzzGetSum(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            s = FuzzReduce('sum', self.axis, self.keepdims)(x)
+            if s is not None:
+                return s
             if self.axis is None:
                 return np.sum(x.array)
             else:
@@ -598,6 +653,9 @@ class FuzzGetProd(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            s = FuzzReduce('prod', self.axis, self.keepdims)(x)
+            if s is not None:
+                return s
             if self.axis is None:
                 return np.prod(x.array)
             else:
@@ -612,17 +670,21 @@ class FuzzGetProd(Function):
 
 class FuzzMean(Function):
 
-    def __init__(self, axis):
+    def __init__(self, axis, keepdims=False):
         self.axis = axis
+        self.keepdims = keepdims
 
     def function(self, x):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            s = FuzzReduce('mean', self.axis, self.keepdims)(x)
+            if s is not None:
+                return s
             if self.axis is None:
                 return np.mean(x.array)
             else:
-                s = np.mean(x.array, axis=self.axis)
+                s = np.mean(x.array, axis=self.axis, keepdims=self.keepdims)
                 if isinstance(s, Fuzznum):
                     return s
                 if isinstance(s, np.ndarray):
@@ -666,42 +728,79 @@ class FuzzNormalize(Function):
             md_len = len(d_1.md) - len(d_2.md)
             nmd_len = len(d_1.nmd) - len(d_2.nmd)
 
+            # The shorter hesitant set is extended with 'md_len' (or 'nmd_len')
+            # copies of its adjusted value at once.
             if md_len > 0:
-                # Explain that the number of membership elements in d1 is greater than d2,
-                # and it is necessary to add elements of d2 membership.
-                i = 0.
-                m = d_2.md
-                while i < md_len:
-                    d_2.md = np.append(d_2.md, __adj(m, self.tao))
-                    i += 1
-            else:
-                # Explain that the number of membership elements in d1 is less than d2,
-                # and it is necessary to increase the elements of d1 membership.
-                i = 0.
-                m = d_1.md
-                while i < (-md_len):
-                    d_1.md = np.append(d_1.md, __adj(m, self.tao))
-                    i += 1
+                d_2.md = np.append(d_2.md, np.full(md_len, __adj(d_2.md, self.tao)))
+            elif md_len < 0:
+                d_1.md = np.append(d_1.md, np.full(-md_len, __adj(d_1.md, self.tao)))
 
             if nmd_len > 0:
-                # Explain that the number of membership elements in d1 is greater than d2,
-                # and it is necessary to add elements of d2 membership.
-                i = 0.
-                u = d_2.nmd
-                while i < nmd_len:
-                    d_2.nmd = np.append(d_2.nmd, __adj(u, self.tao))
-                    i += 1
-            else:
-                i = 0.
-                u = d_1.nmd
-                while i < (-nmd_len):
-                    d_1.nmd = np.append(d_1.nmd, __adj(u, self.tao))
-                    i += 1
+                d_2.nmd = np.append(d_2.nmd, np.full(nmd_len, __adj(d_2.nmd, self.tao)))
+            elif nmd_len < 0:
+                d_1.nmd = np.append(d_1.nmd, np.full(-nmd_len, __adj(d_1.nmd, self.tao)))
             return d_1.qsort(), d_2.qsort()
         else:
             raise TypeError(f'Unsupported fuzzy type, {d1.mtype} and {d2.mtype}')
 
 
+class FuzzNormalizeArray(Function):
+
+    def __init__(self, tao, length=None):
+        self.tao = tao
+        self.length = length
+
+    def function(self, x):
+        """
+            Batch normalization of a fuzzy array of q-rung orthopair hesitant fuzzy
+                numbers. The hesitant degrees of every element are padded to a common
+                length with the same rule as 'FuzzNormalize', that is, with the value
+                't * max + (1 - t) * min' of the element, and sorted in descending
+                order, so that all the elements are normalized in one pass into dense
+                matrices.
+
+            Parameters
+            ----------
+                x : Fuzzarray
+                    The q-rung orthopair hesitant fuzzy array.
+                self.tao : float
+                    The risk factor of normalization in [0, 1]. 't=1' indicates
+                    optimistic normalization and 't=0' indicates pessimistic normalization.
+                self.length : int, array_like or None
+                    The length of the normalized elements, the longest element by
+                    default. An array of the shape of x gives a length per element,
+                    and the entries of a row beyond its length are NaN (so that two
+                    fuzzy arrays are normalized pair by pair as 'FuzzNormalize').
+                    A tuple (md_length, nmd_length) gives the lengths of the two sides.
+
+            Returns
+            -------
+                (np.ndarray, np.ndarray)
+                    The normalized membership and non-membership degrees, of shape
+                    x.shape + (L,). The rows of empty hesitant sides are NaN.
+        """
+        assert 0. <= self.tao <= 1., "risk factor 't' must be in [0,1] range."
+        assert isinstance(x, Fuzzarray) and x.ragged is not None, \
+            f'Only the hesitant fuzzy array can be normalized, mtype:{x.mtype}.'
+
+        def __pad(d, length):
+            lengths = d.lengths
+            length = np.full(x.size, lengths.max(initial=0)) if length is None else \
+                np.broadcast_to(np.asarray(length, dtype=np.int64), x.shape).ravel()
+            assert np.all(length >= lengths), 'The normalized length is shorter than the elements.'
+            width = int(np.max(length, initial=0))
+            adj = self.tao * d.max() + (1. - self.tao) * d.min()
+            m = d.dense(width, adj)
+            m[np.arange(width)[None, :] >= length[:, None]] = np.nan
+            # 降序排列，NaN 排在每一行的末尾
+            return -np.sort(-m, axis=-1)
+
+        md, nmd = x.ragged
+        md_len, nmd_len = self.length if isinstance(self.length, tuple) else (self.length, self.length)
+        m, n = __pad(md, md_len), __pad(nmd, nmd_len)
+        return m.reshape(x.shape + m.shape[-1:]), n.reshape(x.shape + n.shape[-1:])
+
+
 # TODO：待实现
 class FuzzAbsolute(Function):
     def function(self, x, y):
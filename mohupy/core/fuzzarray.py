@@ -7,12 +7,29 @@
 
 import numpy as np
 
-from .base import MohuBase
+from .base import MohuBase, ColumnarType, ColumnarShape, RaggedType
+from .fuzznums import Fuzznum
+from .constant import Approx
+from .ragged import Ragged
 
 
 class Fuzzarray(MohuBase):
+    """
+        Fuzzy array. Fuzzy types listed in 'ColumnarType' are stored column by
+        column, that is, the membership and non-membership degrees of all
+        elements are kept in two contiguous float64 arrays of the same shape as
+        the fuzzy array, followed by the trailing shape of 'ColumnarShape' (the
+        (lower, upper) bounds of the interval-valued degrees). The element
+        'Fuzznum' objects are only created when they are pulled out of the
+        array (see 'array' and 'take').
+
+        Fuzzy types listed in 'RaggedType' (hesitant fuzzy numbers) are stored
+        as two 'Ragged' arrays, that is, the hesitant degrees of all elements
+        are kept in one flat buffer with the offsets of every element.
+
+        Other fuzzy types are stored as an object array of 'Fuzznum'.
+    """
     __array_priority__ = 200
-    __array = np.array([], dtype=object)
 
     def __init__(self, qrung=None):
         super().__init__()
@@ -20,92 +37,336 @@ class Fuzzarray(MohuBase):
         self.size = 0
         self.shape = ()
 
+        self.__array = np.array([], dtype=object)
+        self.__md = None
+        self.__nmd = None
+        self.__ragged = None
+        self.__cache = {}
+        self.pruning = None
+
         from .funcitonClass import InitializeSet
         self.qrung, self.mtype = InitializeSet()(qrung)
 
     def __len__(self):
-        return len(self.__array)
+        if self.ndim == 0:
+            raise TypeError('len() of unsized object')
+        return self.shape[0]
 
     @property
     def array(self):
+        """
+            The object array of the elements. For columnar storage, the array
+            is assembled from the columns on every access, so modifying it in
+            place does not modify the fuzzy array.
+        """
+        if self.__md is not None:
+            array = np.empty(self.shape, dtype=object)
+            flat = array.reshape(-1)
+            md, nmd = self.__flat_columns()
+            for i in range(self.size):
+                flat[i] = self.__element(md[i], nmd[i])
+            return array
+        if self.__ragged is not None:
+            array = np.empty(self.shape, dtype=object)
+            flat = array.reshape(-1)
+            for i, (md, nmd) in enumerate(zip(self.__ragged[0].tolist(), self.__ragged[1].tolist())):
+                flat[i] = self.__element(md.copy(), nmd.copy())
+            return array
         return self.__array
 
     @array.setter
     def array(self, value: np.ndarray):
-        from .fuzznums import Fuzznum
-        if isinstance(np.all(value), Fuzznum):
-            try:
+        if isinstance(value, Fuzznum):
+            if value.mtype in ColumnarType | RaggedType and value.md is not None:
+                e, value = value, np.empty((), dtype=object)
+                value[()] = e
+            else:
                 self.__array = value
-                self.ndim = value.ndim
-                self.size = value.size
-                self.shape = value.shape
-
-                flatten = value.flatten()
-                e = np.random.choice(flatten)
-
-                self.qrung = e.qrung
-                self.mtype = e.mtype
-            except ValueError as e:
-                raise ValueError(f'Setup failed: {e}')
-        elif value.size == 0:
+                self.__md, self.__nmd = None, None
+                self.__ragged = None
+                self.__cache = {}
+                self.ndim, self.size, self.shape = value.ndim, value.size, value.shape
+                self.qrung, self.mtype = value.qrung, value.mtype
+                return
+        if not isinstance(value, np.ndarray):
+            raise TypeError(f"Invalid fuzzy type.")
+        if value.size == 0:
             self.__array = np.array([], dtype=object)
+            self.__md, self.__nmd = None, None
+            self.__ragged = None
+            self.__cache = {}
             self.ndim = value.ndim
             self.size = value.size
             self.shape = value.shape
-        else:
+            return
+
+        flatten = value.ravel()
+        if not all(isinstance(e, Fuzznum) for e in flatten):
             raise TypeError(f"Invalid fuzzy type.")
 
+        e = flatten[0]
+        self.qrung = e.qrung
+        self.mtype = e.mtype
+        if e.mtype in ColumnarType and \
+                all(t.mtype == e.mtype and t.qrung == e.qrung and t.md is not None for t in flatten):
+            trail = ColumnarShape[e.mtype]
+            if trail:
+                md = np.array([t.md for t in flatten], dtype=np.float64)
+                nmd = np.array([t.nmd for t in flatten], dtype=np.float64)
+            else:
+                md = np.fromiter((t.md for t in flatten), dtype=np.float64, count=flatten.size)
+                nmd = np.fromiter((t.nmd for t in flatten), dtype=np.float64, count=flatten.size)
+            self.columns = md.reshape(value.shape + trail), nmd.reshape(value.shape + trail)
+        elif e.mtype in RaggedType and \
+                all(t.mtype == e.mtype and t.qrung == e.qrung and t.md is not None for t in flatten):
+            self.__set_ragged(Ragged.from_sequences([t.md for t in flatten]),
+                              Ragged.from_sequences([t.nmd for t in flatten]), value.shape)
+        else:
+            self.__array = value
+            self.__md, self.__nmd = None, None
+            self.__ragged = None
+            self.__cache = {}
+            self.ndim = value.ndim
+            self.size = value.size
+            self.shape = value.shape
+
+    @property
+    def columns(self):
+        """
+            The membership and non-membership degree columns (md, nmd) of a
+            columnar fuzzy array, or None if the elements are stored as objects.
+            The columns are read-only views, assign to 'columns' (or 'md' and
+            'nmd') to write the degrees, so that the cached attributes are
+            invalidated.
+        """
+        if self.__md is None:
+            return None
+        return self.__degrees('md'), self.__degrees('nmd')
+
+    @columns.setter
+    def columns(self, value):
+        md, nmd = value
+        assert self.mtype in ColumnarType, f'Columnar storage is not supported for mtype:{self.mtype}.'
+        md = np.asarray(md, dtype=np.float64)
+        nmd = np.asarray(nmd, dtype=np.float64)
+        assert md.shape == nmd.shape, f'md and nmd shapes do not match({md.shape} and {nmd.shape}).'
+        trail = ColumnarShape[self.mtype]
+        assert md.shape[md.ndim - len(trail):] == trail, \
+            f'The degree columns of mtype:{self.mtype} must end with the shape {trail}, got {md.shape}.'
+        self.__md, self.__nmd = md, nmd
+        self.__ragged = None
+        self.__array = np.array([], dtype=object)
+        self.__cache = {}
+        self.shape = md.shape[:md.ndim - len(trail)]
+        self.ndim = len(self.shape)
+        self.size = int(np.prod(self.shape))
+
+    def __flat_columns(self):
+        """
+            The degree columns with the element axes flattened.
+        """
+        trail = ColumnarShape[self.mtype]
+        return self.__md.reshape((-1,) + trail), self.__nmd.reshape((-1,) + trail)
+
+    @property
+    def ragged(self):
+        """
+            The ragged membership and non-membership degrees (md, nmd) of a
+            hesitant fuzzy array in flat order, or None if the elements are
+            not stored as ragged buffers.
+        """
+        return self.__ragged
+
+    @ragged.setter
+    def ragged(self, value):
+        """
+            Set the ragged degrees as (md, nmd) for a 1-D fuzzy array, or as
+            (md, nmd, shape).
+        """
+        md, nmd = value[0], value[1]
+        shape = tuple(value[2]) if len(value) > 2 else (len(md),)
+        self.__set_ragged(md, nmd, shape)
+
+    def __set_ragged(self, md, nmd, shape):
+        assert self.mtype in RaggedType, f'Ragged storage is not supported for mtype:{self.mtype}.'
+        assert isinstance(md, Ragged) and isinstance(nmd, Ragged), 'The ragged degrees must be Ragged arrays.'
+        assert len(md) == len(nmd) == int(np.prod(shape)), \
+            f'The ragged degrees do not match the shape {shape}({len(md)} and {len(nmd)}).'
+        self.__ragged = md, nmd
+        self.__md, self.__nmd = None, None
+        self.__array = np.array([], dtype=object)
+        self.__cache = {}
+        self.ndim = len(shape)
+        self.size = len(md)
+        self.shape = shape
+
+    def take(self, indices):
+        """
+            Take elements by flat indices, just like 'np.take' with 'axis=None'.
+            A scalar index returns a 'Fuzznum', an index array returns a
+            'Fuzzarray' of the same shape as the index array.
+        """
+        indices = np.asarray(indices)
+        if self.__ragged is not None:
+            md, nmd = self.__ragged[0].take(indices), self.__ragged[1].take(indices)
+            if indices.ndim == 0:
+                return self.__element(md.values, nmd.values)
+            newset = Fuzzarray(self.qrung)
+            newset.mtype = self.mtype
+            newset.__set_ragged(md, nmd, indices.shape)
+            return newset
+        if self.__md is None:
+            y = self.__array.reshape(-1)[indices] if isinstance(self.__array, np.ndarray) else self.__array
+            if indices.ndim == 0:
+                return y
+            newset = Fuzzarray(self.qrung)
+            newset.array = y
+            return newset
+
+        md, nmd = self.__flat_columns()
+        md, nmd = md[indices], nmd[indices]
+        if indices.ndim == 0:
+            return self.__element(md, nmd)
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.columns = md, nmd
+        return newset
+
+    def __element(self, md, nmd):
+        newfn = Fuzznum()
+        newfn.mtype = self.mtype
+        newfn.qrung = self.qrung
+        if self.mtype in RaggedType:
+            newfn.md, newfn.nmd = md, nmd
+        elif ColumnarShape[self.mtype]:
+            newfn.md, newfn.nmd = np.array(md, dtype=np.float64), np.array(nmd, dtype=np.float64)
+        else:
+            newfn.md = np.float_(md)
+            newfn.nmd = np.float_(nmd)
+        newfn.size = 1
+        return newfn
+
+    def __cached(self, name, func):
+        """
+            Attributes of the columnar or ragged storage computed from the
+            degree buffers and cached until the buffers are replaced. The cached
+            arrays are read-only. Object arrays are not cached, since their
+            'Fuzznum' elements may be modified in place.
+        """
+        if self.__md is None and self.__ragged is None:
+            return func(self)
+        key = (name, self.qrung, self.mtype)
+        if key not in self.__cache:
+            value = np.asarray(func(self))
+            value.flags.writeable = False
+            self.__cache[key] = value
+        return self.__cache[key]
+
     @property
     def score(self):
         from .attributeClass import Score
-        vec_func = np.vectorize(Score())
-        return vec_func(self.__array)
+        return self.__cached('score', Score())
 
     @property
     def acc(self):
         from .attributeClass import Accuracy
-        vec_func = np.vectorize(Accuracy())
-        return vec_func(self.__array)
+        return self.__cached('acc', Accuracy())
 
     @property
     def ind(self):
         from .attributeClass import Indeterminacy
-        vec_func = np.vectorize(Indeterminacy())
-        return vec_func(self.__array)
+        return self.__cached('ind', Indeterminacy())
 
     @property
     def comp(self) -> 'Fuzzarray':
         from .attributeClass import Complement
-        vec_func = np.vectorize(Complement())
-        newset = Fuzzarray(self.qrung)
-        newset.array = vec_func(self.__array)
-        return newset
+        return Complement()(self)
+
+    def __degrees(self, name):
+        if self.__md is not None:
+            view = (self.__md if name == 'md' else self.__nmd).view()
+            view.flags.writeable = False
+            return view
+        if self.__ragged is not None:
+            degrees = np.empty(self.size, dtype=object)
+            for i, d in enumerate(self.__ragged[0 if name == 'md' else 1].tolist()):
+                d.flags.writeable = False
+                degrees[i] = d
+            return degrees.reshape(self.shape)
+        if self.__array.size == 0:
+            return None
+        flatten = self.__array.ravel() if isinstance(self.__array, np.ndarray) \
+            else np.array([self.__array], dtype=object)
+        if self.mtype == 'qrohfn':
+            degrees = np.empty(flatten.size, dtype=object)
+            for i, t in enumerate(flatten):
+                degrees[i] = np.asarray(getattr(t, name), dtype=np.float64)
+            return degrees.reshape(self.shape)
+        degrees = np.array([getattr(t, name) for t in flatten], dtype=np.float64)
+        return degrees.reshape(self.shape + degrees.shape[1:])
+
+    def __write_degrees(self, name, value):
+        if self.__md is not None:
+            value = np.round(np.array(value, dtype=np.float64), Approx.round)
+            assert value.shape == self.__md.shape, \
+                f'The shape of {name} must be {self.__md.shape}, got {value.shape}.'
+            md, nmd = (value, self.__nmd) if name == 'md' else (self.__md, value)
+            assert np.all((0. <= value) & (value <= 1.)), \
+                f'ERROR: {name} must be between ZERO and ONE.'
+            assert np.all(md ** self.qrung + nmd ** self.qrung <= 1.), \
+                'ERROR: md ** qrung + nmd ** qrung must be between ZERO and ONE.'
+            if self.mtype == 'ivfn':
+                assert np.all(value[..., 0] <= value[..., 1]), \
+                    f'ERROR: The upper of {name} must be greater than the lower.'
+            self.columns = md, nmd
+            return
+        if self.__ragged is not None:
+            value = np.asarray(value, dtype=object)
+            assert value.shape == self.shape, f'The shape of {name} must be {self.shape}, got {value.shape}.'
+            degrees = Ragged.from_sequences(value.ravel())
+            degrees = degrees.with_values(np.round(degrees.values, Approx.round))
+            assert np.all((0. <= degrees.values) & (degrees.values <= 1.)), \
+                f'ERROR: {name} must be between ZERO and ONE.'
+            md, nmd = (degrees, self.__ragged[1]) if name == 'md' else (self.__ragged[0], degrees)
+            self.__set_ragged(md, nmd, self.shape)
+            return
+
+        value = np.asarray(value)
+        assert value.shape[:self.ndim] == self.shape, \
+            f'The shape of {name} must start with {self.shape}, got {value.shape}.'
+        flatten = self.__array.ravel() if isinstance(self.__array, np.ndarray) \
+            else np.array([self.__array], dtype=object)
+        for t, v in zip(flatten, value.reshape((self.size,) + value.shape[self.ndim:])):
+            setattr(t, name, np.round(np.asarray(v, dtype=np.float64), Approx.round))
+        self.__cache = {}
 
     @property
     def md(self):
-        if self.__array.size != 0:
-            def membership(t):
-                if isinstance(t.md, (int, float, np.float_, np.int_)):
-                    return np.float_(t.md)
-                if isinstance(t.md, (np.ndarray, list)):
-                    return np.array(t.md, dtype=object)
-
-            vec_func = np.vectorize(membership)
-            return vec_func(self.__array)
-        return None
+        """
+            The membership degrees as a float64 array, of the shape of the
+            fuzzy array for qrofn and with a trailing axis of the (lower, upper)
+            bounds for ivfn. For the columnar storage it is a read-only view of
+            the column without copying; assign to 'md' to write the degrees
+            back in bulk. Hesitant fuzzy arrays return an object array of the
+            hesitant membership degrees, which are read-only views of the
+            ragged buffer.
+        """
+        return self.__degrees('md')
+
+    @md.setter
+    def md(self, value):
+        self.__write_degrees('md', value)
 
     @property
     def nmd(self):
-        if self.__array.size != 0:
-            def membership(t):
-                if isinstance(t.nmd, (int, float, np.float_, np.int_)):
-                    return np.float_(t.nmd)
-                if isinstance(t.nmd, (np.ndarray, list)):
-                    return np.array(t.nmd, dtype=object)
+        """
+            The non-membership degrees, see 'md'.
+        """
+        return self.__degrees('nmd')
 
-            vec_func = np.vectorize(membership)
-            return vec_func(self.__array)
-        return None
+    @nmd.setter
+    def nmd(self, value):
+        self.__write_degrees('nmd', value)
 
     @property
     def T(self) -> 'Fuzzarray':
@@ -132,6 +393,10 @@ class Fuzzarray(MohuBase):
         from .funcitonClass import FuzzUnique
         return FuzzUnique(onlyfn)(self)
 
+    def normalize(self, tao=1., length=None):
+        from .funcitonClass import FuzzNormalizeArray
+        return FuzzNormalizeArray(tao, length)(self)
+
     def append(self, e):
         from .funcitonClass import FuzzAppend
         return FuzzAppend(e)(self)
@@ -172,9 +437,9 @@ class Fuzzarray(MohuBase):
         from .funcitonClass import FuzzGetProd
         return FuzzGetProd(axis, keepdims)(self)
 
-    def mean(self, axis=None):
+    def mean(self, axis=None, keepdims=False):
         from .funcitonClass import FuzzMean
-        return FuzzMean(axis)(self)
+        return FuzzMean(axis, keepdims)(self)
 
     def fmax(self, func, *params, show=False, axis=None):
         from .funcitonClass import FuzzGetFmax
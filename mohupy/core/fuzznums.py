@@ -17,6 +17,7 @@ class Fuzznum(MohuBase):
     ndim = 0
     size = 0
     shape = ()
+    pruning = None
 
     def __init__(self, qrung=None, md=None, nmd=None):
         if qrung is None or (md is None and nmd is None):
@@ -120,6 +121,6 @@ class Fuzznum(MohuBase):
         from .funcitonClass import FuzzGetProd
         return FuzzGetProd(axis, keepdims)(self)
 
-    def mean(self, axis=None):
+    def mean(self, axis=None, keepdims=False):
         from .funcitonClass import FuzzMean
-        return FuzzMean(axis)(self)
+        return FuzzMean(axis, keepdims)(self)
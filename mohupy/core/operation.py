@@ -7,10 +7,108 @@
 
 import numpy as np
 
-from .base import Operation
+from .base import Operation, ColumnarType, RaggedType
 from .fuzznums import Fuzznum
 from .fuzzarray import Fuzzarray
 from .operationClass import BasicOperation
+from .constant import Approx
+
+
+def columnar(*operands):
+    """
+        Whether the operation can be computed on whole md/nmd columns in one pass.
+        It requires at least one array operand (Fuzzarray or np.ndarray), every
+        Fuzzarray to be stored column by column and every Fuzznum to be of a
+        columnar fuzzy type. The fuzzy operands must have the same mtype and qrung.
+    """
+    fuzz = [t for t in operands if isinstance(t, (Fuzznum, Fuzzarray))]
+    if not any(isinstance(t, (Fuzzarray, np.ndarray)) for t in operands):
+        return False
+    for t in fuzz:
+        if isinstance(t, Fuzzarray) and t.columns is None:
+            return False
+        if isinstance(t, Fuzznum) and (t.mtype not in ColumnarType or t.md is None):
+            return False
+    for t in fuzz[1:]:
+        assert t.mtype == fuzz[0].mtype, f"mtype does not match('{fuzz[0].mtype}' and '{t.mtype}')."
+        assert t.qrung == fuzz[0].qrung, f"qrung does not match({fuzz[0].qrung} and {t.qrung})."
+    return True
+
+
+def ragged(x, p):
+    """
+        Whether the power or scalar multiplication of a hesitant fuzzy array
+        can be computed on its ragged degree buffers in one pass. It requires
+        x to be a ragged Fuzzarray and p to be a number or an array of the
+        shape of x.
+    """
+    return isinstance(x, Fuzzarray) and x.ragged is not None and \
+        isinstance(p, (int, float, np.float_, np.int_, np.ndarray)) and \
+        (np.ndim(p) == 0 or np.shape(p) == x.shape)
+
+
+def hesitant(x, y):
+    """
+        Whether the addition or multiplication of two hesitant fuzzy operands
+        can be batched over ragged degree buffers. It requires at least one
+        ragged Fuzzarray, and the other operand to be a ragged Fuzzarray or a
+        hesitant Fuzznum. The shapes of two fuzzy arrays must be broadcastable.
+    """
+    fuzz = (x, y)
+    if not all(isinstance(t, (Fuzznum, Fuzzarray)) for t in fuzz):
+        return False
+    if not any(isinstance(t, Fuzzarray) and t.ragged is not None for t in fuzz):
+        return False
+    for t in fuzz:
+        if isinstance(t, Fuzzarray) and t.ragged is None:
+            return False
+        if isinstance(t, Fuzznum) and (t.mtype not in RaggedType or t.md is None):
+            return False
+    assert x.mtype == y.mtype, f"mtype does not match('{x.mtype}' and '{y.mtype}')."
+    assert x.qrung == y.qrung, f"qrung does not match({x.qrung} and {y.qrung})."
+    return True
+
+
+def scores(x, y):
+    """
+        The scores of the two operands of a comparison. The mtype and qrung are
+        checked once for the whole operands, and a Fuzznum score is a scalar
+        that is broadcast against the score array of a Fuzzarray.
+    """
+    assert x.mtype == y.mtype, f"mtype does not match: ('{x.mtype}', '{y.mtype}')."
+    assert x.qrung == y.qrung, f"qrung does not match: ({x.qrung}, {y.qrung})."
+    return x.score, y.score
+
+
+def closeness(x, y):
+    """
+        Element-wise equality of the membership and non-membership degrees of
+        two fuzzy operands, within the tolerance 'Approx.tolerance'. Returns a
+        bool ndarray if either operand is a Fuzzarray.
+    """
+    assert x.mtype == y.mtype, f"mtype does not match: ('{x.mtype}', '{y.mtype}')."
+    assert x.qrung == y.qrung, f"qrung does not match: ({x.qrung}, {y.qrung})."
+
+    def __close(x0, x1):
+        md0, md1 = np.asarray(x0.md, dtype=np.float64), np.asarray(x1.md, dtype=np.float64)
+        nmd0, nmd1 = np.asarray(x0.nmd, dtype=np.float64), np.asarray(x1.nmd, dtype=np.float64)
+        if md0.shape != md1.shape or nmd0.shape != nmd1.shape:
+            return False
+        return bool(np.all(np.abs(md0 - md1) <= Approx.tolerance) and
+                    np.all(np.abs(nmd0 - nmd1) <= Approx.tolerance))
+
+    if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
+        return __close(x, y)
+    if x.mtype == 'qrohfn':
+        x0 = x.array if isinstance(x, Fuzzarray) else x
+        x1 = y.array if isinstance(y, Fuzzarray) else y
+        return np.vectorize(__close, otypes=[bool])(x0, x1)
+
+    close = (np.abs(np.subtract(x.md, y.md)) <= Approx.tolerance) & \
+            (np.abs(np.subtract(x.nmd, y.nmd)) <= Approx.tolerance)
+    if x.mtype == 'ivfn':
+        close = np.all(close, axis=-1)
+    return close
 
 
 class Addition(Operation):
@@ -29,6 +127,14 @@ class Addition(Operation):
             operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.add(x0, x1)
 
+        # 列存储的模糊集合，整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and columnar(x, y):
+            return BasicOperation(x.qrung, x.mtype).add(x, y)
+
+        # 不等长存储的犹豫模糊集合，在整个缓冲区上计算
+        if hesitant(x, y):
+            return BasicOperation(x.qrung, x.mtype).add(x, y)
+
         # 模糊数 + 模糊数
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __add(x, y)
@@ -76,6 +182,10 @@ class Subtraction(Operation):
             operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.sub(x0, x1)
 
+        # 列存储的模糊集合，整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and columnar(x, y):
+            return BasicOperation(x.qrung, x.mtype).sub(x, y)
+
         # 模糊数 - 模糊数
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __sub(x, y)
@@ -144,6 +254,28 @@ class Multiplication(Operation):
                 operation = BasicOperation(x1.qrung, x1.mtype)
                 return operation.times(x0, x1)
 
+        # 列存储的模糊集合，整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and columnar(x, y):
+            return BasicOperation(x.qrung, x.mtype).mul(x, y)
+        if isinstance(x, (Fuzznum, Fuzzarray)) and \
+                isinstance(y, (int, float, np.float_, np.int_, np.ndarray)) and columnar(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).times(y, x)
+        if isinstance(x, (int, float, np.float_, np.int_, np.ndarray)) and \
+                isinstance(y, (Fuzznum, Fuzzarray)) and columnar(x, y):
+            assert np.all(x > 0), f"value must be greater than 0: ({x} <= 0)."
+            return BasicOperation(y.qrung, y.mtype).times(x, y)
+
+        # 不等长存储的犹豫模糊集合，在整个缓冲区上计算
+        if hesitant(x, y):
+            return BasicOperation(x.qrung, x.mtype).mul(x, y)
+        if ragged(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).times(y, x)
+        if ragged(y, x):
+            assert np.all(x > 0), f"value must be greater than 0: ({x} <= 0)."
+            return BasicOperation(y.qrung, y.mtype).times(x, y)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __mul(x, y)
 
@@ -240,6 +372,19 @@ class Division(Operation):
                 operation = BasicOperation(x0.qrung, x0.mtype)
                 return operation.times((1 / x1), x0)
 
+        # 列存储的模糊集合，整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and columnar(x, y):
+            return BasicOperation(x.qrung, x.mtype).div(x, y)
+        if isinstance(x, (Fuzznum, Fuzzarray)) and \
+                isinstance(y, (int, float, np.float_, np.int_, np.ndarray)) and columnar(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).times((1 / y), x)
+
+        # 不等长存储的犹豫模糊集合，在整个缓冲区上计算
+        if ragged(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).times((1 / y), x)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __div(x, y)
 
@@ -306,6 +451,17 @@ class Power(Operation):
             operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.power(p, x0)
 
+        # 列存储的模糊集合，整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and \
+                isinstance(self.p, (int, float, np.float_, np.int_, np.ndarray)) and columnar(x, self.p):
+            assert np.all(self.p > 0), f"value must be greater than 0: ({self.p} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).power(self.p, x)
+
+        # 不等长存储的犹豫模糊集合，在整个缓冲区上计算
+        if ragged(x, self.p):
+            assert np.all(self.p > 0), f"value must be greater than 0: ({self.p} <= 0)."
+            return BasicOperation(x.qrung, x.mtype).power(self.p, x)
+
         if isinstance(x, Fuzznum) and isinstance(self.p, (int, float, np.float_, np.int_)):
             return __pow(x, self.p)
 
@@ -335,17 +491,30 @@ def pow(x, p):
 
 
 class MatrixMul(Operation):
-    def function(self, x: Fuzzarray, y: Fuzzarray):
+    def function(self, x: Fuzzarray, y: Fuzzarray, semiring=None):
+        """
+            The matrix product of two fuzzy arrays. The columnar fuzzy arrays
+            are multiplied on their md/nmd arrays under the semiring (see
+            'core.semiring'), the others element by element with the norm of
+            the configuration.
+        """
         assert x.ndim > 0, f"input operand 0 does not have enough dimensions."
         assert y.ndim > 0, f"input operand 1 does not have enough dimensions."
 
+        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray) and columnar(x, y):
+            from .semiring import fuzz_matmul
+            return fuzz_matmul(x, y, semiring)
+
+        from ..config import Config
+        assert semiring is None or semiring == Config.arch, \
+            f'The semiring \'{semiring}\' needs columnar fuzzy arrays.'
         newset = Fuzzarray(x.qrung)
         newset.array = x.array @ y.array
         return newset
 
 
-def matmul(x, y):
-    return MatrixMul()(x, y)
+def matmul(x, y, semiring=None):
+    return MatrixMul()(x, y, semiring)
 
 
 class Equal(Operation):
@@ -355,27 +524,13 @@ class Equal(Operation):
             2. 模糊数 == 模糊集合
             3. 模糊集合 == 模糊数
             4. 模糊集合 == 模糊集合
-        """
 
-        def __eq(x0, x1):
-            assert x0.mtype == x1.mtype, f"mtype does not match: ('{x0.mtype}', '{x1.mtype}')."
-            assert x0.qrung == x1.qrung, f"qrung does not match: ({x0.qrung}, {x1.qrung})."
-            return x0.md == x1.md and x0.nmd == x1.nmd
-
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
-            return __eq(x, y)
-
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__eq)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__eq)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__eq)
-            return vec_func(x.array, y.array)
+            The degrees are compared within the tolerance 'Approx.tolerance'
+            (see 'config.set_tolerance'), and comparisons with a fuzzy array
+            return a bool ndarray.
+        """
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return closeness(x, y)
 
         return NotImplemented
 
@@ -392,26 +547,8 @@ class Inequality(Operation):
             3. 模糊集合 != 模糊数
             4. 模糊集合 != 模糊集合
         """
-
-        def __ne(x0, x1):
-            assert x0.mtype == x1.mtype, f"mtype does not match: ('{x0.mtype}', '{x1.mtype}')."
-            assert x0.qrung == x1.qrung, f"qrung does not match: ({x0.qrung}, {x1.qrung})."
-            return x0.md != x1.md or x0.nmd != x1.nmd
-
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
-            return __ne(x, y)
-
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__ne)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__ne)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__ne)
-            return vec_func(x.array, y.array)
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return np.logical_not(closeness(x, y))
 
         return NotImplemented
 
@@ -445,17 +582,9 @@ class Lt(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __lt(x, y)
 
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__lt)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__lt)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__lt)
-            return vec_func(x.array, y.array)
+        # 模糊集合的比较，在得分数组上整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return np.less(*scores(x, y))
 
         return NotImplemented
 
@@ -489,17 +618,9 @@ class Gt(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __gt(x, y)
 
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__gt)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__gt)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__gt)
-            return vec_func(x.array, y.array)
+        # 模糊集合的比较，在得分数组上整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return np.greater(*scores(x, y))
 
         return NotImplemented
 
@@ -533,17 +654,9 @@ class Le(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __le(x, y)
 
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__le)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__le)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__le)
-            return vec_func(x.array, y.array)
+        # 模糊集合的比较，在得分数组上整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return np.less_equal(*scores(x, y))
 
         return NotImplemented
 
@@ -577,17 +690,9 @@ class Ge(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __ge(x, y)
 
-        if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__ge)
-            return vec_func(x, y.array)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzznum):
-            vec_func = np.vectorize(__ge)
-            return vec_func(x.array, y)
-
-        if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
-            vec_func = np.vectorize(__ge)
-            return vec_func(x.array, y.array)
+        # 模糊集合的比较，在得分数组上整体计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)):
+            return np.greater_equal(*scores(x, y))
 
         return NotImplemented
 
@@ -601,12 +706,8 @@ class GetItem(Operation):
         self.slices = slices
 
     def function(self, x):
-        from .construct import fuzzset
-        y = x.array[self.slices]
-        if isinstance(y, np.ndarray):
-            return fuzzset(y)
-        else:
-            return y
+        from .funcitonClass import FuzzIndex
+        return x.take(FuzzIndex()(x)[self.slices])
 
 
 def getitem(x, slices):
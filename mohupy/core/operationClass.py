@@ -5,72 +5,164 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
+import numpy as np
+
+from .base import ColumnarShape, RaggedType
 from .operationLib import archimedeanDict
+from .prune import prune_hesitant
 
 
 class BasicOperation:
+    """
+        The basic operations of fuzzy numbers. The operands are Fuzznum or
+        columnar Fuzzarray (numbers or np.ndarray for the scalar parameter of
+        'power' and 'times'). The norm kernels are element-wise, so a columnar
+        operand is computed on its whole md/nmd arrays in one pass and the
+        result is a Fuzzarray. The operations of a ragged hesitant fuzzy array
+        are computed on its flat degree buffers.
+    """
     # norms = 'algebraic'
 
     def __init__(self, qrung, mtype):
         self.qrung = qrung
         self.mtype = mtype
 
-    def add(self, x, y):
+    def __result(self, md, nmd, *operands):
         from .fuzznums import Fuzznum
-        from ..config import Config
+        from .fuzzarray import Fuzzarray
+        if any(isinstance(t, (Fuzzarray, np.ndarray)) for t in operands):
+            newset = Fuzzarray(self.qrung)
+            newset.mtype = self.mtype
+            newset.columns = md, nmd
+            return newset
         newfn = Fuzznum()
         newfn.mtype = self.mtype
         newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['add'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['add'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
+        newfn.md = md
+        newfn.nmd = nmd
         return newfn
 
-    def sub(self, x, y):
-        from .fuzznums import Fuzznum
+    def __pairwise(self, op, x, y):
+        """
+            Hesitant addition or multiplication of ragged fuzzy arrays (or a
+            ragged fuzzy array and a hesitant Fuzznum), batched over the whole
+            degree buffers. Every pair of hesitant degrees of two broadcast
+            elements is gathered by 'Ragged.pairs', and all the pairs are
+            combined by one call of the element-wise q-rung orthopair kernel
+            of the same norm, in the order of the hesitant kernel (x outer).
+        """
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['sub'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['sub'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
+        from .fuzzarray import Fuzzarray
+        from .ragged import Ragged
+
+        shape = np.broadcast_shapes(*(t.shape for t in (x, y) if isinstance(t, Fuzzarray)))
+
+        def __degrees(t):
+            if not isinstance(t, Fuzzarray):
+                md, nmd = Ragged.from_sequences([t.md]), Ragged.from_sequences([t.nmd])
+                index = np.zeros(shape, dtype=np.int64)
+            elif t.shape != shape:
+                md, nmd = t.ragged
+                index = np.broadcast_to(np.arange(t.size).reshape(t.shape), shape)
+            else:
+                return t.ragged
+            return md.take(index), nmd.take(index)
+
+        func = archimedeanDict[Config.arch][op]['qrofn']
+        (xm, xn), (ym, yn) = __degrees(x), __degrees(y)
+        im, jm, om = Ragged.pairs(xm, ym)
+        i_n, jn, on = Ragged.pairs(xn, yn)
+        md = func(xm.values[im], 0., ym.values[jm], 0., self.qrung)[0]
+        nmd = func(0., xn.values[i_n], 0., yn.values[jn], self.qrung)[1]
+        md, nmd, report = prune_hesitant(Ragged(md, om), Ragged(nmd, on), x, y)
+
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.ragged = md, nmd, shape
+        newset.pruning = report
+        return newset
+
+    def __hesitant(self, md, nmd, x, y):
+        """
+            The hesitant fuzzy number of the result of an addition or a
+            multiplication, with the hesitant degrees pruned to the cap.
+        """
+        from .ragged import Ragged
+        md, nmd, report = prune_hesitant(Ragged.from_sequences([md]), Ragged.from_sequences([nmd]), x, y)
+        newfn = self.__result(md[0], nmd[0], x, y)
+        newfn.pruning = report
         return newfn
 
+    def add(self, x, y):
+        from ..config import Config
+        if getattr(x, 'ragged', None) is not None or getattr(y, 'ragged', None) is not None:
+            return self.__pairwise('add', x, y)
+        md, nmd = archimedeanDict[Config.arch]['add'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)
+        if self.mtype in RaggedType:
+            return self.__hesitant(md, nmd, x, y)
+        return self.__result(md, nmd, x, y)
+
+    def sub(self, x, y):
+        from ..config import Config
+        md, nmd = archimedeanDict[Config.arch]['sub'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)
+        if self.mtype in RaggedType:
+            return self.__hesitant(md, nmd, x, y)
+        return self.__result(md, nmd, x, y)
+
     def mul(self, x, y):
-        from .fuzznums import Fuzznum
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['mul'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['mul'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
-        return newfn
+        if getattr(x, 'ragged', None) is not None or getattr(y, 'ragged', None) is not None:
+            return self.__pairwise('mul', x, y)
+        md, nmd = archimedeanDict[Config.arch]['mul'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)
+        if self.mtype in RaggedType:
+            return self.__hesitant(md, nmd, x, y)
+        return self.__result(md, nmd, x, y)
 
     def div(self, x, y):
-        from .fuzznums import Fuzznum
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['div'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['div'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
-        return newfn
+        md, nmd = archimedeanDict[Config.arch]['div'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)
+        if self.mtype in RaggedType:
+            return self.__hesitant(md, nmd, x, y)
+        return self.__result(md, nmd, x, y)
+
+    def __ragged(self, func, l, x):
+        """
+            The md of the kernel only depends on the md and the nmd only on the
+            nmd, so the two buffers are computed separately, with the parameter
+            repeated over the hesitant degrees of every element.
+        """
+        from .fuzzarray import Fuzzarray
+        md, nmd = x.ragged
+        l = np.asarray(l, dtype=np.float64)
+        lm = np.repeat(l.ravel(), md.lengths) if l.ndim else l
+        ln = np.repeat(l.ravel(), nmd.lengths) if l.ndim else l
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.ragged = (md.with_values(func(lm, md.values, md.values, self.qrung)[0]),
+                         nmd.with_values(func(ln, nmd.values, nmd.values, self.qrung)[1]), x.shape)
+        return newset
+
+    def __parameter(self, l):
+        """
+            The parameter array of 'power' and 'times' is broadcast over the
+            trailing (lower, upper) axis of the interval-valued degrees.
+        """
+        if np.ndim(l) > 0 and ColumnarShape.get(self.mtype):
+            return np.asarray(l)[..., None]
+        return l
 
     def power(self, l, x):
-        from .fuzznums import Fuzznum
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['pow'][self.mtype](l, x.md, x.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['pow'][self.mtype](l, x.md, x.nmd, self.qrung)[1]
-        return newfn
+        func = archimedeanDict[Config.arch]['pow'][self.mtype]
+        if getattr(x, 'ragged', None) is not None:
+            return self.__ragged(func, l, x)
+        md, nmd = func(self.__parameter(l), x.md, x.nmd, self.qrung)
+        return self.__result(md, nmd, l, x)
 
     def times(self, l, x):
-        from .fuzznums import Fuzznum
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['tim'][self.mtype](l, x.md, x.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['tim'][self.mtype](l, x.md, x.nmd, self.qrung)[1]
-        return newfn
+        func = archimedeanDict[Config.arch]['tim'][self.mtype]
+        if getattr(x, 'ragged', None) is not None:
+            return self.__ragged(func, l, x)
+        md, nmd = func(self.__parameter(l), x.md, x.nmd, self.qrung)
+        return self.__result(md, nmd, l, x)
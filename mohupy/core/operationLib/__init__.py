@@ -8,12 +8,30 @@
 archimedeanDict = dict()
 __all__ = []
 
-from .algebraicoperation import algebAdd, algebSub, algebMul, algebDiv, algebPow, algebTim
+from .algebraicoperation import (algebAdd, algebSub, algebMul, algebDiv, algebPow, algebTim,
+                                 algebAccum, algebFinal)
 archimedeanDict['algebraic'] = {'add': algebAdd,
                                 'sub': algebSub,
                                 'mul': algebMul,
                                 'div': algebDiv,
                                 'pow': algebPow,
-                                'tim': algebTim}
+                                'tim': algebTim,
+                                'accum': algebAccum,
+                                'final': algebFinal}
 
-__all__ += ['archimedeanDict']
\ No newline at end of file
+from .einsteinoperation import (einsAdd, einsSub, einsMul, einsDiv, einsPow, einsTim,
+                                einsAccum, einsFinal)
+archimedeanDict['einstein'] = {'add': einsAdd,
+                               'sub': einsSub,
+                               'mul': einsMul,
+                               'div': einsDiv,
+                               'pow': einsPow,
+                               'tim': einsTim,
+                               'accum': einsAccum,
+                               'final': einsFinal}
+
+from .generator import register_norm, normFamily
+for name, (tau, inv_tau, param) in normFamily.items():
+    register_norm(name, tau, inv_tau, param)
+
+__all__ += ['archimedeanDict', 'register_norm']
\ No newline at end of file
@@ -15,6 +15,9 @@ from ..constant import Approx
 The following is a quick calculation of Algebraic norms in fuzzy number. 
 The code has been used for the calculation of 'Fuzznum' and 'Fuzzarray', 
 so the Archimedean class is no longer used to complete the operation.
+
+All the functions are element-wise, the membership and non-membership
+degrees can be scalars or whole (broadcastable) md/nmd arrays.
 """
 
 
@@ -34,21 +37,27 @@ def algebraic_add(x0, y0, x1, y1, q):
 
 def algebraic_sub(x0, y0, x1, y1, q):
     """
+    The subtraction is only defined when y0/y1 <= ((1-x0^q)/(1-x1^q))^(1/q) <= 1,
+    the other elements return <0, 1>. The conditions are evaluated as masks, so
+    the parameters can be whole md/nmd arrays.
+
     :param x0:  第一个数的隶属度
     :param y0:  第一个数的非隶属度
     :param x1:  第二个数的隶属度
     :param y1:  第二个数的非隶属度
     :param q:   Q 阶
     """
-    if x0 == 0. and y0 == 1.:
-        return 0., 1.
-    if x1 == 1. or y1 == 0.:
-        return 0., 1.
-    if 0. <= y0 / y1 <= ((1 - x0 ** q) / (1 - x1 ** q)) ** (1 / q) <= 1.:
-        md = np.round(((x0 ** q - x1 ** q) / (1 - x1 ** q)) ** (1 / q), Approx.round)
-        nmd = np.round(y0 / y1, Approx.round)
-        return md, nmd
-    return 0., 1.
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nmd = y0 / y1
+        bound = ((1 - x0 ** q) / (1 - x1 ** q)) ** (1 / q)
+        md = ((x0 ** q - x1 ** q) / (1 - x1 ** q)) ** (1 / q)
+
+    valid = ~((x0 == 0.) & (y0 == 1.)) & ~((x1 == 1.) | (y1 == 0.)) & \
+        (0. <= nmd) & (nmd <= bound) & (bound <= 1.)
+    md = np.where(valid, np.round(md, Approx.round), 0.)
+    nmd = np.where(valid, np.round(nmd, Approx.round), 1.)
+    return md[()], nmd[()]
 
 
 def algebraic_mul(x0, y0, x1, y1, q):
@@ -67,21 +76,27 @@ def algebraic_mul(x0, y0, x1, y1, q):
 
 def algebraic_div(x0, y0, x1, y1, q):
     """
+    The division is only defined when x0/x1 <= ((1-y0^q)/(1-y1^q))^(1/q) <= 1,
+    the other elements return <1, 0>. The conditions are evaluated as masks, so
+    the parameters can be whole md/nmd arrays.
+
     :param x0:  第一个数的隶属度
     :param y0:  第一个数的非隶属度
     :param x1:  第二个数的隶属度
     :param y1:  第二个数的非隶属度
     :param q:   Q 阶
     """
-    if x0 == 1. and y0 == 0.:
-        return 1., 0.
-    if x1 == 0. or y1 == 1.:
-        return 1., 0.
-    if 0. <= x0 / x1 <= ((1 - y0 ** q) / (1 - y1 ** q)) ** (1 / q) <= 1.:
-        md = np.round(x0 / x1, Approx.round)
-        nmd = np.round(((y0 ** q - y1 ** q) / (1 - y1 ** q)) ** (1 / q), Approx.round)
-        return md, nmd
-    return 1., 0.
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        md = x0 / x1
+        bound = ((1 - y0 ** q) / (1 - y1 ** q)) ** (1 / q)
+        nmd = ((y0 ** q - y1 ** q) / (1 - y1 ** q)) ** (1 / q)
+
+    valid = ~((x0 == 1.) & (y0 == 0.)) & ~((x1 == 0.) | (y1 == 1.)) & \
+        (0. <= md) & (md <= bound) & (bound <= 1.)
+    md = np.where(valid, np.round(md, Approx.round), 1.)
+    nmd = np.where(valid, np.round(nmd, Approx.round), 0.)
+    return md[()], nmd[()]
 
 
 def algebraic_pow(p, x0, y0, q):
@@ -108,6 +123,51 @@ def algebraic_times(p, x0, y0, q):
     return md, nmd
 
 
+def algebraic_accumulate(op, x, y, q, axis=None, keepdims=False):
+    """
+    The log-space accumulator of the algebraic sum ('sum') or product ('prod')
+    along the axis. For the sum, (log(1 - md^q), log(nmd)) are summed and for
+    the product, (log(md), log(1 - nmd^q)). The products of thousands of
+    degrees underflow, while the sums of their logarithms do not, and the
+    accumulators of several chunks are combined by adding them.
+
+    :param op:          'sum' 或 'prod'
+    :param x:           隶属度数组
+    :param y:           非隶属度数组
+    :param q:           Q 阶
+    :param axis:        累积的轴
+    :param keepdims:    是否保留维度
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        if op == 'sum':
+            a, b = np.log1p(-x ** q), np.log(y)
+        else:
+            a, b = np.log(x), np.log1p(-y ** q)
+    return np.sum(a, axis=axis, keepdims=keepdims), np.sum(b, axis=axis, keepdims=keepdims)
+
+
+def algebraic_finalize(op, a, b, q, scale=1.):
+    """
+    Convert the log-space accumulator back to the membership and non-membership
+    degrees. 'scale' multiplies the accumulator, that is, 'scale=1/n' gives
+    the mean of n fuzzy numbers.
+
+    :param op:          'sum' 或 'prod'
+    :param a:           隶属度累积量
+    :param b:           非隶属度累积量
+    :param q:           Q 阶
+    :param scale:       累积量的系数
+    """
+    with np.errstate(invalid='ignore'):
+        a, b = scale * np.asarray(a), scale * np.asarray(b)
+    if op == 'sum':
+        md, nmd = (-np.expm1(a)) ** (1. / q), np.exp(b)
+    else:
+        md, nmd = np.exp(a), (-np.expm1(b)) ** (1. / q)
+    return np.round(md, Approx.round), np.round(nmd, Approx.round)
+
+
 """
 The following is a calculation of Algebraic norms in fuzzy number.
 """
@@ -5,12 +5,12 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-import warnings
-
 import numpy as np
 
 from .algebraic import (algebraic_add,algebraic_sub,algebraic_mul,
-                        algebraic_div,algebraic_pow,algebraic_times)
+                        algebraic_div,algebraic_pow,algebraic_times,
+                        algebraic_accumulate, algebraic_finalize)
+from .utils import interval_fallback, hesitant_inverse
 
 from ..regedit import Registry
 
@@ -20,6 +20,8 @@ algebMul = Registry()
 algebDiv = Registry()
 algebPow = Registry()
 algebTim = Registry()
+algebAccum = Registry()
+algebFinal = Registry()
 
 
 ################################################################
@@ -38,15 +40,9 @@ def ivfn_algeb_add(x0, y0, x1, y1, q):
 
 @algebAdd('qrohfn')
 def qrohfn_algeb_add(x0, y0, x1, y1, q):
-    mds, nmds = np.array([]), np.array([])
-
-    m = np.array(np.meshgrid(x0, x1)).T.reshape(-1, 2)
-    n = np.array(np.meshgrid(y0, y1)).T.reshape(-1, 2)
-
-    for i in range(len(m)):
-        mds = np.append(mds, algebraic_add(m[i, 0], 0, m[i, 1], 0, q)[0])
-    for i in range(len(n)):
-        nmds = np.append(nmds, algebraic_add(0, n[i, 0], 0, n[i, 1], q)[1])
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    mds = algebraic_add(x0[:, None], 0., x1[None, :], 0., q)[0].ravel()
+    nmds = algebraic_add(0., y0[:, None], 0., y1[None, :], q)[1].ravel()
     return mds, nmds
 
 
@@ -61,16 +57,13 @@ def qrofn_algeb_sub(x0, y0, x1, y1, q):
 
 @algebSub('ivfn')
 def ivfn_algeb_sub(x0, y0, x1, y1, q):
-    # TODO
-    warnings.warn('Subtraction of q-roivfn is not implemented. Return None.')
-    return None
+    md, nmd = algebraic_sub(x0, y0, x1, y1, q)
+    return interval_fallback(md, nmd, 0., 1.)
 
 
 @algebSub('qrohfn')
 def qrohfn_algeb_sub(x0, y0, x1, y1, q):
-    # TODO
-    warnings.warn('Subtraction of q-rohfn is not implemented. Return None.')
-    return None
+    return hesitant_inverse(algebraic_sub, x0, y0, x1, y1, q, 0., 1.)
 
 
 ################################################################
@@ -89,15 +82,9 @@ def ivfn_algeb_mul(x0, y0, x1, y1, q):
 
 @algebMul('qrohfn')
 def qrohfn_algeb_mul(x0, y0, x1, y1, q):
-    mds, nmds = np.array([]), np.array([])
-
-    m = np.array(np.meshgrid(x0, x1)).T.reshape(-1, 2)
-    n = np.array(np.meshgrid(y0, y1)).T.reshape(-1, 2)
-
-    for i in range(len(m)):
-        mds = np.append(mds, algebraic_mul(m[i, 0], 0, m[i, 1], 0, q)[0])
-    for i in range(len(n)):
-        nmds = np.append(nmds, algebraic_mul(0, n[i, 0], 0, n[i, 1], q)[1])
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    mds = algebraic_mul(x0[:, None], 0., x1[None, :], 0., q)[0].ravel()
+    nmds = algebraic_mul(0., y0[:, None], 0., y1[None, :], q)[1].ravel()
     return mds, nmds
 
 
@@ -112,16 +99,13 @@ def qrofn_algeb_div(x0, y0, x1, y1, q):
 
 @algebDiv('ivfn')
 def ivfn_algeb_div(x0, y0, x1, y1, q):
-    # TODO
-    warnings.warn('Division of q-roivfn is not implemented. Return None.')
-    return None
+    md, nmd = algebraic_div(x0, y0, x1, y1, q)
+    return interval_fallback(md, nmd, 1., 0.)
 
 
 @algebDiv('qrohfn')
 def qrohfn_algeb_div(x0, y0, x1, y1, q):
-    # TODO
-    warnings.warn('Division of q-rohfn is not implemented. Return None.')
-    return None
+    return hesitant_inverse(algebraic_div, x0, y0, x1, y1, q, 1., 0.)
 
 
 ################################################################
@@ -140,7 +124,7 @@ def ivfn_algeb_pow(p, x0, y0, q):
 
 @algebPow('qrohfn')
 def qrohfn_algeb_pow(p, x0, y0, q):
-    return algebraic_pow(p, x0, y0, q)
+    return algebraic_pow(p, np.asarray(x0), np.asarray(y0), q)
 
 
 ################################################################
@@ -159,4 +143,28 @@ def ivfn_algeb_times(p, x0, y0, q):
 
 @algebTim('qrohfn')
 def qrohfn_algeb_times(p, x0, y0, q):
-    return algebraic_times(p, x0, y0, q)
+    return algebraic_times(p, np.asarray(x0), np.asarray(y0), q)
+
+
+################################################################
+# Algebraic reduction: log-space accumulator and finalization
+################################################################
+
+@algebAccum('qrofn')
+def qrofn_algeb_accum(op, x, y, q, axis, keepdims):
+    return algebraic_accumulate(op, x, y, q, axis, keepdims)
+
+
+@algebAccum('ivfn')
+def ivfn_algeb_accum(op, x, y, q, axis, keepdims):
+    return algebraic_accumulate(op, x, y, q, axis, keepdims)
+
+
+@algebFinal('qrofn')
+def qrofn_algeb_final(op, a, b, q, scale):
+    return algebraic_finalize(op, a, b, q, scale)
+
+
+@algebFinal('ivfn')
+def ivfn_algeb_final(op, a, b, q, scale):
+    return algebraic_finalize(op, a, b, q, scale)
@@ -8,6 +8,126 @@ import numpy as np
 
 from ..base import Archimedean
 
+from ..constant import Approx
+
+"""
+The following is a quick calculation of Einstein norms in fuzzy number.
+The Einstein t-norm and t-conorm are applied to the q-th powers of the
+membership and non-membership degrees. Like the algebraic kernels, all the
+functions are element-wise, the degrees can be scalars or whole md/nmd arrays.
+"""
+
+
+def einstein_add(x0, y0, x1, y1, q):
+    """
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param x1:  第二个数的隶属度
+    :param y1:  第二个数的非隶属度
+    :param q:   Q 阶
+    """
+    md = np.round(einsSNorm(x0 ** q, x1 ** q) ** (1. / q), Approx.round)
+    nmd = np.round(einsTNorm(y0 ** q, y1 ** q) ** (1. / q), Approx.round)
+    return md, nmd
+
+
+def einstein_sub(x0, y0, x1, y1, q):
+    """
+    The inverse of the Einstein addition, i.e. the fuzzy number z that
+    satisfies z + (x1, y1) = (x0, y0). It is only defined when x0 >= x1,
+    y0 <= y1 and the result is a valid fuzzy number, the other elements
+    return <0, 1>.
+
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param x1:  第二个数的隶属度
+    :param y1:  第二个数的非隶属度
+    :param q:   Q 阶
+    """
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    a, b, c, d = x0 ** q, x1 ** q, y0 ** q, y1 ** q
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m = (a - b) / (1. - a * b)
+        n = c * (2. - d) / (d + c - c * d)
+
+    valid = ~((x0 == 0.) & (y0 == 1.)) & ~((x1 == 1.) | (y1 == 0.)) & \
+        (x0 >= x1) & (y0 <= y1) & (0. <= m) & (0. <= n) & (m + n <= 1.)
+    md = np.where(valid, np.round(np.abs(m) ** (1. / q), Approx.round), 0.)
+    nmd = np.where(valid, np.round(np.abs(n) ** (1. / q), Approx.round), 1.)
+    return md[()], nmd[()]
+
+
+def einstein_mul(x0, y0, x1, y1, q):
+    """
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param x1:  第二个数的隶属度
+    :param y1:  第二个数的非隶属度
+    :param q:   Q 阶
+    """
+    md = np.round(einsTNorm(x0 ** q, x1 ** q) ** (1. / q), Approx.round)
+    nmd = np.round(einsSNorm(y0 ** q, y1 ** q) ** (1. / q), Approx.round)
+    return md, nmd
+
+
+def einstein_div(x0, y0, x1, y1, q):
+    """
+    The inverse of the Einstein multiplication, i.e. the fuzzy number z that
+    satisfies z * (x1, y1) = (x0, y0). It is only defined when x0 <= x1,
+    y0 >= y1 and the result is a valid fuzzy number, the other elements
+    return <1, 0>.
+
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param x1:  第二个数的隶属度
+    :param y1:  第二个数的非隶属度
+    :param q:   Q 阶
+    """
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    a, b, c, d = x0 ** q, x1 ** q, y0 ** q, y1 ** q
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m = a * (2. - b) / (b + a - a * b)
+        n = (c - d) / (1. - c * d)
+
+    valid = ~((x0 == 1.) & (y0 == 0.)) & ~((x1 == 0.) | (y1 == 1.)) & \
+        (x0 <= x1) & (y0 >= y1) & (0. <= m) & (0. <= n) & (m + n <= 1.)
+    md = np.where(valid, np.round(np.abs(m) ** (1. / q), Approx.round), 1.)
+    nmd = np.where(valid, np.round(np.abs(n) ** (1. / q), Approx.round), 0.)
+    return md[()], nmd[()]
+
+
+def einstein_pow(p, x0, y0, q):
+    """
+    :param p:   幂
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param q:   Q 阶
+    """
+    a, c = x0 ** q, y0 ** q
+    md = np.round((2. * a ** p / ((2. - a) ** p + a ** p)) ** (1. / q), Approx.round)
+    nmd = np.round((((1. + c) ** p - (1. - c) ** p) / ((1. + c) ** p + (1. - c) ** p)) ** (1. / q),
+                   Approx.round)
+    return md, nmd
+
+
+def einstein_times(p, x0, y0, q):
+    """
+    :param p:   幂
+    :param x0:  第一个数的隶属度
+    :param y0:  第一个数的非隶属度
+    :param q:   Q 阶
+    """
+    a, c = x0 ** q, y0 ** q
+    md = np.round((((1. + a) ** p - (1. - a) ** p) / ((1. + a) ** p + (1. - a) ** p)) ** (1. / q),
+                  Approx.round)
+    nmd = np.round((2. * c ** p / ((2. - c) ** p + c ** p)) ** (1. / q), Approx.round)
+    return md, nmd
+
+
+"""
+The following is a calculation of Einstein norms in fuzzy number.
+"""
+
 
 class EinsT(Archimedean):
     def function(self, x):
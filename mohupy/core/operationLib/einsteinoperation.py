@@ -0,0 +1,174 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:49
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from .einstein import (einstein_add, einstein_sub, einstein_mul,
+                       einstein_div, einstein_pow, einstein_times,
+                       einsTao, einsInTao)
+from .generator import ArchimedeanNorm
+from .utils import interval_fallback, hesitant_inverse
+
+from ..regedit import Registry
+
+einsAdd = Registry()
+einsSub = Registry()
+einsMul = Registry()
+einsDiv = Registry()
+einsPow = Registry()
+einsTim = Registry()
+einsAccum = Registry()
+einsFinal = Registry()
+
+# The Einstein generator pair, used for the reductions.
+einsNorm = ArchimedeanNorm(einsTao, einsInTao)
+
+
+################################################################
+# Einstein Addition
+################################################################
+
+@einsAdd('qrofn')
+def qrofn_eins_add(x0, y0, x1, y1, q):
+    return einstein_add(x0, y0, x1, y1, q)
+
+
+@einsAdd('ivfn')
+def ivfn_eins_add(x0, y0, x1, y1, q):
+    return einstein_add(x0, y0, x1, y1, q)
+
+
+@einsAdd('qrohfn')
+def qrohfn_eins_add(x0, y0, x1, y1, q):
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    mds = einstein_add(x0[:, None], 0., x1[None, :], 0., q)[0].ravel()
+    nmds = einstein_add(0., y0[:, None], 0., y1[None, :], q)[1].ravel()
+    return mds, nmds
+
+
+################################################################
+# Einstein Subtraction
+################################################################
+
+@einsSub('qrofn')
+def qrofn_eins_sub(x0, y0, x1, y1, q):
+    return einstein_sub(x0, y0, x1, y1, q)
+
+
+@einsSub('ivfn')
+def ivfn_eins_sub(x0, y0, x1, y1, q):
+    md, nmd = einstein_sub(x0, y0, x1, y1, q)
+    return interval_fallback(md, nmd, 0., 1.)
+
+
+@einsSub('qrohfn')
+def qrohfn_eins_sub(x0, y0, x1, y1, q):
+    return hesitant_inverse(einstein_sub, x0, y0, x1, y1, q, 0., 1.)
+
+
+################################################################
+# Einstein Multiplication
+################################################################
+
+@einsMul('qrofn')
+def qrofn_eins_mul(x0, y0, x1, y1, q):
+    return einstein_mul(x0, y0, x1, y1, q)
+
+
+@einsMul('ivfn')
+def ivfn_eins_mul(x0, y0, x1, y1, q):
+    return einstein_mul(x0, y0, x1, y1, q)
+
+
+@einsMul('qrohfn')
+def qrohfn_eins_mul(x0, y0, x1, y1, q):
+    x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+    mds = einstein_mul(x0[:, None], 0., x1[None, :], 0., q)[0].ravel()
+    nmds = einstein_mul(0., y0[:, None], 0., y1[None, :], q)[1].ravel()
+    return mds, nmds
+
+
+################################################################
+# Einstein Division
+################################################################
+
+@einsDiv('qrofn')
+def qrofn_eins_div(x0, y0, x1, y1, q):
+    return einstein_div(x0, y0, x1, y1, q)
+
+
+@einsDiv('ivfn')
+def ivfn_eins_div(x0, y0, x1, y1, q):
+    md, nmd = einstein_div(x0, y0, x1, y1, q)
+    return interval_fallback(md, nmd, 1., 0.)
+
+
+@einsDiv('qrohfn')
+def qrohfn_eins_div(x0, y0, x1, y1, q):
+    return hesitant_inverse(einstein_div, x0, y0, x1, y1, q, 1., 0.)
+
+
+################################################################
+# Einstein Power
+################################################################
+
+@einsPow('qrofn')
+def qrofn_eins_pow(p, x0, y0, q):
+    return einstein_pow(p, x0, y0, q)
+
+
+@einsPow('ivfn')
+def ivfn_eins_pow(p, x0, y0, q):
+    return einstein_pow(p, x0, y0, q)
+
+
+@einsPow('qrohfn')
+def qrohfn_eins_pow(p, x0, y0, q):
+    return einstein_pow(p, np.asarray(x0), np.asarray(y0), q)
+
+
+################################################################
+# Einstein Times
+################################################################
+
+@einsTim('qrofn')
+def qrofn_eins_times(p, x0, y0, q):
+    return einstein_times(p, x0, y0, q)
+
+
+@einsTim('ivfn')
+def ivfn_eins_times(p, x0, y0, q):
+    return einstein_times(p, x0, y0, q)
+
+
+@einsTim('qrohfn')
+def qrohfn_eins_times(p, x0, y0, q):
+    return einstein_times(p, np.asarray(x0), np.asarray(y0), q)
+
+
+################################################################
+# Einstein reduction: generator accumulator and finalization
+################################################################
+
+@einsAccum('qrofn')
+def qrofn_eins_accum(op, x, y, q, axis, keepdims):
+    return einsNorm.accumulate(op, x, y, q, axis, keepdims)
+
+
+@einsAccum('ivfn')
+def ivfn_eins_accum(op, x, y, q, axis, keepdims):
+    return einsNorm.accumulate(op, x, y, q, axis, keepdims)
+
+
+@einsFinal('qrofn')
+def qrofn_eins_final(op, a, b, q, scale):
+    return einsNorm.finalize(op, a, b, q, scale)
+
+
+@einsFinal('ivfn')
+def ivfn_eins_final(op, a, b, q, scale):
+    return einsNorm.finalize(op, a, b, q, scale)
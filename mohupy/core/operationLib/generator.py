@@ -0,0 +1,257 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:49
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ..base import Archimedean
+from ..constant import Approx
+from ..regedit import Registry
+from .utils import interval_fallback, hesitant_inverse
+
+"""
+Operations derived from the additive generator of a strict Archimedean t-norm.
+
+For a generator 'tau' (decreasing, tau(1) = 0, tau(0) = inf) and its inverse,
+    T(a, b) = tau^-1(tau(a) + tau(b))
+    S(a, b) = 1 - tau^-1(tau(1 - a) + tau(1 - b))
+and the q-rung operations are obtained by applying the norms to the q-th
+powers of the membership and non-membership degrees. Scalar multiplication
+and power replace the sum of generators by p * tau, and subtraction and
+division use the difference of generators, so every operation of every
+fuzzy type is derived from the generator pair alone. All the computations
+are element-wise NumPy expressions over whole md/nmd arrays.
+"""
+
+
+class ArchimedeanNorm(Archimedean):
+    """
+        Archimedean t-norm and t-conorm generated by an additive generator.
+
+        Parameters
+        ----------
+            tau : function
+                The additive generator of the t-norm.
+            inv_tau : function
+                The inverse of the additive generator.
+            param : float or None
+                The parameter of the generator family. If it is not None,
+                the generator is called as tau(x, param).
+    """
+
+    def __init__(self, tau, inv_tau, param=None):
+        self.tau = tau
+        self.inv_tau = inv_tau
+        self.param = param
+
+    def t(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return self.tau(x) if self.param is None else self.tau(x, self.param)
+
+    def it(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return self.inv_tau(x) if self.param is None else self.inv_tau(x, self.param)
+
+    def function(self, x, y):
+        """
+            The t-norm T(x, y)
+        """
+        return self.tnorm(x, y)
+
+    def tnorm(self, x, y):
+        return self.it(self.t(x) + self.t(y))
+
+    def snorm(self, x, y):
+        return 1. - self.it(self.t(1. - x) + self.t(1. - y))
+
+    def __root(self, x, q):
+        return np.round(np.clip(x, 0., 1.) ** (1. / q), Approx.round)
+
+    def add(self, x0, y0, x1, y1, q):
+        md = self.__root(self.snorm(x0 ** q, x1 ** q), q)
+        nmd = self.__root(self.tnorm(y0 ** q, y1 ** q), q)
+        return md, nmd
+
+    def mul(self, x0, y0, x1, y1, q):
+        md = self.__root(self.tnorm(x0 ** q, x1 ** q), q)
+        nmd = self.__root(self.snorm(y0 ** q, y1 ** q), q)
+        return md, nmd
+
+    def pow(self, p, x0, y0, q):
+        md = self.__root(self.it(p * self.t(x0 ** q)), q)
+        nmd = self.__root(1. - self.it(p * self.t(1. - y0 ** q)), q)
+        return md, nmd
+
+    def times(self, p, x0, y0, q):
+        md = self.__root(1. - self.it(p * self.t(1. - x0 ** q)), q)
+        nmd = self.__root(self.it(p * self.t(y0 ** q)), q)
+        return md, nmd
+
+    def accumulate(self, op, x, y, q, axis=None, keepdims=False):
+        """
+            The generator values of the sum ('sum') or product ('prod') summed
+            along the axis. The accumulators of several chunks are combined by
+            adding them, since the norms are additive in the generator space.
+        """
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        if op == 'sum':
+            a, b = self.t(1. - x ** q), self.t(y ** q)
+        else:
+            a, b = self.t(x ** q), self.t(1. - y ** q)
+        return np.sum(a, axis=axis, keepdims=keepdims), np.sum(b, axis=axis, keepdims=keepdims)
+
+    def finalize(self, op, a, b, q, scale=1.):
+        """
+            Convert the accumulator back to the degrees, 'scale=1/n' gives the
+            mean of n fuzzy numbers.
+        """
+        a, b = scale * np.asarray(a), scale * np.asarray(b)
+        if op == 'sum':
+            return self.__root(1. - self.it(a), q), self.__root(self.it(b), q)
+        return self.__root(self.it(a), q), self.__root(1. - self.it(b), q)
+
+    def sub(self, x0, y0, x1, y1, q):
+        """
+            The fuzzy number z that satisfies z + (x1, y1) = (x0, y0). The
+            elements where it does not exist return <0, 1>.
+        """
+        x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+        with np.errstate(invalid='ignore'):
+            m = 1. - self.it(self.t(1. - x0 ** q) - self.t(1. - x1 ** q))
+            n = self.it(self.t(y0 ** q) - self.t(y1 ** q))
+        valid = ~((x0 == 0.) & (y0 == 1.)) & ~((x1 == 1.) | (y1 == 0.)) & \
+            (x0 >= x1) & (y0 <= y1) & (m + n <= 1.)
+        md = np.where(valid, self.__root(m, q), 0.)
+        nmd = np.where(valid, self.__root(n, q), 1.)
+        return md[()], nmd[()]
+
+    def div(self, x0, y0, x1, y1, q):
+        """
+            The fuzzy number z that satisfies z * (x1, y1) = (x0, y0). The
+            elements where it does not exist return <1, 0>.
+        """
+        x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+        with np.errstate(invalid='ignore'):
+            m = self.it(self.t(x0 ** q) - self.t(x1 ** q))
+            n = 1. - self.it(self.t(1. - y0 ** q) - self.t(1. - y1 ** q))
+        valid = ~((x0 == 1.) & (y0 == 0.)) & ~((x1 == 0.) | (y1 == 1.)) & \
+            (x0 <= x1) & (y0 >= y1) & (m + n <= 1.)
+        md = np.where(valid, self.__root(m, q), 1.)
+        nmd = np.where(valid, self.__root(n, q), 0.)
+        return md[()], nmd[()]
+
+
+def generatorOperation(norm: ArchimedeanNorm):
+    """
+        Build the operation registries of all fuzzy types for a generated norm,
+        in the same layout as the entries of 'archimedeanDict'.
+    """
+    add, sub, mul, div, pw, tim = Registry(), Registry(), Registry(), Registry(), Registry(), Registry()
+    accum, final = Registry(), Registry()
+
+    def __outer(func, x0, y0, x1, y1, q):
+        x0, y0, x1, y1 = np.asarray(x0), np.asarray(y0), np.asarray(x1), np.asarray(y1)
+        mds = func(x0[:, None], 0., x1[None, :], 0., q)[0].ravel()
+        nmds = func(0., y0[:, None], 0., y1[None, :], q)[1].ravel()
+        return mds, nmds
+
+    add['qrofn'] = add['ivfn'] = norm.add
+    add['qrohfn'] = lambda x0, y0, x1, y1, q: __outer(norm.add, x0, y0, x1, y1, q)
+
+    sub['qrofn'] = norm.sub
+    sub['ivfn'] = lambda x0, y0, x1, y1, q: interval_fallback(*norm.sub(x0, y0, x1, y1, q), 0., 1.)
+    sub['qrohfn'] = lambda x0, y0, x1, y1, q: hesitant_inverse(norm.sub, x0, y0, x1, y1, q, 0., 1.)
+
+    mul['qrofn'] = mul['ivfn'] = norm.mul
+    mul['qrohfn'] = lambda x0, y0, x1, y1, q: __outer(norm.mul, x0, y0, x1, y1, q)
+
+    div['qrofn'] = norm.div
+    div['ivfn'] = lambda x0, y0, x1, y1, q: interval_fallback(*norm.div(x0, y0, x1, y1, q), 1., 0.)
+    div['qrohfn'] = lambda x0, y0, x1, y1, q: hesitant_inverse(norm.div, x0, y0, x1, y1, q, 1., 0.)
+
+    pw['qrofn'] = pw['ivfn'] = norm.pow
+    pw['qrohfn'] = lambda p, x0, y0, q: norm.pow(p, np.asarray(x0), np.asarray(y0), q)
+
+    tim['qrofn'] = tim['ivfn'] = norm.times
+    tim['qrohfn'] = lambda p, x0, y0, q: norm.times(p, np.asarray(x0), np.asarray(y0), q)
+
+    accum['qrofn'] = accum['ivfn'] = norm.accumulate
+    final['qrofn'] = final['ivfn'] = norm.finalize
+
+    return {'add': add, 'sub': sub, 'mul': mul, 'div': div, 'pow': pw, 'tim': tim,
+            'accum': accum, 'final': final}
+
+
+def register_norm(name, tau, inv_tau, param=None):
+    """
+        Register an Archimedean norm by its additive generator. The operations
+        of all fuzzy types are derived from the generator and the norm can be
+        selected with 'config.set_arch(name)'.
+
+        Parameters
+        ----------
+            name : str
+                The name of the norm.
+            tau : function
+                The additive generator, tau(x) or tau(x, param).
+            inv_tau : function
+                The inverse of the additive generator, inv_tau(x) or inv_tau(x, param).
+            param : float or None
+                The parameter of the generator family.
+
+        Examples
+        --------
+            In [1]: register_norm('algebraic2', lambda x: -np.log(x), lambda x: np.exp(-x))
+            In [2]: config.set_arch('algebraic2')
+    """
+    from . import archimedeanDict
+    archimedeanDict[name] = generatorOperation(ArchimedeanNorm(tau, inv_tau, param))
+
+
+################################################################
+# Parameterized generator families
+################################################################
+
+def hamacher_tau(x, gamma):
+    """
+        Hamacher generator, gamma > 0. gamma=1 is the algebraic norm and
+        gamma=2 is the Einstein norm.
+    """
+    return np.log((gamma + (1. - gamma) * x) / x)
+
+
+def hamacher_inv_tau(x, gamma):
+    return gamma / (np.exp(x) + gamma - 1.)
+
+
+def frank_tau(x, s):
+    """
+        Frank generator, s > 0 and s != 1.
+    """
+    return -np.log((s ** x - 1.) / (s - 1.))
+
+
+def frank_inv_tau(x, s):
+    return np.log1p((s - 1.) * np.exp(-x)) / np.log(s)
+
+
+def dombi_tau(x, lam):
+    """
+        Dombi generator, lam > 0.
+    """
+    return ((1. - x) / x) ** lam
+
+
+def dombi_inv_tau(x, lam):
+    return 1. / (1. + x ** (1. / lam))
+
+
+# name: (generator, inverse generator, default parameter)
+normFamily = {'hamacher': (hamacher_tau, hamacher_inv_tau, 3.),
+              'frank': (frank_tau, frank_inv_tau, 2.),
+              'dombi': (dombi_tau, dombi_inv_tau, 2.)}
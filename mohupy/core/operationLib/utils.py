@@ -0,0 +1,62 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:49
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+
+def interval_fallback(md, nmd, md_fb, nmd_fb):
+    """
+    Interval-valued results of the subtraction and division are computed bound
+    by bound, so the lower bound may exceed the upper bound. Such elements are
+    not valid intervals and fall back to the given membership and non-membership
+    degrees.
+
+    :param md:      隶属度区间, shape (..., 2)
+    :param nmd:     非隶属度区间, shape (..., 2)
+    :param md_fb:   无效元素的隶属度
+    :param nmd_fb:  无效元素的非隶属度
+    """
+    md, nmd = np.asarray(md), np.asarray(nmd)
+    invalid = (md[..., 0] > md[..., 1]) | (nmd[..., 0] > nmd[..., 1])
+    md = np.where(invalid[..., None], md_fb, md)
+    nmd = np.where(invalid[..., None], nmd_fb, nmd)
+    return md, nmd
+
+
+def hesitant_inverse(func, x0, y0, x1, y1, q, md_fb, nmd_fb):
+    """
+    The subtraction or division of two hesitant fuzzy numbers. The q-rung
+    orthopair inverse 'func' is computed for every combination of the hesitant
+    degrees (x0[i], y0[k]) and (x1[j], y1[l]) in one outer broadcast, and the
+    pairs that fall back to <md_fb, nmd_fb> are dropped. The result keeps the
+    membership degrees of the valid (i, j) pairs and the non-membership degrees
+    of the valid (k, l) pairs, in the order of the outer product. Only when no
+    pair is valid the result is the fallback itself.
+
+    :param func:    q-rung orthopair 的减法或除法, 无效元素返回 <md_fb, nmd_fb>
+    :param x0:      第一个数的犹豫隶属度
+    :param y0:      第一个数的犹豫非隶属度
+    :param x1:      第二个数的犹豫隶属度
+    :param y1:      第二个数的犹豫非隶属度
+    :param q:       Q 阶
+    :param md_fb:   无效元素的隶属度
+    :param nmd_fb:  无效元素的非隶属度
+    """
+    x0, y0 = np.asarray(x0, dtype=np.float64).ravel(), np.asarray(y0, dtype=np.float64).ravel()
+    x1, y1 = np.asarray(x1, dtype=np.float64).ravel(), np.asarray(y1, dtype=np.float64).ravel()
+    shape = (x0.size, x1.size, y0.size, y1.size)
+    m, n = func(x0[:, None, None, None], y0[None, None, :, None],
+                x1[None, :, None, None], y1[None, None, None, :], q)
+    m, n = np.broadcast_to(m, shape), np.broadcast_to(n, shape)
+    valid = ~((m == md_fb) & (n == nmd_fb))
+    if not np.any(valid):
+        return np.array([md_fb], dtype=np.float64), np.array([nmd_fb], dtype=np.float64)
+
+    # 隶属度只依赖 (i, j), 非隶属度只依赖 (k, l), 取任一有效组合上的值
+    mds = np.where(valid, m, -np.inf).max(axis=(2, 3))[valid.any(axis=(2, 3))]
+    nmds = np.where(valid, n, -np.inf).max(axis=(0, 1))[valid.any(axis=(0, 1))]
+    return mds, nmds
@@ -0,0 +1,208 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午3:10
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from .constant import Approx
+from .ragged import Ragged
+from .regedit import Registry
+
+"""
+Size-bounded hesitant arithmetic.
+
+The addition and multiplication of hesitant fuzzy numbers combine every pair
+of hesitant degrees, so a chain of k operations of elements with 10 degrees
+gives 10^k degrees. With a cap set by 'config.set_hesitant_cap(cap, strategy)',
+the result of every hesitant operation is pruned: the degrees are first
+deduplicated at 'Approx.round' decimals (exact), and the elements that still
+have more than 'cap' degrees are reduced to 'cap' representatives by the
+strategy. All the strategies work on the ragged degree buffers of a whole
+fuzzy array at once, and the pruned degrees of every element are sorted.
+"""
+
+pruneStrategy = Registry()
+
+
+class PruneReport:
+    """
+        How much approximation the pruning of hesitant degrees has applied.
+
+        Attributes
+        ----------
+            dropped : int
+                The number of hesitant degrees discarded beyond the exact
+                deduplication.
+            error : float
+                The largest distance between a discarded degree and its closest
+                representative degree.
+    """
+
+    def __init__(self, dropped=0, error=0.):
+        self.dropped = int(dropped)
+        self.error = float(error)
+
+    def __add__(self, other):
+        if other is None:
+            return self
+        return PruneReport(self.dropped + other.dropped, max(self.error, other.error))
+
+    __radd__ = __add__
+
+    def __bool__(self):
+        return self.dropped > 0
+
+    def __repr__(self):
+        return f'PruneReport(dropped={self.dropped}, error={self.error})'
+
+
+def _keyed(degrees):
+    # 每一段的值在 [0, 1] 内，平移 2 倍段号后整个缓冲区有序
+    return degrees.values + 2. * degrees.segments
+
+
+def _quantile_index(degrees, cap):
+    """
+        The flat indices of 'cap' evenly spaced order statistics of every
+        segment, the segments must be sorted and longer than 'cap'.
+    """
+    lengths = degrees.lengths
+    k = np.arange(cap) / max(cap - 1, 1) if cap > 1 else np.array([.5])
+    pos = np.rint(k[None, :] * (lengths[:, None] - 1)).astype(np.int64)
+    return (degrees.offsets[:-1, None] + pos).ravel()
+
+
+@pruneStrategy('quantile')
+def quantile_prune(degrees, cap, side):
+    """
+        Keep the degrees at 'cap' evenly spaced quantiles, including the
+        minimum and the maximum.
+    """
+    return Ragged(degrees.values[_quantile_index(degrees, cap)],
+                  np.arange(len(degrees) + 1) * cap)
+
+
+@pruneStrategy('unique')
+def unique_prune(degrees, cap, side):
+    """
+        Exact deduplication, the elements that still have more than 'cap'
+        degrees fall back to the quantiles, so the cap always holds.
+    """
+    return quantile_prune(degrees, cap, side)
+
+
+@pruneStrategy('topk')
+def topk_prune(degrees, cap, side):
+    """
+        Keep the 'cap' most favourable degrees, that is, the largest membership
+        degrees and the smallest non-membership degrees.
+    """
+    lengths = degrees.lengths
+    start = degrees.offsets[:-1] + (lengths - cap if side == 'md' else 0)
+    return Ragged.gather(degrees.values, start, np.full(len(degrees), cap))
+
+
+@pruneStrategy('kmeans')
+def kmeans_prune(degrees, cap, side, iters=20):
+    """
+        Replace the degrees by the 'cap' centroids of a one-dimensional k-means
+        of every segment, started from the quantiles. In one dimension the
+        clusters are contiguous, so a degree is assigned to a centroid by a
+        search in the sorted midpoints of the centroids of its segment.
+    """
+    n = len(degrees)
+    segments = degrees.segments
+    keyed = _keyed(degrees)
+    centers = degrees.values[_quantile_index(degrees, cap)].reshape(n, cap)
+    for _ in range(iters):
+        mid = (centers[:, :-1] + centers[:, 1:]) / 2. + 2. * np.arange(n)[:, None]
+        label = np.searchsorted(mid.ravel(), keyed) - segments * (cap - 1)
+        cluster = segments * cap + label
+        counts = np.bincount(cluster, minlength=n * cap).reshape(n, cap)
+        sums = np.bincount(cluster, weights=degrees.values, minlength=n * cap).reshape(n, cap)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            new = np.where(counts > 0, sums / counts, centers)
+        if np.array_equal(new, centers):
+            break
+        centers = new
+    centers = np.round(centers, Approx.round)
+    return Ragged(centers.ravel(), np.arange(n + 1) * cap).unique()
+
+
+def _error(degrees, kept):
+    """
+        The largest distance between a degree and the closest kept degree of
+        its segment. Both ragged arrays are sorted segment by segment.
+    """
+    keyed, target = _keyed(kept), _keyed(degrees)
+    if target.size == 0 or keyed.size == 0:
+        return 0.
+    pos = np.searchsorted(keyed, target)
+    lo = np.clip(pos - 1, 0, keyed.size - 1)
+    hi = np.clip(pos, 0, keyed.size - 1)
+    dist = np.minimum(np.abs(degrees.values - kept.values[lo]), np.abs(degrees.values - kept.values[hi]))
+    return float(np.max(dist))
+
+
+def prune(degrees, cap, strategy, side='md'):
+    """
+        Prune the hesitant degrees of every segment to at most 'cap' degrees.
+
+        Parameters
+        ----------
+            degrees : Ragged
+                The hesitant membership or non-membership degrees.
+            cap : int
+                The largest number of hesitant degrees of an element.
+            strategy : str
+                The key of 'pruneStrategy': 'unique', 'quantile', 'topk' or 'kmeans'.
+            side : str
+                'md' or 'nmd', the side of the degrees.
+
+        Returns
+        -------
+            (Ragged, PruneReport)
+    """
+    assert strategy in pruneStrategy, \
+        f'Unknown pruning strategy \'{strategy}\'. Please choose from {set(pruneStrategy)}'
+    degrees = degrees.with_values(np.round(degrees.values, Approx.round)).unique()
+    over = degrees.lengths > cap
+    if not np.any(over):
+        return degrees, PruneReport()
+
+    index = np.flatnonzero(over)
+    excess = degrees.take(index)
+    kept = pruneStrategy[strategy](excess, cap, side)
+    report = PruneReport(excess.values.size - kept.values.size, _error(excess, kept))
+
+    # 未超出上限的元素保持不变，超出的元素替换为剪枝后的度
+    position = np.full(len(degrees), -1, dtype=np.int64)
+    position[index] = np.arange(index.size)
+    merged = Ragged.concatenate([degrees, kept])
+    rows = np.where(over, len(degrees) + position, np.arange(len(degrees)))
+    return merged.take(rows), report
+
+
+def prune_hesitant(md, nmd, *operands):
+    """
+        Prune the ragged degrees (md, nmd) of the result of a hesitant
+        operation with the cap and strategy of the configuration. The report
+        of the result adds up the reports of the operands, so the report of a
+        long aggregation covers all its steps. Returns the degrees unchanged
+        and no report if no cap is set and no operand has been pruned.
+    """
+    from ..config import Config
+    reports = [t.pruning for t in operands if getattr(t, 'pruning', None) is not None]
+    if Config.hesitant_cap is not None:
+        md, rm = prune(md, Config.hesitant_cap, Config.hesitant_prune, 'md')
+        nmd, rn = prune(nmd, Config.hesitant_cap, Config.hesitant_prune, 'nmd')
+        reports += [rm, rn]
+    if not reports:
+        return md, nmd, None
+    report = PruneReport()
+    for r in reports:
+        report = report + r
+    return md, nmd, report
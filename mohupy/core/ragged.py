@@ -0,0 +1,196 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午12:48
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+
+class Ragged:
+    """
+        Compressed ragged array (CSR layout) of float64 segments. All segments
+        are stored in one flat 'values' buffer, and segment i is
+        values[offsets[i]:offsets[i + 1]]. A q-rung orthopair hesitant fuzzy
+        array keeps its hesitant membership and non-membership degrees in two
+        Ragged arrays, so that the segment-wise computations (sums, maxima,
+        sorting, ...) are NumPy operations over the whole buffer.
+
+        Parameters
+        ----------
+            values : array_like
+                The flat buffer of all the segments.
+            offsets : array_like
+                The start of every segment followed by the end of the last one,
+                of length n + 1 for n segments.
+    """
+
+    def __init__(self, values, offsets):
+        self.values = np.asarray(values, dtype=np.float64).ravel()
+        self.offsets = np.asarray(offsets, dtype=np.int64).ravel()
+        assert self.offsets.size > 0 and self.offsets[0] == 0 and self.offsets[-1] == self.values.size, \
+            'The offsets must start with 0 and end with the size of values.'
+
+    @staticmethod
+    def from_sequences(sequences):
+        """
+            Build a ragged array from a sequence of 1-D arrays.
+        """
+        sequences = [np.asarray(s, dtype=np.float64).ravel() for s in sequences]
+        lengths = np.fromiter((s.size for s in sequences), dtype=np.int64, count=len(sequences))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        values = np.concatenate(sequences) if sequences else np.empty(0)
+        return Ragged(values, offsets)
+
+    @staticmethod
+    def gather(values, starts, lengths):
+        """
+            Build a ragged array whose segment i is values[starts[i]:starts[i] + lengths[i]].
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        index = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return Ragged(np.asarray(values)[index], offsets)
+
+    @staticmethod
+    def choose(condition, a, b):
+        """
+            Segment-wise selection, segment i is a[i] where condition[i] is True
+            and b[i] otherwise.
+        """
+        condition = np.asarray(condition, dtype=bool)
+        values = np.concatenate((a.values, b.values))
+        starts = np.where(condition, a.offsets[:-1], b.offsets[:-1] + a.values.size)
+        lengths = np.where(condition, a.lengths, b.lengths)
+        return Ragged.gather(values, starts, lengths)
+
+    @staticmethod
+    def concatenate(raggeds):
+        """
+            Join a sequence of ragged arrays one after another.
+        """
+        values = np.concatenate([r.values for r in raggeds])
+        lengths = np.concatenate([r.lengths for r in raggeds])
+        return Ragged(values, np.concatenate(([0], np.cumsum(lengths))))
+
+    @staticmethod
+    def pairs(a, b):
+        """
+            The flat indices of all the pairs of values of the segments a[i]
+            and b[i], for every segment i. The pairs of segment i are ordered
+            by the values of a[i] first, that is, as a[i][:, None] and
+            b[i][None, :] raveled, and they form segment i of the offsets.
+
+            Returns
+            -------
+                (ia, ib, offsets): the indices into a.values and b.values, and
+                the offsets of the len(a[i]) * len(b[i]) pairs of every segment.
+        """
+        assert len(a) == len(b), f'The ragged arrays do not have the same length ({len(a)} and {len(b)}).'
+        lm, ln = a.lengths, b.lengths
+        counts = lm * ln
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        segments = np.repeat(np.arange(len(a)), counts)
+        local = np.arange(offsets[-1]) - offsets[:-1][segments]
+        n = ln[segments]
+        ia = a.offsets[:-1][segments] + local // np.maximum(n, 1)
+        ib = b.offsets[:-1][segments] + local % np.maximum(n, 1)
+        return ia, ib, offsets
+
+    def __len__(self):
+        return self.offsets.size - 1
+
+    def __getitem__(self, i):
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def segments(self):
+        """
+            The segment number of every value of the buffer.
+        """
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def with_values(self, values):
+        """
+            A ragged array of the same layout with a new values buffer.
+        """
+        return Ragged(values, self.offsets)
+
+    def take(self, indices):
+        """
+            The segments of the flat indices, as a new ragged array.
+        """
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        return Ragged.gather(self.values, self.offsets[:-1][indices], self.lengths[indices])
+
+    def sum(self):
+        return np.bincount(self.segments, weights=self.values, minlength=len(self))
+
+    def reduce(self, ufunc, empty=np.nan):
+        """
+            Segment-wise reduction with a NumPy ufunc (e.g. np.maximum), the
+            empty segments give 'empty'.
+        """
+        lengths = self.lengths
+        result = np.full(len(self), empty, dtype=np.float64)
+        full = lengths > 0
+        if np.any(full):
+            result[full] = ufunc.reduceat(self.values, self.offsets[:-1][full])
+        return result
+
+    def max(self, empty=np.nan):
+        return self.reduce(np.maximum, empty)
+
+    def min(self, empty=np.nan):
+        return self.reduce(np.minimum, empty)
+
+    def mean(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sum() / self.lengths
+
+    def sort(self, reverse=False):
+        """
+            Sort the values within every segment, ascending by default.
+        """
+        if self.values.size == 0:
+            return self.with_values(self.values)
+        # Shift every segment above the previous one, so that one argsort
+        # sorts the whole buffer segment by segment.
+        key = -self.values if reverse else self.values
+        key = key - key.min() + self.segments * (np.ptp(key) + 1.)
+        return self.with_values(self.values[np.argsort(key)])
+
+    def unique(self):
+        """
+            The sorted unique values of every segment.
+        """
+        s = self.sort()
+        segments = s.segments
+        keep = np.ones(s.values.size, dtype=bool)
+        keep[1:] = (np.diff(s.values) != 0.) | (np.diff(segments) != 0)
+        lengths = np.bincount(segments[keep], minlength=len(self))
+        return Ragged(s.values[keep], np.concatenate(([0], np.cumsum(lengths))))
+
+    def dense(self, width=None, fill=np.nan):
+        """
+            The segments as the rows of a dense (n, width) matrix, every row is
+            filled up with 'fill' (a number or one value per segment) after the
+            values of its segment. 'width' defaults to the longest segment.
+        """
+        lengths = self.lengths
+        width = int(lengths.max(initial=0)) if width is None else int(width)
+        assert np.all(lengths <= width), f'The segments are longer than the width {width}.'
+        fill = np.broadcast_to(np.asarray(fill, dtype=np.float64), (len(self),))
+        matrix = np.repeat(fill[:, None], width, axis=1)
+        segments = self.segments
+        matrix[segments, np.arange(self.values.size) - self.offsets[:-1][segments]] = self.values
+        return matrix
+
+    def tolist(self):
+        return [self.values[a:b] for a, b in zip(self.offsets[:-1], self.offsets[1:])]
@@ -0,0 +1,126 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:42
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from .fuzzarray import Fuzzarray
+
+
+class Reducer:
+    """
+        Streaming reduction (sum, product or mean) of columnar fuzzy arrays.
+
+        The reduction is accumulated chunk by chunk in the generator space of
+        the Archimedean norm, which is the log space for the algebraic norm,
+        so that products of 10^5 degrees do not underflow. The accumulators
+        of two reducers are combined with 'merge', so that a long stream can
+        be reduced in pieces (e.g. by several workers) and the result is the
+        same as reducing the whole stream at once.
+
+        Parameters
+        ----------
+            op : str
+                'sum', 'prod' or 'mean'.
+            axis : int, tuple of int or None
+                The axes of each chunk to be reduced. None reduces all the
+                elements of each chunk.
+            keepdims : bool
+                Whether to keep the reduced axes with size one.
+
+        Examples
+        --------
+            In [1]: r = Reducer('mean', axis=0)
+            In [2]: for chunk in chunks:
+               ...:     r.update(chunk)
+            In [3]: r.result()
+    """
+
+    def __init__(self, op='sum', axis=None, keepdims=False):
+        from ..config import Config
+        assert op in ('sum', 'prod', 'mean'), f'Unsupported reduction: {op}.'
+        self.op = op
+        self.axis = axis
+        self.keepdims = keepdims
+        self.arch = Config.arch
+
+        self.qrung = None
+        self.mtype = None
+        self.count = 0
+        self.md_acc = None
+        self.nmd_acc = None
+
+    def __norm(self, key):
+        from .operationLib import archimedeanDict
+        norm = archimedeanDict[self.arch]
+        assert key in norm and self.mtype in norm[key], \
+            f'The {self.arch} norm has no reduction for mtype:{self.mtype}.'
+        return norm[key][self.mtype]
+
+    def __axis(self, ndim):
+        if self.axis is None:
+            return tuple(range(ndim))
+        axis = self.axis if isinstance(self.axis, tuple) else (self.axis,)
+        for a in axis:
+            assert -ndim <= a < ndim, f'axis {a} is out of bounds for array of dimension {ndim}'
+        return tuple(a + ndim if a < 0 else a for a in axis)
+
+    def update(self, x: Fuzzarray):
+        """
+            Accumulate a chunk of fuzzy numbers.
+        """
+        assert isinstance(x, Fuzzarray) and x.columns is not None, \
+            'Only the columnar fuzzy array can be reduced.'
+        if self.mtype is None:
+            self.qrung, self.mtype = x.qrung, x.mtype
+        assert self.qrung == x.qrung and self.mtype == x.mtype, \
+            f'The chunk (qrung:{x.qrung}, mtype:{x.mtype}) does not match the ' \
+            f'reducer (qrung:{self.qrung}, mtype:{self.mtype}).'
+
+        axis = self.__axis(x.ndim)
+        op = 'sum' if self.op == 'mean' else self.op
+        a, b = self.__norm('accum')(op, *x.columns, x.qrung, axis, self.keepdims)
+        self.count += int(np.prod([x.shape[i] for i in axis]))
+        if self.md_acc is None:
+            self.md_acc, self.nmd_acc = a, b
+        else:
+            self.md_acc, self.nmd_acc = self.md_acc + a, self.nmd_acc + b
+        return self
+
+    def merge(self, other):
+        """
+            Combine the accumulator of another reducer with this one.
+        """
+        assert isinstance(other, Reducer) and other.op == self.op and other.arch == self.arch, \
+            'Only the reducers of the same reduction and norm can be merged.'
+        if other.md_acc is None:
+            return self
+        if self.md_acc is None:
+            self.qrung, self.mtype, self.count = other.qrung, other.mtype, other.count
+            self.md_acc, self.nmd_acc = other.md_acc, other.nmd_acc
+            return self
+        assert self.qrung == other.qrung and self.mtype == other.mtype, \
+            'Only the reducers of the same qrung and mtype can be merged.'
+        self.count += other.count
+        self.md_acc, self.nmd_acc = self.md_acc + other.md_acc, self.nmd_acc + other.nmd_acc
+        return self
+
+    def result(self):
+        """
+            The reduced fuzzy number, or fuzzy array if the reduction leaves
+            some axes.
+        """
+        assert self.md_acc is not None, 'Nothing has been accumulated.'
+        op = 'sum' if self.op == 'mean' else self.op
+        scale = 1. / self.count if self.op == 'mean' else 1.
+        md, nmd = self.__norm('final')(op, self.md_acc, self.nmd_acc, self.qrung, scale)
+
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.columns = md, nmd
+        if newset.ndim == 0:
+            return newset.take(0)
+        return newset
@@ -0,0 +1,585 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/13 下午3:40
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from .base import ColumnarShape
+from .constant import Approx
+from .regedit import Registry
+
+"""
+Fuzzy matrix products over semirings.
+
+The product of fuzzy matrices is C[i, j] = (+)_k A[i, k] (x) B[k, j] for a
+'multiplication' (x) and an 'addition' (+) of fuzzy numbers. Each semiring
+maps the terms A[i, k] (x) B[k, j] to an accumulator space where the
+addition over k is a plain NumPy reduction (a product, a maximum or a sum),
+and maps the reduced accumulator back to the degrees:
+
+    algebraic   algebraic product and sum, the md accumulator is
+                prod_k (1 - a^q b^q) and the nmd one prod_k (1 - (1 - u^q)(1 - v^q))
+    einstein    Einstein product and sum, in the same product form of the
+                ratios a / (2 - a) of the q-th powers
+    maxmin      md = max_k min(a, b), nmd = min_k max(u, v)
+    maxprod     md = max_k a b, nmd = min_k of the algebraic product nmd
+
+Any other registered Archimedean norm uses its own product kernel and its
+generator space as the accumulator. The computation runs over the columnar
+md/nmd arrays tile by tile of rows, and every tile of accumulators stays
+in the cache while it is reduced over the inner index.
+"""
+
+fuzzSemiring = Registry()
+
+# The number of float64 accumulators of one tile of a fuzzy matrix product,
+# the tile is updated inner index by inner index while it stays in the cache.
+SEMIRING_BLOCK = 2 ** 15
+
+
+class Semiring:
+    """
+        The base of the semirings of the fuzzy matrix products.
+
+        The degrees are first mapped to working operands by 'prepare', where
+        the multiplication of fuzzy numbers is 'combine'. 'term' maps a product
+        to the accumulator space, where the addition is the reduction.
+
+        Attributes
+        ----------
+            reduce : (ufunc, ufunc)
+                The reductions over the inner index of the md and nmd terms.
+            initial : (float, float)
+                The accumulators of an empty reduction.
+            distributive : bool
+                Whether the multiplication distributes over the addition. The
+                accumulators of a distributive semiring are then the prepared
+                operands of the sums, so the sums can be multiplied again.
+    """
+    reduce = (np.multiply, np.multiply)
+    initial = (1., 1.)
+    distributive = False
+
+    def prepare(self, md, nmd, q):
+        """
+            The working operands of the md and nmd degrees (e.g. their q-th powers).
+        """
+        return md ** q, nmd ** q
+
+    def combine(self, a, u, b, v, q):
+        """
+            The product of the prepared operands (a, u) and (b, v).
+        """
+        return a * b, u * v
+
+    def term(self, a, u, q):
+        """
+            The md and nmd terms of a prepared product, in the accumulator space.
+        """
+        raise NotImplementedError()
+
+    def terms(self, a, u, b, v, q):
+        """
+            The terms of the products of the prepared operands (a, u) and (b, v).
+        """
+        return self.term(*self.combine(a, u, b, v, q), q)
+
+    def finalize(self, m, n, q):
+        """
+            The md and nmd degrees of the reduced accumulators.
+        """
+        raise NotImplementedError()
+
+
+@fuzzSemiring('algebraic')
+class AlgebraicSemiring(Semiring):
+    def prepare(self, md, nmd, q):
+        return md ** q, 1. - nmd ** q
+
+    def term(self, a, u, q):
+        return 1. - a, 1. - u
+
+    def terms(self, a, u, b, v, q):
+        tm = a * b
+        np.subtract(1., tm, out=tm)
+        tn = u * v
+        np.subtract(1., tn, out=tn)
+        return tm, tn
+
+    def finalize(self, m, n, q):
+        md = np.clip(1. - m, 0., 1.) ** (1. / q)
+        nmd = n ** (1. / q)
+        return np.round(md, Approx.round), np.round(nmd, Approx.round)
+
+
+@fuzzSemiring('einstein')
+class EinsteinSemiring(Semiring):
+    """
+        The Einstein t-norm multiplies the ratios p(a) = a / (2 - a), that is,
+        p(T(a, b)) = p(a) p(b). With x = T(a, b) the Einstein sum over k is
+        (1 - m) / (1 + m) for m = prod_k (1 - x) / (1 + x) = prod_k (1 - r) / (1 + 3 r)
+        and r = p(a) p(b), and dually the Einstein product of the nmd is
+        2 n / (1 + n) for n = prod_k (1 - s) / (1 + 3 s) and s = p(1 - u) p(1 - v).
+
+        Every term needs a division, so the product costs about twice the
+        algebraic one, and the size of the row tiles does not change it.
+    """
+
+    def prepare(self, md, nmd, q):
+        a, u = md ** q, 1. - nmd ** q
+        return a / (2. - a), u / (2. - u)
+
+    def term(self, a, u, q):
+        return (1. - a) / (1. + 3. * a), (1. - u) / (1. + 3. * u)
+
+    def terms(self, a, u, b, v, q):
+        r = a * b
+        tm = 1. - r
+        np.multiply(r, 3., out=r)
+        np.add(r, 1., out=r)
+        np.divide(tm, r, out=tm)
+        s = u * v
+        tn = 1. - s
+        np.multiply(s, 3., out=s)
+        np.add(s, 1., out=s)
+        np.divide(tn, s, out=tn)
+        return tm, tn
+
+    def finalize(self, m, n, q):
+        md = np.clip((1. - m) / (1. + m), 0., 1.) ** (1. / q)
+        nmd = np.clip(2. * n / (1. + n), 0., 1.) ** (1. / q)
+        return np.round(md, Approx.round), np.round(nmd, Approx.round)
+
+
+@fuzzSemiring('maxmin')
+class MaxMinSemiring(Semiring):
+    reduce = (np.maximum, np.minimum)
+    initial = (0., 1.)
+    distributive = True
+
+    def prepare(self, md, nmd, q):
+        return md, nmd
+
+    def combine(self, a, u, b, v, q):
+        return np.minimum(a, b), np.maximum(u, v)
+
+    def term(self, a, u, q):
+        return a, u
+
+    def finalize(self, m, n, q):
+        return np.round(m, Approx.round), np.round(n, Approx.round)
+
+
+@fuzzSemiring('maxprod')
+class MaxProdSemiring(Semiring):
+    """
+        The nmd of the algebraic product is 1 - (1 - u)(1 - v), so its minimum
+        over k is one minus the maximum of (1 - u)(1 - v).
+    """
+    reduce = (np.maximum, np.maximum)
+    initial = (0., 0.)
+    distributive = True
+
+    def prepare(self, md, nmd, q):
+        return md ** q, 1. - nmd ** q
+
+    def term(self, a, u, q):
+        return a, u
+
+    def finalize(self, m, n, q):
+        nmd = np.clip(1. - n, 0., 1.) ** (1. / q)
+        return np.round(m ** (1. / q), Approx.round), np.round(nmd, Approx.round)
+
+
+class NormSemiring(Semiring):
+    """
+        The semiring of a registered Archimedean norm: the products are computed
+        by the multiplication kernel of the norm and summed in its generator space.
+    """
+    reduce = (np.add, np.add)
+    initial = (0., 0.)
+
+    def __init__(self, arch):
+        from .operationLib import archimedeanDict
+        self.norm = archimedeanDict[arch]
+
+    def prepare(self, md, nmd, q):
+        return md, nmd
+
+    def combine(self, a, u, b, v, q):
+        return self.norm['mul']['qrofn'](a, u, b, v, q)
+
+    def term(self, a, u, q):
+        return self.norm['accum']['qrofn']('sum', a, u, q, (), False)
+
+    def finalize(self, m, n, q):
+        return self.norm['final']['qrofn']('sum', m, n, q)
+
+
+def semiring(name=None):
+    """
+        The semiring of a name, None is the Archimedean norm of the configuration.
+    """
+    from ..config import Config
+    from .operationLib import archimedeanDict
+    name = Config.arch if name is None else name
+    if name in fuzzSemiring:
+        return fuzzSemiring[name]()
+    assert name in archimedeanDict, \
+        f'Unknown semiring \'{name}\'. Please choose from {set(fuzzSemiring) | set(archimedeanDict)}'
+    return NormSemiring(name)
+
+
+def accumulate(xm, xn, ym, yn, q, ring):
+    """
+        The accumulators of the batched product of the prepared operands
+        (xm, xn) of shape (B, I, K) and (ym, yn) of shape (B, K, J), reduced
+        over K tile by tile of rows. Returns (am, an) of shape (B, I, J).
+    """
+    nb, ni, nk = xm.shape
+    nj = ym.shape[2]
+    rm, rn = ring.reduce
+    am = np.full((nb, ni, nj), ring.initial[0])
+    an = np.full((nb, ni, nj), ring.initial[1])
+
+    # 行分块 (B, bi, J) 常驻缓存, 沿 k 逐步累积; 矩阵较小时每步合并 bk 个 k
+    bi = max(1, min(ni, SEMIRING_BLOCK // max(nb * nj, 1)))
+    bk = max(1, min(nk, SEMIRING_BLOCK // max(nb * bi * nj, 1)))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        for i in range(0, ni, bi):
+            si = slice(i, i + bi)
+            tile_m, tile_n = am[:, si], an[:, si]
+            for k in range(0, nk, bk):
+                if bk == 1:
+                    tm, tn = ring.terms(xm[:, si, k, None], xn[:, si, k, None],
+                                        ym[:, None, k, :], yn[:, None, k, :], q)
+                else:
+                    sk = slice(k, k + bk)
+                    tm, tn = ring.terms(xm[:, si, sk, None], xn[:, si, sk, None],
+                                        ym[:, None, sk, :], yn[:, None, sk, :], q)
+                    tm, tn = rm.reduce(tm, axis=2), rn.reduce(tn, axis=2)
+                rm(tile_m, tm, out=tile_m)
+                rn(tile_n, tn, out=tile_n)
+    return am, an
+
+
+def contract(x, y, q, ring):
+    """
+        The batched fuzzy matrix product of the degree arrays x = (md, nmd)
+        of shape (B, I, K) and y = (md, nmd) of shape (B, K, J) under the
+        semiring 'ring'. Returns (md, nmd) of shape (B, I, J).
+    """
+    xm, xn = ring.prepare(np.asarray(x[0], dtype=np.float64), np.asarray(x[1], dtype=np.float64), q)
+    ym, yn = ring.prepare(np.asarray(y[0], dtype=np.float64), np.asarray(y[1], dtype=np.float64), q)
+    am, an = accumulate(xm, xn, ym, yn, q, ring)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        return ring.finalize(am, an, q)
+
+
+def fuzz_matmul(x, y, name=None):
+    """
+        The matrix product of two columnar fuzzy arrays under a semiring,
+        with the rules of 'np.matmul': 1-D operands are promoted to a row
+        (x) or a column (y) vector, and the leading dimensions of operands
+        of more than two dimensions are broadcast as a stack of matrices.
+
+        Parameters
+        ----------
+            x, y : Fuzzarray
+                Columnar fuzzy arrays of the same mtype and qrung.
+            name : str or None
+                The semiring, 'algebraic', 'einstein', 'maxmin', 'maxprod' or
+                a registered Archimedean norm. None is the norm of the configuration.
+    """
+    from .fuzzarray import Fuzzarray
+    assert x.ndim > 0, f"input operand 0 does not have enough dimensions."
+    assert y.ndim > 0, f"input operand 1 does not have enough dimensions."
+    trailing = ColumnarShape[x.mtype]
+    t = int(np.prod(trailing, dtype=np.int64))
+
+    xs = (1,) + x.shape if x.ndim == 1 else x.shape
+    ys = y.shape + (1,) if y.ndim == 1 else y.shape
+    assert xs[-1] == ys[-2], \
+        f'matmul: Input operand 1 has a mismatch in its core dimension 0 (size {ys[-2]} is different from {xs[-1]})'
+    batch = np.broadcast_shapes(xs[:-2], ys[:-2])
+    nb = int(np.prod(batch, dtype=np.int64))
+
+    def __stack(d, shape):
+        # 区间的上下界移到批量维度之前，与矩阵一起按批计算
+        d = np.broadcast_to(np.reshape(d, shape + (t,)), batch + shape[-2:] + (t,))
+        return np.moveaxis(d, -1, 0).reshape((t * nb,) + shape[-2:])
+
+    md, nmd = contract((__stack(x.md, xs), __stack(x.nmd, xs)),
+                       (__stack(y.md, ys), __stack(y.nmd, ys)), x.qrung, semiring(name))
+
+    shape = batch + (xs[-2], ys[-1])
+    md = np.moveaxis(md.reshape((t,) + shape), 0, -1).reshape(shape + trailing)
+    nmd = np.moveaxis(nmd.reshape((t,) + shape), 0, -1).reshape(shape + trailing)
+    keep = tuple(i for i in range(len(shape))
+                 if not (x.ndim == 1 and i == len(shape) - 2) and not (y.ndim == 1 and i == len(shape) - 1))
+    shape = tuple(shape[i] for i in keep)
+    md, nmd = md.reshape(shape + trailing), nmd.reshape(shape + trailing)
+
+    newset = Fuzzarray(x.qrung)
+    newset.mtype = x.mtype
+    newset.columns = md, nmd
+    if newset.ndim == 0:
+        return newset.take(0)
+    return newset
+
+
+################################################################
+# Einsum
+################################################################
+
+# The number of float64 terms of one chunk of a fused contraction.
+EINSUM_BLOCK = 2 ** 18
+
+
+def _parse(subscripts, shapes):
+    """
+        The input subscripts, the output subscripts and the size of every
+        index of an einsum expression. Without '->' the output is made of
+        the indices that appear once, in alphabetical order.
+    """
+    subscripts = subscripts.replace(' ', '')
+    assert '.' not in subscripts, 'einsum: the ellipsis is not supported.'
+    if '->' in subscripts:
+        lhs, output = subscripts.split('->')
+    else:
+        lhs = subscripts
+        letters = lhs.replace(',', '')
+        output = ''.join(sorted(c for c in set(letters) if letters.count(c) == 1))
+    inputs = lhs.split(',')
+    assert len(inputs) == len(shapes), \
+        f'einsum: {len(inputs)} subscripts are given for {len(shapes)} operands.'
+
+    sizes = {}
+    for term, shape in zip(inputs, shapes):
+        assert all(c.isalpha() for c in term), f'einsum: invalid subscripts \'{term}\'.'
+        assert len(term) == len(shape), \
+            f'einsum: the subscripts \'{term}\' do not match an operand of {len(shape)} dimensions.'
+        for c, n in zip(term, shape):
+            assert sizes.setdefault(c, n) == n, \
+                f'einsum: the index \'{c}\' has different sizes ({sizes[c]} and {n}).'
+    assert len(set(output)) == len(output) and all(c in sizes for c in output), \
+        f'einsum: invalid output subscripts \'{output}\'.'
+    return inputs, output, sizes
+
+
+def _size(labels, sizes):
+    return int(np.prod([sizes[c] for c in labels], dtype=np.int64))
+
+
+def _pair(a, b, keep, sizes, q, ring):
+    """
+        The accumulators of the product of two prepared operands (labels, m, n)
+        summed over their common indices that are not in 'keep', as a batched
+        matrix product. Returns (labels, am, an).
+    """
+    la, lb = a[0], b[0]
+    batch = [c for c in la if c in lb and c in keep]
+    left = [c for c in la if c not in lb]
+    right = [c for c in lb if c not in la]
+    summed = [c for c in la if c in lb and c not in keep]
+
+    def __arrange(op, first, second):
+        labels, m, n = op
+        perm = [labels.index(c) for c in batch + first + second]
+        shape = (_size(batch, sizes), _size(first, sizes), _size(second, sizes))
+        return np.transpose(m, perm).reshape(shape), np.transpose(n, perm).reshape(shape)
+
+    xm, xn = __arrange(a, left, summed)
+    ym, yn = __arrange(b, summed, right)
+    am, an = accumulate(xm, xn, ym, yn, q, ring)
+    labels = ''.join(batch + left + right)
+    shape = tuple(sizes[c] for c in labels)
+    return labels, am.reshape(shape), an.reshape(shape)
+
+
+def _greedy(ops, output, sizes, q, ring):
+    """
+        Contraction pair by pair along a greedy path. The indices that only
+        appear in one operand are summed first, then the pair whose product is
+        the smallest relative to its operands is contracted, until one operand
+        is left. The intermediates of a distributive semiring stay in the
+        prepared space, the others are rounded to degrees after every step,
+        as a chain of products of fuzzy arrays. Returns the accumulators.
+    """
+    rm, rn = ring.reduce
+
+    def __settle(am, an):
+        if ring.distributive:
+            return am, an
+        return ring.prepare(*ring.finalize(am, an, q), q)
+
+    def __keep(skip):
+        return set(output).union(*(ops[k][0] for k in range(len(ops)) if k not in skip))
+
+    def __squeeze(k):
+        labels, m, n = ops[k]
+        keep = __keep((k,))
+        axes = tuple(i for i, c in enumerate(labels) if c not in keep)
+        if axes:
+            tm, tn = ring.term(m, n, q)
+            labels = ''.join(c for c in labels if c in keep)
+            ops[k] = (labels, *__settle(rm.reduce(tm, axis=axes), rn.reduce(tn, axis=axes)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        for k in range(len(ops)):
+            __squeeze(k)
+        while len(ops) > 1:
+            best = None
+            for i in range(len(ops)):
+                for j in range(i + 1, len(ops)):
+                    la, lb = ops[i][0], ops[j][0]
+                    keep = __keep((i, j))
+                    result = [c for c in dict.fromkeys(la + lb) if c in keep]
+                    cost = (_size(result, sizes) - _size(la, sizes) - _size(lb, sizes), _size(result, sizes))
+                    if best is None or cost < best[0]:
+                        best = cost, i, j, keep
+            _, i, j, keep = best
+            labels, am, an = _pair(ops[i], ops[j], keep, sizes, q, ring)
+            ops = [op for k, op in enumerate(ops) if k not in (i, j)] + [(labels, *__settle(am, an))]
+            __squeeze(len(ops) - 1)
+        labels, m, n = ops[0]
+        return (labels, *ring.term(m, n, q))
+
+
+def _fused(ops, output, sizes, q, ring):
+    """
+        Contraction of a non-distributive semiring: the sum runs over the
+        products of all the operands at once, since it cannot be split into
+        pairwise contractions. The products are built chunk by chunk, every
+        chunk is sliced along the largest index, so that at most EINSUM_BLOCK
+        terms are materialized. Two operands summed over common indices only
+        are a batched matrix product.
+    """
+    rm, rn = ring.reduce
+    summed = [c for c in dict.fromkeys(''.join(op[0] for op in ops)) if c not in output]
+    if len(ops) == 2 and all(c in ops[0][0] and c in ops[1][0] for c in summed):
+        return _pair(ops[0], ops[1], set(output), sizes, q, ring)
+    order = output + ''.join(summed)
+
+    def __chunk(ops, sizes):
+        total = _size(order, sizes)
+        split = [c for c in order if sizes[c] > 1]
+        if total > EINSUM_BLOCK and split:
+            c = max(split, key=sizes.get)
+            step = max(1, sizes[c] * EINSUM_BLOCK // total)
+            parts, acc = [], None
+            for start in range(0, sizes[c], step):
+                sl = slice(start, min(start + step, sizes[c]))
+                sub = []
+                for labels, m, n in ops:
+                    if c in labels:
+                        index = (slice(None),) * labels.index(c) + (sl,)
+                        m, n = m[index], n[index]
+                    sub.append((labels, m, n))
+                r = __chunk(sub, dict(sizes, **{c: sl.stop - sl.start}))
+                if c in output:
+                    parts.append(r)
+                elif acc is None:
+                    acc = r
+                else:
+                    acc = rm(acc[0], r[0]), rn(acc[1], r[1])
+            if c in output:
+                axis = output.index(c)
+                return (np.concatenate([p[0] for p in parts], axis=axis),
+                        np.concatenate([p[1] for p in parts], axis=axis))
+            return acc
+
+        pm = pn = None
+        for labels, m, n in ops:
+            # 按 order 排列各维度, 缺失的指标补为长度 1 的维度
+            perm = sorted(range(len(labels)), key=lambda i: order.index(labels[i]))
+            shape = tuple(sizes[c] if c in labels else 1 for c in order)
+            m, n = np.transpose(m, perm).reshape(shape), np.transpose(n, perm).reshape(shape)
+            pm, pn = (m, n) if pm is None else ring.combine(pm, pn, m, n, q)
+        tm, tn = ring.term(pm, pn, q)
+        shape = tuple(sizes[c] for c in order)
+        tm, tn = np.broadcast_to(tm, shape), np.broadcast_to(tn, shape)
+        axes = tuple(range(len(output), len(order)))
+        if not axes:
+            return np.array(tm), np.array(tn)
+        return rm.reduce(tm, axis=axes), rn.reduce(tn, axis=axes)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        am, an = __chunk(ops, sizes)
+    return output, am, an
+
+
+def fuzz_einsum(subscripts, *operands, name=None, optimize=False):
+    """
+        Einstein summation of columnar fuzzy arrays under a semiring: the
+        operands are multiplied with the multiplication of the semiring and
+        the repeated indices that are not in the output are summed with its
+        addition, e.g. 'ij,jk->ik' is the matrix product and 'eac,c->ea' the
+        weighting of the criteria of an expert x alternative x criterion array.
+        A repeated index within one operand takes its diagonal.
+
+        The distributive semirings ('maxmin', 'maxprod') are contracted pair
+        by pair along a greedy path, so the intermediates stay small. The sums
+        of the Archimedean norms do not distribute over their products, so the
+        whole sum of products is reduced at once, chunk by chunk, unless
+        'optimize' asks for the greedy path, which is then the chain of the
+        pairwise products (e.g. (A @ B) @ C for 'ij,jk,kl->il').
+
+        Parameters
+        ----------
+            subscripts : str
+                The subscripts of the summation, as 'np.einsum' (without ellipsis).
+            operands : Fuzzarray
+                Columnar fuzzy arrays of the same mtype and qrung.
+            name : str or None
+                The semiring, None is the norm of the configuration.
+            optimize : bool
+                Whether the non-distributive semirings are contracted pair by pair.
+    """
+    from .fuzznums import Fuzznum
+    from .fuzzarray import Fuzzarray
+    from .construct import fuzzset
+    operands = [fuzzset(x) if isinstance(x, Fuzznum) else x for x in operands]
+    assert operands, 'einsum: no operand is given.'
+    for x in operands:
+        assert isinstance(x, Fuzzarray) and x.columns is not None, \
+            'einsum: the operands must be columnar fuzzy arrays.'
+        assert x.mtype == operands[0].mtype and x.qrung == operands[0].qrung, \
+            f'einsum: mtype or qrung does not match ({operands[0].mtype}, {operands[0].qrung}) ' \
+            f'and ({x.mtype}, {x.qrung}).'
+    mtype, q = operands[0].mtype, operands[0].qrung
+    ring = semiring(name)
+    inputs, output, sizes = _parse(subscripts, [x.shape for x in operands])
+
+    # 区间的上下界作为所有操作数与结果共有的指标 '*'
+    trailing = ColumnarShape[mtype]
+    bound = '*' if trailing else ''
+    if bound:
+        sizes[bound] = trailing[0]
+    ops = []
+    for term, x in zip(inputs, operands):
+        md, nmd = np.asarray(x.md, dtype=np.float64), np.asarray(x.nmd, dtype=np.float64)
+        labels = ''.join(dict.fromkeys(term))
+        if labels != term:
+            md = np.einsum(f'{term}...->{labels}...', md)
+            nmd = np.einsum(f'{term}...->{labels}...', nmd)
+        ops.append((labels + bound, *ring.prepare(md, nmd, q)))
+
+    output = output + bound
+    if ring.distributive or optimize:
+        labels, am, an = _greedy(ops, output, sizes, q, ring)
+    else:
+        labels, am, an = _fused(ops, output, sizes, q, ring)
+    perm = [labels.index(c) for c in output]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        md, nmd = ring.finalize(np.transpose(am, perm), np.transpose(an, perm), q)
+
+    newset = Fuzzarray(q)
+    newset.mtype = mtype
+    newset.columns = np.asarray(md, dtype=np.float64), np.asarray(nmd, dtype=np.float64)
+    if newset.ndim == 0:
+        return newset.take(0)
+    return newset
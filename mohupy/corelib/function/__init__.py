@@ -17,8 +17,16 @@ __all__ += ['fuzz_zeros', 'fuzz_negs', 'fuzz_poss', 'fuzz_full', 'fuzz_zeros_lik
             'fuzz_poss_like', 'fuzz_full_like', 'fuzz_negs_like']
 
 
-from .measure import fuzz_distance
-__all__ += ['fuzz_distance']
+from .measure import fuzz_distance, fuzz_cdist, fuzz_pdist, cdist, pdist
+__all__ += ['fuzz_distance', 'fuzz_cdist', 'fuzz_pdist', 'cdist', 'pdist']
+
+
+from .neighbors import NeighborIndex
+__all__ += ['NeighborIndex']
+
+
+from .cluster import FuzzKMeans, FuzzCMeans, fuzz_kmeans, fuzz_cmeans
+__all__ += ['FuzzKMeans', 'FuzzCMeans', 'fuzz_kmeans', 'fuzz_cmeans']
 
 
 from .plot import fuzz_plot
@@ -36,8 +44,8 @@ __all__ += ['fuzz_isscalar', 'fuzz_func4fuzz', 'asfuzzarray', 'asfuzzyarray',
             'fuzz_absolute', 'fuzz_relu']
 
 
-from .math import fuzz_dot, fuzz_inner, fuzz_outer, fuzz_cartadd, fuzz_cartprod
-__all__ += ['fuzz_dot', 'fuzz_inner', 'fuzz_outer', 'fuzz_cartadd', 'fuzz_cartprod']
+from .math import fuzz_dot, fuzz_inner, fuzz_outer, fuzz_cartadd, fuzz_cartprod, fuzz_einsum, einsum
+__all__ += ['fuzz_dot', 'fuzz_inner', 'fuzz_outer', 'fuzz_cartadd', 'fuzz_cartprod', 'fuzz_einsum', 'einsum']
 
 
 from .random import rand_fuzz, random_choice_fuzz
@@ -0,0 +1,334 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/13 上午10:05
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ...core import Fuzznum, Fuzzarray, fuzzset
+from ...core.base import ColumnarShape
+from ..regedit.distance import fuzzCdist, minkowskiWeight
+
+
+class FuzzCluster:
+    """
+        The base of the centroid clusterings of fuzzy arrays.
+
+        The distances of the elements to the centers are the pairwise distance
+        matrices of 'fuzz_cdist', and the center of a cluster is the closed-form
+        weighted mean of its elements under the Archimedean norm of the
+        configuration: the elements are mapped to the generator space of the
+        norm (the log space for the algebraic norm), where the weighted mean is
+        a weighted sum divided by the total weight, and the result is mapped
+        back. The weighted sums of all the clusters are one matrix product.
+
+        In mini-batch mode the generator sums and the weights of every cluster
+        are accumulated over the batches ('partial_fit'), so the center is the
+        running weighted mean of all the elements seen, and a dataset which does
+        not fit in memory can be clustered chunk by chunk.
+
+        Parameters
+        ----------
+            k : int
+                The number of clusters.
+            l : int or float
+                The generic distance parameter, 'l=1' Hamming, 'l=2' Euclidean.
+            indeterminacy : bool
+                Whether the distance contains indeterminacy.
+            max_iter : int
+                The largest number of iterations (of batches in mini-batch mode).
+            tol : float
+                The iterations stop when no center moves by more than 'tol'.
+            batch : int or None
+                The batch size of the mini-batch mode of 'fit', None for the
+                full batch iterations.
+            seed : int or None
+                The seed of the k-means++ initialization and of the batches.
+    """
+
+    def __init__(self, k, l=2, indeterminacy=True, max_iter=100, tol=1e-6, batch=None, seed=None):
+        from ...config import Config
+        assert k >= 1, 'The number of clusters must be at least 1.'
+        self.k = k
+        self.l = l
+        self.indeterminacy = indeterminacy
+        self.max_iter = max_iter
+        self.tol = tol
+        self.batch = batch
+        self.seed = seed
+        self.arch = Config.arch
+        self.rng = np.random.default_rng(seed)
+
+        self.qrung = None
+        self.mtype = None
+        self.centers = None
+        self.n_iter = 0
+        self.inertia = None
+        self.__acc = None
+        self.__weight = None
+
+    def weights(self, d):
+        """
+            The (N, k) weights of the elements in the clusters, given their
+            distances to the centers.
+        """
+        raise NotImplementedError()
+
+    def objective(self, d, w):
+        """
+            The value of the objective of the weights w and the distances d.
+        """
+        return float(np.sum(w * d ** 2))
+
+    def __flat(self, x):
+        x = x if isinstance(x, Fuzzarray) else fuzzset(x)
+        assert x.mtype in minkowskiWeight and x.columns is not None, \
+            f'Unsupported mtype: {x.mtype}, only the q-rung orthopair and interval-valued ' \
+            f'fuzzy arrays can be clustered.'
+        if self.mtype is None:
+            self.qrung, self.mtype = x.qrung, x.mtype
+        assert x.qrung == self.qrung and x.mtype == self.mtype, \
+            f'The fuzzy array (qrung:{x.qrung}, mtype:{x.mtype}) does not match the ' \
+            f'clustering (qrung:{self.qrung}, mtype:{self.mtype}).'
+        return x.reshape(x.size) if x.ndim != 1 else x
+
+    def __norm(self, key):
+        from ...core.operationLib import archimedeanDict
+        return archimedeanDict[self.arch][key][self.mtype]
+
+    def __fuzzarray(self, md, nmd):
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.columns = md, nmd
+        return newset
+
+    def distance(self, x):
+        """
+            The (N, k) distance matrix of the flat elements of x to the centers.
+        """
+        assert self.centers is not None, 'The clustering has not been fitted.'
+        return fuzzCdist[self.mtype](self.__flat(x), self.centers, self.l, None, self.indeterminacy)
+
+    def __generators(self, x):
+        """
+            The generator values of the sum of the degrees of every element, as
+            two (N, m) matrices (m = 1, or 2 for the interval bounds). The
+            infinite values (degrees 0 or 1) are bounded, so that a zero weight
+            gives a zero term instead of nan.
+        """
+        a, b = self.__norm('accum')('sum', *x.columns, self.qrung, (), False)
+        big = np.finfo(np.float64).max
+        a = np.nan_to_num(a.reshape(x.size, -1), posinf=big, neginf=-big)
+        b = np.nan_to_num(b.reshape(x.size, -1), posinf=big, neginf=-big)
+        return a, b
+
+    def __centers(self, a, b, weight):
+        """
+            The centers of the weighted generator sums (k, m) and the total
+            weights (k,) of the clusters.
+        """
+        shape = (self.k,) + ColumnarShape[self.mtype]
+        with np.errstate(invalid='ignore', over='ignore', divide='ignore'):
+            md, nmd = self.__norm('final')('sum', a, b, self.qrung, 1. / weight[:, None])
+        md, nmd = md.reshape(shape), nmd.reshape(shape)
+        # 空簇保留原来的中心
+        if np.any(weight == 0.):
+            empty = (weight == 0.).reshape((self.k,) + (1,) * (md.ndim - 1))
+            md = np.where(empty, self.centers.md, md)
+            nmd = np.where(empty, self.centers.nmd, nmd)
+        return self.__fuzzarray(md, nmd)
+
+    def init(self, x):
+        """
+            Seeded k-means++ initialization: the first center is drawn uniformly,
+            and every next one with a probability proportional to the squared
+            distance to the closest center already drawn.
+        """
+        x = self.__flat(x)
+        n = x.size
+        assert n >= self.k, f'There are fewer elements ({n}) than clusters ({self.k}).'
+        cdist = fuzzCdist[self.mtype]
+        index = [int(self.rng.integers(n))]
+        closest = cdist(x, x.take(index), self.l, None, self.indeterminacy)[:, 0] ** 2
+        for _ in range(1, self.k):
+            total = closest.sum()
+            i = int(self.rng.choice(n, p=closest / total)) if total > 0 else int(self.rng.integers(n))
+            index.append(i)
+            d = cdist(x, x.take([i]), self.l, None, self.indeterminacy)[:, 0] ** 2
+            closest = np.minimum(closest, d)
+        self.centers = x.take(index)
+        self.__acc = None
+        self.__weight = None
+        return self
+
+    def __shift(self, old):
+        return float(max(np.max(np.fabs(self.centers.md - old.md)),
+                         np.max(np.fabs(self.centers.nmd - old.nmd))))
+
+    def fit(self, x):
+        """
+            Cluster the elements of x. In mini-batch mode, every iteration is a
+            'partial_fit' of a random batch of x.
+        """
+        x = self.__flat(x)
+        if self.batch is not None:
+            size = min(x.size, max(3 * self.batch, 10 * self.k))
+            self.init(x.take(self.rng.choice(x.size, size, replace=False)))
+            for i in range(self.max_iter):
+                old = self.centers
+                self.partial_fit(x.take(self.rng.choice(x.size, min(self.batch, x.size), replace=False)))
+                self.n_iter = i + 1
+                if self.__shift(old) <= self.tol:
+                    break
+            d = self.distance(x)
+            self.inertia = self.objective(d, self.weights(d))
+            return self
+
+        self.init(x)
+        a, b = self.__generators(x)
+        for i in range(self.max_iter):
+            w = self.weights(self.distance(x))
+            old = self.centers
+            self.centers = self.__centers(w.T @ a, w.T @ b, w.sum(axis=0))
+            self.n_iter = i + 1
+            if self.__shift(old) <= self.tol:
+                break
+        d = self.distance(x)
+        self.inertia = self.objective(d, self.weights(d))
+        return self
+
+    def partial_fit(self, x):
+        """
+            One mini-batch step: the weights of the elements of x are added to
+            the accumulated generator sums and weights of the clusters, and the
+            centers are their running weighted means. The first call on an
+            unfitted clustering initializes the centers from x.
+        """
+        x = self.__flat(x)
+        if self.centers is None:
+            self.init(x)
+        a, b = self.__generators(x)
+        w = self.weights(self.distance(x))
+        if self.__acc is None:
+            self.__acc = w.T @ a, w.T @ b
+            self.__weight = w.sum(axis=0)
+        else:
+            self.__acc = self.__acc[0] + w.T @ a, self.__acc[1] + w.T @ b
+            self.__weight = self.__weight + w.sum(axis=0)
+        self.centers = self.__centers(*self.__acc, self.__weight)
+        return self
+
+
+class FuzzKMeans(FuzzCluster):
+    """
+        K-means clustering of a q-rung orthopair or interval-valued fuzzy array,
+        every element belongs to the cluster of its closest center.
+
+        Examples
+        --------
+            In [1]: km = FuzzKMeans(3, seed=0).fit(x)
+            In [2]: km.centers, km.predict(x)
+            In [3]: km = FuzzKMeans(3, seed=0)
+            In [4]: for chunk in chunks:
+               ...:     km.partial_fit(chunk)
+    """
+
+    def weights(self, d):
+        w = np.zeros_like(d)
+        w[np.arange(d.shape[0]), np.argmin(d, axis=1)] = 1.
+        return w
+
+    def predict(self, x):
+        """
+            The cluster labels of the elements of x, of the shape of x.
+        """
+        labels = np.argmin(self.distance(x), axis=1)
+        return labels[0] if isinstance(x, Fuzznum) else labels.reshape(x.shape)
+
+
+class FuzzCMeans(FuzzCluster):
+    """
+        Fuzzy c-means clustering of a q-rung orthopair or interval-valued fuzzy
+        array. The membership of element i in cluster j is
+
+            u_ij = 1 / sum_c (d_ij / d_ic)^(2 / (m - 1))
+
+        and the weights of the centers are u^m.
+
+        Parameters
+        ----------
+            m : float
+                The fuzzifier, greater than 1.
+
+        Examples
+        --------
+            In [1]: cm = FuzzCMeans(3, m=2., seed=0).fit(x)
+            In [2]: cm.centers, cm.predict(x)
+    """
+
+    def __init__(self, k, m=2., l=2, indeterminacy=True, max_iter=100, tol=1e-6, batch=None, seed=None):
+        assert m > 1, 'The fuzzifier m must be greater than 1.'
+        self.m = m
+        super().__init__(k, l, indeterminacy, max_iter, tol, batch, seed)
+
+    def membership(self, d):
+        """
+            The (N, k) memberships of the distances, an element at the distance
+            zero of some centers is shared equally by them.
+        """
+        zero = d == 0.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv = d ** (-2. / (self.m - 1.))
+            u = inv / inv.sum(axis=1, keepdims=True)
+        hit = zero.any(axis=1)
+        if np.any(hit):
+            u[hit] = zero[hit] / zero[hit].sum(axis=1, keepdims=True)
+        return u
+
+    def weights(self, d):
+        return self.membership(d) ** self.m
+
+    def predict(self, x):
+        """
+            The memberships of the elements of x in the clusters, of shape
+            x.shape + (k,).
+        """
+        u = self.membership(self.distance(x))
+        return u[0] if isinstance(x, Fuzznum) else u.reshape(x.shape + (self.k,))
+
+
+def fuzz_kmeans(x, k, l=2, indeterminacy=True, max_iter=100, tol=1e-6, batch=None, seed=None):
+    """
+    K-means clustering of a q-rung orthopair or interval-valued fuzzy array.
+    :param x:               the fuzzy array
+    :param k:               the number of clusters
+    :param l:               the parameter of generalized distance
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param max_iter:        the largest number of iterations
+    :param tol:             the largest movement of the centers at convergence
+    :param batch:           the batch size of the mini-batch mode, None for full batch
+    :param seed:            the seed of the initialization
+    :return:                (centers, labels), the labels have the shape of x
+    """
+    km = FuzzKMeans(k, l, indeterminacy, max_iter, tol, batch, seed).fit(x)
+    return km.centers, km.predict(x)
+
+
+def fuzz_cmeans(x, k, m=2., l=2, indeterminacy=True, max_iter=100, tol=1e-6, batch=None, seed=None):
+    """
+    Fuzzy c-means clustering of a q-rung orthopair or interval-valued fuzzy array.
+    :param x:               the fuzzy array
+    :param k:               the number of clusters
+    :param m:               the fuzzifier, greater than 1
+    :param l:               the parameter of generalized distance
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param max_iter:        the largest number of iterations
+    :param tol:             the largest movement of the centers at convergence
+    :param batch:           the batch size of the mini-batch mode, None for full batch
+    :param seed:            the seed of the initialization
+    :return:                (centers, memberships), the memberships have the shape x.shape + (k,)
+    """
+    cm = FuzzCMeans(k, m, l, indeterminacy, max_iter, tol, batch, seed).fit(x)
+    return cm.centers, cm.predict(x)
@@ -8,20 +8,22 @@
 from ...core import Fuzznum, Fuzzarray
 
 
-def fuzz_dot(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray) -> Fuzznum | Fuzzarray:
+def fuzz_dot(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray, semiring=None) -> Fuzznum | Fuzzarray:
     """
     两个模糊数或模糊数组(向量)的点积
+    semiring: 'algebraic', 'einstein', 'maxmin', 'maxprod' 或已注册的阿基米德范数, 默认为配置的范数
     """
     from ..math import Dot
-    return Dot()(x, y)
+    return Dot()(x, y, semiring)
 
 
-def fuzz_inner(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray) -> Fuzznum | Fuzzarray:
+def fuzz_inner(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray, semiring=None) -> Fuzznum | Fuzzarray:
     """
     两个模糊数或模糊数组（向量）的内积
+    semiring: 'algebraic', 'einstein', 'maxmin', 'maxprod' 或已注册的阿基米德范数, 默认为配置的范数
     """
     from ..math import Inner
-    return Inner()(x, y)
+    return Inner()(x, y, semiring)
 
 
 def fuzz_outer(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray) -> Fuzznum | Fuzzarray:
@@ -46,3 +48,17 @@ def fuzz_cartprod(x: Fuzznum | Fuzzarray, y: Fuzznum | Fuzzarray) -> Fuzznum | F
     """
     from ..math import Cartprod
     return Cartprod()(x, y)
+
+
+def fuzz_einsum(subscripts: str, *operands: Fuzznum | Fuzzarray,
+                semiring=None, optimize=False) -> Fuzznum | Fuzzarray:
+    """
+    模糊数组的爱因斯坦求和, 在半环上做乘积与求和, 如 'eac,c->ea'
+    semiring: 'algebraic', 'einstein', 'maxmin', 'maxprod' 或已注册的阿基米德范数, 默认为配置的范数
+    optimize: 非分配半环(阿基米德范数)是否按贪心路径两两缩并, 即依次做两两乘积
+    """
+    from ..math import Einsum
+    return Einsum(semiring, optimize)(subscripts, *operands)
+
+
+einsum = fuzz_einsum
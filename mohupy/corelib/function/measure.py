@@ -29,3 +29,45 @@ def fuzz_distance(f1: Fuzznum | Fuzzarray,
     """
     from ..lib import Distance
     return Distance()(f1, f2, param_l, param_t, indeterminacy)
+
+
+def fuzz_cdist(f1: Fuzznum | Fuzzarray,
+               f2: Fuzznum | Fuzzarray,
+               param_l=2, param_t=1, indeterminacy=True, chunk=None) -> np.ndarray:
+    """
+    The pairwise distance matrix of two fuzzy arrays, entry (i, j) is the generalized
+            distance (see 'fuzz_distance') of the i-th element of f1 and the j-th element
+            of f2 in flat order. 'l=1' gives the Hamming distance, 'l=2' the Euclidean
+            distance and other 'l' the Minkowski distances. The matrix is computed with
+            broadcasting, block by block of rows, so the memory stays bounded.
+    :param f1:              the first fuzzy array (N elements)
+    :param f2:              the second fuzzy array (M elements)
+    :param param_l:         the parameter of generalized distance
+    :param param_t:         the risk factor for normalization process
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param chunk:           the number of rows of a block, sized automatically by default
+    :return:                the (N, M) distance matrix
+    """
+    from ..lib import CDistance
+    return CDistance()(f1, f2, param_l, param_t, indeterminacy, chunk)
+
+
+def fuzz_pdist(f: Fuzznum | Fuzzarray,
+               param_l=2, param_t=1, indeterminacy=True, chunk=None) -> np.ndarray:
+    """
+    The condensed pairwise distance vector of the elements of a fuzzy array, that is,
+            the distances of the pairs (i, j) with i < j in the order of
+            'scipy.spatial.distance.pdist'.
+    :param f:               the fuzzy array (N elements)
+    :param param_l:         the parameter of generalized distance
+    :param param_t:         the risk factor for normalization process
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param chunk:           the number of rows of a block
+    :return:                the distance vector of length N * (N - 1) / 2
+    """
+    from ..lib import PDistance
+    return PDistance()(f, param_l, param_t, indeterminacy, chunk)
+
+
+cdist = fuzz_cdist
+pdist = fuzz_pdist
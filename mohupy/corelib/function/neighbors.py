@@ -0,0 +1,232 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/12 下午2:30
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ...core import Fuzznum, Fuzzarray, fuzzset
+from ..regedit.distance import distance_features, minkowskiWeight
+
+
+class NeighborIndex:
+    """
+        Nearest-neighbour index of the elements of a fuzzy array.
+
+        Every element is mapped to its features (md^q, nmd^q, pi^q) (the bounds
+        of both degrees for interval-valued fuzzy numbers), where the generalized
+        distance of 'fuzz_distance' is a scaled Minkowski distance. The features
+        are bucketed in a uniform grid over their first two coordinates, stored
+        as sorted point ids with the offsets of every cell. A query visits the
+        rings of cells around its own cell, and the distance to a ring is bounded
+        below by the coordinates of the grid alone, so the search stops as soon
+        as no unvisited cell can hold a closer element: the results are exact.
+
+        Inserted elements are kept in a pending buffer that is scanned by every
+        query, and merged into the grid once the buffer is large.
+
+        Parameters
+        ----------
+            x : Fuzzarray
+                The q-rung orthopair or interval-valued fuzzy array, its elements
+                are indexed in flat order.
+            l : int or float
+                The generic distance parameter, 'l=1' Hamming, 'l=2' Euclidean.
+            indeterminacy : bool
+                Whether the distance contains indeterminacy.
+            leaf : int
+                The average number of elements of a non-empty grid cell.
+
+        Examples
+        --------
+            In [1]: index = NeighborIndex(x)
+            In [2]: dist, ids = index.query(f, k=5)
+            In [3]: index.insert(y)
+            In [4]: dist, ids = index.radius(f, 0.1)
+    """
+
+    def __init__(self, x, l=2, indeterminacy=True, leaf=8):
+        x = x if isinstance(x, Fuzzarray) else fuzzset(x)
+        assert x.mtype in minkowskiWeight, f'Unsupported mtype: {x.mtype}.'
+        assert l > 0, 'The value of l must be greater than 0.'
+        self.qrung = x.qrung
+        self.mtype = x.mtype
+        self.l = l
+        self.indeterminacy = indeterminacy
+        self.leaf = leaf
+        self.inner, self.outer = minkowskiWeight[x.mtype]
+
+        self.__features = self.__map(x)
+        self.__pending = None
+        self.__build()
+
+    def __len__(self):
+        return self.__features.shape[0] + self.__pending_size()
+
+    def __pending_size(self):
+        return 0 if self.__pending is None else self.__pending.shape[0]
+
+    def __map(self, x):
+        x = x if isinstance(x, Fuzzarray) else fuzzset(x)
+        assert x.mtype == self.mtype and x.qrung == self.qrung, \
+            f'The fuzzy array (qrung:{x.qrung}, mtype:{x.mtype}) does not match the ' \
+            f'index (qrung:{self.qrung}, mtype:{self.mtype}).'
+        return distance_features(x, self.qrung, self.indeterminacy)
+
+    def __build(self):
+        """
+            Bucket the features into the grid, the cell of a point is given by
+            its first two coordinates.
+        """
+        if self.__pending is not None:
+            self.__features = np.concatenate((self.__features, self.__pending))
+            self.__pending = None
+        f = self.__features
+        n = f.shape[0]
+        self.grid = max(1, int(np.ceil(np.sqrt(n / self.leaf))))
+        self.lower = f[:, :2].min(axis=0) if n else np.zeros(2)
+        span = (f[:, :2].max(axis=0) - self.lower) if n else np.ones(2)
+        self.width = np.where(span > 0., span / self.grid, 1.)
+
+        cell = self.__cells(f[:, :2])
+        self.order = np.argsort(cell[:, 0] * self.grid + cell[:, 1], kind='stable')
+        counts = np.bincount(cell[:, 0] * self.grid + cell[:, 1], minlength=self.grid ** 2)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.points = f[self.order]
+
+    def __cells(self, f):
+        c = np.floor((f - self.lower) / self.width).astype(np.int64)
+        return np.clip(c, 0, self.grid - 1)
+
+    def __distance(self, f, q):
+        """
+            The distances (before the weights) of the rows of f to the query q.
+        """
+        if self.l == 2:
+            return np.sqrt(((f - q) ** 2).sum(axis=-1))
+        return (np.fabs(f - q) ** self.l).sum(axis=-1) ** (1. / self.l)
+
+    def __scale(self, d):
+        return self.outer * self.inner ** (1. / self.l) * d
+
+    def __ring(self, c, r):
+        """
+            The flat point positions of the cells on the ring r around cell c.
+        """
+        g = self.grid
+        if r == 0:
+            cells = np.array([c[0] * g + c[1]])
+        else:
+            span = np.arange(-r, r + 1)
+            side = np.arange(-r + 1, r)
+            dx = np.concatenate((span, span, np.full(side.size, -r), np.full(side.size, r)))
+            dy = np.concatenate((np.full(span.size, -r), np.full(span.size, r), side, side))
+            x, y = c[0] + dx, c[1] + dy
+            keep = (x >= 0) & (x < g) & (y >= 0) & (y < g)
+            cells = x[keep] * g + y[keep]
+        starts, ends = self.offsets[cells], self.offsets[cells + 1]
+        lengths = ends - starts
+        total = lengths.sum()
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        shift = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return shift + np.arange(total)
+
+    def __query_one(self, q, k):
+        c = self.__cells(q[None, :2])[0]
+        bound = self.width.min()
+        best_d = np.empty(0)
+        best_i = np.empty(0, dtype=np.int64)
+
+        if self.__pending is not None:
+            best_d = self.__distance(self.__pending, q)
+            best_i = self.__features.shape[0] + np.arange(self.__pending_size())
+
+        r = 0
+        while r < self.grid:
+            pos = self.__ring(c, r)
+            if pos.size:
+                best_d = np.concatenate((best_d, self.__distance(self.points[pos], q)))
+                best_i = np.concatenate((best_i, self.order[pos]))
+                if best_d.size > k:
+                    keep = np.argpartition(best_d, k - 1)[:k]
+                    best_d, best_i = best_d[keep], best_i[keep]
+            # 未访问的格子与查询点至少相距 r 个格宽
+            if best_d.size >= k and best_d.max() <= r * bound:
+                break
+            r += 1
+        order = np.lexsort((best_i, best_d))[:k]
+        return self.__scale(best_d[order]), best_i[order]
+
+    def __radius_one(self, q, radius):
+        c = self.__cells(q[None, :2])[0]
+        bound = self.width.min()
+        limit = radius / (self.outer * self.inner ** (1. / self.l))
+        dists, ids = [], []
+
+        if self.__pending is not None:
+            dists.append(self.__distance(self.__pending, q))
+            ids.append(self.__features.shape[0] + np.arange(self.__pending_size()))
+
+        r = 0
+        while r < self.grid and (r - 1) * bound <= limit:
+            pos = self.__ring(c, r)
+            if pos.size:
+                dists.append(self.__distance(self.points[pos], q))
+                ids.append(self.order[pos])
+            r += 1
+        d = np.concatenate(dists) if dists else np.empty(0)
+        i = np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+        within = d <= limit
+        d, i = d[within], i[within]
+        order = np.lexsort((i, d))
+        return self.__scale(d[order]), i[order]
+
+    def query(self, x, k=1):
+        """
+            The k nearest elements of every query.
+
+            Returns
+            -------
+                (distances, ids): of shape (k,) for a Fuzznum query and of shape
+                x.shape + (k,) for a Fuzzarray of queries, sorted by distance.
+                'ids' are the flat positions in the index (insertion order).
+        """
+        assert k >= 1, 'k must be at least 1.'
+        k = min(k, len(self))
+        features = self.__map(x)
+        result = [self.__query_one(q, k) for q in features]
+        if isinstance(x, Fuzznum):
+            return result[0]
+        d = np.array([t[0] for t in result]).reshape(x.shape + (k,))
+        i = np.array([t[1] for t in result]).reshape(x.shape + (k,))
+        return d, i
+
+    def radius(self, x, radius):
+        """
+            All the elements within the distance 'radius' of every query.
+
+            Returns
+            -------
+                (distances, ids) sorted by distance for a Fuzznum query, and a
+                list of them (flat order) for a Fuzzarray of queries.
+        """
+        features = self.__map(x)
+        result = [self.__radius_one(q, radius) for q in features]
+        if isinstance(x, Fuzznum):
+            return result[0]
+        return result
+
+    def insert(self, x):
+        """
+            Insert the elements of x after the indexed ones. They are scanned
+            by the queries until the pending elements exceed the square root of
+            the index size (at least 1024), then the grid is rebuilt.
+        """
+        f = self.__map(x)
+        self.__pending = f if self.__pending is None else np.concatenate((self.__pending, f))
+        if self.__pending_size() > max(1024, int(np.sqrt(self.__features.shape[0]))):
+            self.__build()
+        return self
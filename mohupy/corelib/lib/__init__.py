@@ -10,7 +10,7 @@ from .classConstruct import (ZerosConstruct, PossConstruct, NegsConstruct,
                              NegsLikeConstruct, FullLikeConstruct)
 
 from .classIO import Savez, Loadz, ToCSV, LoadCSV
-from .classMeasure import Distance
+from .classMeasure import Distance, CDistance, PDistance
 from .classPlot import Plot
 from .classString import StrToFuzz
 from .classUtils import Isscalar, FuncForFuzz, AsFuzzarray
@@ -9,8 +9,8 @@ import numpy as np
 
 from .base import Library
 from ..regedit import fuzzDis
+from ..regedit.distance import distance_qrohfn_array, fuzzCdist, CDIST_BLOCK
 from ...core import Fuzznum, Fuzzarray
-from ...config import Config
 
 
 class Distance(Library):
@@ -37,14 +37,77 @@ class Distance(Library):
                 Determine whether the distance formula contains indeterminacy.
         """
 
+        # 按操作数的类型分派, 与全局配置的 mtype 无关
+        mtype = f1.mtype
         if isinstance(f1, Fuzznum) and isinstance(f2, Fuzznum):
-            return fuzzDis[Config.mtype](f1, f2, l, t, indeterminacy)
+            return fuzzDis[mtype](f1, f2, l, t, indeterminacy)
+        # 犹豫模糊集合，批量归一化后在矩阵上整体计算
+        if mtype == 'qrohfn' and \
+                all(isinstance(f, Fuzznum) or f.ragged is not None for f in (f1, f2)):
+            return distance_qrohfn_array(f1, f2, l, t, indeterminacy)
         if isinstance(f1, Fuzznum) and isinstance(f2, Fuzzarray):
-            vec_func = np.vectorize(fuzzDis[Config.mtype])
+            vec_func = np.vectorize(fuzzDis[mtype])
             return vec_func(f1, f2.array, l, t, indeterminacy)
         if isinstance(f1, Fuzzarray) and isinstance(f2, Fuzznum):
-            vec_func = np.vectorize(fuzzDis[Config.mtype])
+            vec_func = np.vectorize(fuzzDis[mtype])
             return vec_func(f1.array, f2, l, t, indeterminacy)
         if isinstance(f1, Fuzzarray) and isinstance(f2, Fuzzarray):
-            vec_func = np.vectorize(fuzzDis[Config.mtype])
+            vec_func = np.vectorize(fuzzDis[mtype])
             return vec_func(f1.array, f2.array, l, t, indeterminacy)
+
+
+def _flat(f):
+    from ...core import fuzzset
+    f = f if isinstance(f, Fuzzarray) else fuzzset(f)
+    return f.reshape(f.size) if f.ndim != 1 else f
+
+
+class CDistance(Library):
+    def function(self, f1, f2, l, t, indeterminacy, chunk):
+        """
+            The pairwise distance matrix of two fuzzy arrays. The elements are
+            taken in flat order and entry (i, j) is the generalized distance of
+            the element i of f1 and the element j of f2 (see 'Distance'). The
+            matrix is computed block by block of rows with broadcasting.
+
+        Parameters
+        ----------
+            f1: fuzzy array or fuzzy number of N elements.
+            f2: fuzzy array or fuzzy number of M elements.
+            l: the generic distance function parameter.
+            t: the parameter of the normalization function (hesitant fuzzy numbers).
+            indeterminacy: Bool
+                Determine whether the distance formula contains indeterminacy.
+            chunk: int or None
+                The number of rows of a block, by default the blocks are sized to
+                bound the memory of the intermediates.
+
+        Returns
+        -------
+            np.ndarray of shape (N, M)
+        """
+        assert f1.mtype == f2.mtype, f"mtype does not match: ('{f1.mtype}', '{f2.mtype}')."
+        assert f1.qrung == f2.qrung, f"qrung does not match: ({f1.qrung}, {f2.qrung})."
+        assert l > 0, "The value of l must be greater than 0."
+        assert f1.mtype in fuzzCdist, f'Unsupported mtype: {f1.mtype}.'
+        return fuzzCdist[f1.mtype](_flat(f1), _flat(f2), l, t, indeterminacy, chunk)
+
+
+class PDistance(Library):
+    def function(self, f, l, t, indeterminacy, chunk):
+        """
+            The condensed pairwise distance vector of the elements of a fuzzy
+            array, in the order of scipy.spatial.distance.pdist: the distances
+            of the pairs (i, j) with i < j, row by row. A block of rows is only
+            computed against the elements after its first row.
+        """
+        f = _flat(f)
+        n = f.size
+        result = []
+        rows = chunk if chunk is not None else max(1, CDIST_BLOCK // max(n, 1))
+        for i in range(0, n - 1, rows):
+            r = min(rows, n - 1 - i)
+            block = CDistance()(f.take(np.arange(i, i + r)), f.take(np.arange(i + 1, n)),
+                                l, t, indeterminacy, chunk)
+            result.extend(block[a, a:] for a in range(r))
+        return np.concatenate(result) if result else np.empty(0)
@@ -5,4 +5,4 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-from .classProduct import Dot, Inner, Outer, Cartadd, Cartprod
+from .classProduct import Dot, Inner, Outer, Cartadd, Cartprod, Einsum
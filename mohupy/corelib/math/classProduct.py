@@ -11,8 +11,23 @@ from .base import Mathematics
 from ...core import Fuzznum, Fuzzarray
 
 
+def _semiring_product(x, y, semiring):
+    """
+        Whether the product of x and y is computed on the md/nmd arrays under
+        a semiring: both are columnar fuzzy arrays of at most two dimensions.
+    """
+    from ...core.operation import columnar
+    if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray) and \
+            0 < x.ndim <= 2 and 0 < y.ndim <= 2 and columnar(x, y):
+        return True
+    from ...config import Config
+    assert semiring is None or semiring == Config.arch, \
+        f'The semiring \'{semiring}\' needs columnar fuzzy arrays of at most two dimensions.'
+    return False
+
+
 class Dot(Mathematics):
-    def function(self, x, y):
+    def function(self, x, y, semiring=None):
         """
             Returns the dot product of two Fuzzarray.
 
@@ -22,12 +37,19 @@ class Dot(Mathematics):
                 The first Fuzzarray or Fuzznum.
             y : Fuzzarray or Fuzznum
                 The second Fuzzarray or Fuzznum.
+            semiring : str or None
+                The semiring of the product of columnar fuzzy matrices or
+                vectors (see 'core.semiring'), None for the configured norm.
 
             Returns
             -------
             Fuzzarray or np.float_
                 The dot product of x and y.
         """
+        if _semiring_product(x, y, semiring):
+            from ...core.semiring import fuzz_matmul
+            return fuzz_matmul(x, y, semiring)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return x * y
 
@@ -60,7 +82,7 @@ class Dot(Mathematics):
 
 
 class Inner(Mathematics):
-    def function(self, x, y):
+    def function(self, x, y, semiring=None):
         """
             Returns the inner product of two Fuzzarray.
 
@@ -70,12 +92,19 @@ class Inner(Mathematics):
                 The first Fuzzarray or Fuzznum.
             y : Fuzzarray or Fuzznum
                 The second Fuzzarray or Fuzznum.
+            semiring : str or None
+                The semiring of the product of columnar fuzzy matrices or
+                vectors (see 'core.semiring'), None for the configured norm.
 
             Returns
             -------
             Fuzzarray or np.float_
                 The inner product of x and y.
         """
+        if _semiring_product(x, y, semiring):
+            from ...core.semiring import fuzz_matmul
+            return fuzz_matmul(x, y.T if y.ndim == 2 else y, semiring)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return x * y
 
@@ -237,3 +266,31 @@ class Cartprod(Mathematics):
             newset = Fuzzarray(x.qrung)
             newset.array = np.asarray(np.meshgrid(x.array, y.array))
             return newset
+
+
+class Einsum(Mathematics):
+    def __init__(self, semiring=None, optimize=False):
+        self.semiring = semiring
+        self.optimize = optimize
+
+    def function(self, subscripts, *operands):
+        """
+            Einstein summation of fuzzy arrays under a semiring.
+
+            Parameters
+            ----------
+            subscripts : str
+                The subscripts of the summation, as 'np.einsum' (without ellipsis).
+            operands : Fuzzarray or Fuzznum
+                Columnar fuzzy arrays of the same mtype and qrung.
+
+            The semiring and whether the non-distributive semirings are
+            contracted pair by pair ('optimize') are given to the constructor.
+
+            Returns
+            -------
+            Fuzzarray or Fuzznum
+                The contracted fuzzy array, or the fuzzy number of a full contraction.
+        """
+        from ...core.semiring import fuzz_einsum
+        return fuzz_einsum(subscripts, *operands, name=self.semiring, optimize=self.optimize)
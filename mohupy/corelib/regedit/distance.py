@@ -135,3 +135,148 @@ def distance_qrohfn(d1, d2, l, t, indeterminacy=True):
         return (0.5 * (mds + nmds)) ** (1 / l)
 
 
+def distance_qrohfn_array(d1, d2, l, t, indeterminacy=True):
+    """
+    The generalized distance of Q-rung hesitant fuzzy arrays, element by element
+        with broadcasting. The same distance as 'distance_qrohfn', but the two
+        elements of every pair are normalized to their common length by one
+        batch normalization of each array, and the distances are computed on
+        the dense normalized matrices.
+
+    Parameters
+    ----------
+        d1: Q-rung hesitant fuzzy array or element.
+        d2: Q-rung hesitant fuzzy array or element.
+        l: the generic distance function parameter.
+        t: the parameter of the normalization function.
+        indeterminacy: Bool
+            Determine whether the distance formula contains indeterminacy.
+
+    Returns
+    -------
+        np.ndarray: The generalized distances of the broadcast pairs.
+    """
+    from ...core import Fuzzarray, fuzzset
+
+    assert 0 <= t <= 1, "risk factor 't' must be in [0,1] range."
+    assert d1.qrung == d2.qrung, "the qrung of two fuzzy number must be equal."
+    d1 = d1 if isinstance(d1, Fuzzarray) else fuzzset(d1)
+    d2 = d2 if isinstance(d2, Fuzzarray) else fuzzset(d2)
+    q = d1.qrung
+
+    shape = np.broadcast_shapes(d1.shape, d2.shape)
+    d1 = d1.take(np.broadcast_to(np.arange(d1.size).reshape(d1.shape), shape))
+    d2 = d2.take(np.broadcast_to(np.arange(d2.size).reshape(d2.shape), shape))
+    (m1, n1), (m2, n2) = d1.ragged, d2.ragged
+    assert np.all(m1.lengths > 0) and np.all(n1.lengths > 0) and \
+           np.all(m2.lengths > 0) and np.all(n2.lengths > 0), \
+        "the q-rohfns must have membership and non-membership degrees."
+
+    # 每一对元素归一化到两者中较长的长度，超出部分为 NaN
+    lm = np.maximum(m1.lengths, m2.lengths).reshape(shape)
+    ln = np.maximum(n1.lengths, n2.lengths).reshape(shape)
+    md1, nmd1 = d1.normalize(t, (lm, ln))
+    md2, nmd2 = d2.normalize(t, (lm, ln))
+
+    mds = np.nansum(np.fabs(md1 ** q - md2 ** q) ** l, axis=-1) / lm
+    nmds = np.nansum(np.fabs(nmd1 ** q - nmd2 ** q) ** l, axis=-1) / ln
+    if not indeterminacy:
+        return (0.5 * (mds + nmds)) ** (1 / l)
+
+    def __ind(md, nmd):
+        acc = np.nansum(md ** q, axis=-1) / lm + np.nansum(nmd ** q, axis=-1) / ln
+        with np.errstate(invalid='ignore'):
+            return np.where(acc == 1., 0., (1. - acc) ** (1. / q))
+
+    pi = np.fabs(__ind(md1, nmd1) ** q - __ind(md2, nmd2) ** q) ** l
+    return (0.5 * (mds + nmds + pi)) ** (1 / l)
+
+
+################################################################
+# Pairwise distance matrices
+################################################################
+
+fuzzCdist = Registry()
+
+# The largest number of float64 intermediates of one block of rows of a
+# pairwise distance matrix, so that the memory of 'cdist' stays bounded.
+CDIST_BLOCK = 2 ** 22
+
+# mtype: (inner, outer) weights of the generalized distance
+#   outer * (inner * sum_k |f1_k - f2_k|^l)^(1/l)
+# of the features of 'distance_features', as 'distance_qrofn' and 'distance_ivfn'.
+minkowskiWeight = {'qrofn': (0.5, 1.), 'ivfn': (1., 0.25)}
+
+
+def _blocks(n, width, chunk=None):
+    """
+        The row slices of the blocks of a pairwise computation whose rows need
+        'width' intermediates each.
+    """
+    rows = chunk if chunk is not None else max(1, CDIST_BLOCK // max(width, 1))
+    for i in range(0, n, rows):
+        yield slice(i, min(i + rows, n))
+
+
+def _minkowski(f1, f2, l, inner, outer, chunk):
+    """
+        outer * (inner * sum_k |f1[i, k] - f2[j, k]|^l)^(1/l) of all the rows
+        i of f1 and j of f2, computed block by block of rows.
+    """
+    n, m, k = f1.shape[0], f2.shape[0], f1.shape[1]
+    d = np.empty((n, m))
+    for s in _blocks(n, m * k, chunk):
+        diff = np.fabs(f1[s, None, :] - f2[None, :, :]) ** l
+        d[s] = outer * (inner * diff.sum(axis=-1)) ** (1 / l)
+    return d
+
+
+def distance_features(f, q, indeterminacy):
+    """
+        The q-th powers of the degrees (and of the indeterminacy) of every
+        element, as the columns of a (N, K) matrix.
+    """
+    n = f.size
+    cols = [np.reshape(f.md ** q, (n, -1)), np.reshape(f.nmd ** q, (n, -1))]
+    if indeterminacy:
+        cols.append(np.reshape(np.asarray(f.ind, dtype=np.float64) ** q, (n, 1)))
+    return np.concatenate(cols, axis=1)
+
+
+@fuzzCdist('qrofn')
+def cdist_qrofn(f1, f2, l, t=None, indeterminacy=True, chunk=None):
+    """
+        The distance matrix of two flat q-rung orthopair fuzzy arrays, with the
+        same generalized distance as 'distance_qrofn'.
+    """
+    q = f1.qrung
+    return _minkowski(distance_features(f1, q, indeterminacy), distance_features(f2, q, indeterminacy),
+                      l, *minkowskiWeight['qrofn'], chunk)
+
+
+@fuzzCdist('ivfn')
+def cdist_ivfn(f1, f2, l, t=None, indeterminacy=True, chunk=None):
+    """
+        The distance matrix of two flat interval-valued fuzzy arrays, with the
+        same generalized distance as 'distance_ivfn'.
+    """
+    q = f1.qrung
+    return _minkowski(distance_features(f1, q, indeterminacy), distance_features(f2, q, indeterminacy),
+                      l, *minkowskiWeight['ivfn'], chunk)
+
+
+@fuzzCdist('qrohfn')
+def cdist_qrohfn(f1, f2, l, t, indeterminacy=True, chunk=None):
+    """
+        The distance matrix of two flat Q-rung hesitant fuzzy arrays. Every pair
+        is normalized to its own common length, so a block of rows is computed
+        by 'distance_qrohfn_array' on the broadcast block of pairs.
+    """
+    n, m = f1.size, f2.size
+    width = m * 2 * max(max(d.lengths.max(initial=1) for d in f.ragged) for f in (f1, f2))
+    d = np.empty((n, m))
+    right = f2.reshape(1, m)
+    for s in _blocks(n, width, chunk):
+        left = f1.take(np.arange(s.start, s.stop)[:, None])
+        d[s] = distance_qrohfn_array(left, right, l, t, indeterminacy)
+    return d
@@ -8,6 +8,8 @@ __all__ = []
 from .fuzzmeas import (dirac_meas, add_meas, sym_meas, lambda_meas,
                        mobius_rep, zeta_rep, vector_rep, dict_rep)
 from .utils import (subsets, str_subsets, dicts, hasse_diagram)
+from .capacity import (Capacity, LambdaMeasure, cardinality,
+                       mobius_transform, zeta_transform)
 
 from .indices import *
 
@@ -26,6 +28,11 @@ __all__ += [
     'str_subsets',
     'dicts',
     'hasse_diagram',
+    'Capacity',
+    'LambdaMeasure',
+    'cardinality',
+    'mobius_transform',
+    'zeta_transform',
     # 'deriv',
     # 'shapley',
     # 'banzhaf',
@@ -0,0 +1,416 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/13 上午10:20
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ..core import Approx
+from .fuzzmeas import dirac_meas, add_meas, sym_meas, lambda_meas
+
+
+def cardinality(n):
+    """
+        The number of elements of every subset of a set of n elements, in
+        bitmask order: the entry 'mask' is the popcount of 'mask'.
+
+        Parameters
+        ----------
+            n : int
+                The number of elements of the fixed set.
+
+        Returns
+        -------
+            np.ndarray
+                The int64 array of length 2^n.
+    """
+    card = np.zeros(1, dtype=np.int64)
+    for _ in range(n):
+        # 第 i 位置 1 的子集恰好是前一半子集各加一个元素
+        card = np.concatenate((card, card + 1))
+    return card
+
+
+def _subset_sum(values, sign):
+    """
+        The in-place fast subset-sum over the bits of the mask: after the pass
+        of bit i, the entry of a mask with bit i set has added (or subtracted)
+        the entry of the same mask without bit i.
+    """
+    n = values.size.bit_length() - 1
+    for i in range(n):
+        v = values.reshape(-1, 2, 1 << i)
+        if sign > 0:
+            v[:, 1, :] += v[:, 0, :]
+        else:
+            v[:, 1, :] -= v[:, 0, :]
+    return values
+
+
+def _truncate(values, k):
+    if k is not None:
+        values[cardinality(values.size.bit_length() - 1) > k] = 0.
+    return values
+
+
+def mobius_transform(values, k=None):
+    """
+        The Möbius representation of all the subsets of a capacity vector.
+
+        The Möbius transform m(A) = sum_{B ⊆ A} (-1)^{|A - B|} μ(B) of all the
+        2^n subsets is computed in O(n·2^n) by the fast subset-sum transform,
+        instead of enumerating the subsets of every subset.
+
+        Parameters
+        ----------
+            values : list, np.ndarray or Capacity
+                The measures of the 2^n subsets in bitmask order.
+            k : int, optional
+                The k-additive truncation, the Möbius coefficients of the
+                subsets of more than k elements are set to 0.
+
+        Returns
+        -------
+            np.ndarray
+                The Möbius vector in bitmask order.
+
+        Examples
+        --------
+            In [1]: c = Capacity.from_measure(lambda_meas, [0.4,0.25,0.37,0.2])
+            In [2]: mobius_transform(c)[0b011]
+            Out[2]: -0.04403002498696024
+    """
+    values = values.values if isinstance(values, Capacity) else values
+    values = np.array(values, dtype=np.float64).ravel()
+    assert values.size & (values.size - 1) == 0, \
+        f'ERROR: The number of measures must be a power of 2, not {values.size}.'
+    return _truncate(_subset_sum(values, -1), k)
+
+
+def zeta_transform(values, k=None):
+    """
+        The zeta transform (inverse Möbius transform) of all the subsets.
+
+        The zeta transform μ(A) = sum_{B ⊆ A} m(B) recovers the capacity from
+        its Möbius representation, in O(n·2^n).
+
+        Parameters
+        ----------
+            values : list or np.ndarray
+                The Möbius coefficients of the 2^n subsets in bitmask order.
+            k : int, optional
+                The k-additive truncation, the coefficients of the subsets of
+                more than k elements are dropped before the transform.
+
+        Returns
+        -------
+            np.ndarray
+                The capacity vector in bitmask order.
+    """
+    values = np.array(values, dtype=np.float64).ravel()
+    assert values.size & (values.size - 1) == 0, \
+        f'ERROR: The number of coefficients must be a power of 2, not {values.size}.'
+    return _subset_sum(_truncate(values, k), 1)
+
+
+class Capacity:
+    """
+        Bitmask-indexed fuzzy measure (capacity).
+
+        The capacity of a fixed set of n elements is stored as one float array
+        of length 2^n, the entry 'mask' is the measure of the subset whose
+        elements are the set bits of 'mask': bit i is the element s[i]. This is
+        the order of 'subsets(s)', so 'values' is the vector representation of
+        the fixed set. Looking up a subset is an array index, and a batch of
+        subsets is one fancy index.
+
+        A capacity is callable as 'capacity(e)', and can be passed in place of
+        a fuzzy measure function: the fixed set is the set of the capacity and
+        any extra argument is ignored. A subset given by its elements needs a
+        fixed set of distinct elements, a fixed set with repeated elements
+        (e.g. equal densities) is only indexed by bitmask.
+
+        Parameters
+        ----------
+            values : list or np.ndarray
+                The measures of the 2^n subsets in bitmask order.
+            s : list or np.ndarray, optional
+                The fixed set, the elements are only used to find the bitmask
+                of a subset given by its elements. Default to the indices 0..n-1.
+
+        Examples
+        --------
+            In [1]: c = Capacity.from_measure(lambda_meas, [0.4,0.25,0.37,0.2])
+            In [2]: c[0b011]
+            Out[2]: 0.6059699750130398
+            In [3]: c([0.4,0.25])
+            Out[3]: 0.6059699750130398
+            In [4]: c[np.array([1, 2, 3])]
+            Out[4]: array([0.4       , 0.25      , 0.60596998])
+    """
+
+    def __init__(self, values, s=None):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n = int(values.size).bit_length() - 1
+        assert values.size == 1 << n, \
+            f'ERROR: The number of measures must be a power of 2, not {values.size}.'
+        s = np.arange(n) if s is None else np.asarray(s).ravel()
+        assert s.size == n, \
+            f'ERROR: The fixed set must have {n} elements, not {s.size}.'
+        self.values = values
+        self.set = s
+        self.__cardinality = None
+
+    @property
+    def n(self):
+        return self.set.size
+
+    @property
+    def cardinality(self):
+        if self.__cardinality is None:
+            self.__cardinality = cardinality(self.n)
+        return self.__cardinality
+
+    def __len__(self):
+        return self.values.size
+
+    def __repr__(self):
+        return f'Capacity(n={self.n}, values={np.array2string(self.values, threshold=16)})'
+
+    def __getitem__(self, mask):
+        return self.values[mask]
+
+    def __call__(self, e, *args):
+        return self.values[self.mask(e)]
+
+    def mask(self, e):
+        """
+            The bitmask of the subset 'e' given by its elements. The elements
+            of the fixed set must be distinct, otherwise use the bitmask.
+        """
+        assert np.unique(self.set).size == self.n, \
+            'ERROR: The fixed set has repeated elements, index the subsets by bitmask.'
+        e = np.atleast_1d(np.asarray(e))
+        assert len(np.setdiff1d(e, self.set)) == 0, \
+            'ERROR: The element or list must be in the set.'
+        bits = np.isin(self.set, e)
+        return int(np.sum(np.left_shift(1, np.flatnonzero(bits))))
+
+    def is_normalized(self):
+        return bool(np.round(self.values[0], Approx.round) == 0 and
+                    np.round(self.values[-1], Approx.round) == 1)
+
+    def is_monotone(self):
+        """
+            Whether adding any element never decreases the measure.
+        """
+        masks = np.arange(len(self))
+        for i in range(self.n):
+            low = masks[(masks >> i) & 1 == 0]
+            if np.any(self.values[low | (1 << i)] < self.values[low] - 10 ** -Approx.round):
+                return False
+        return True
+
+    def mobius(self, k=None):
+        """
+            The Möbius representation of the capacity, see 'mobius_transform'.
+        """
+        return mobius_transform(self.values, k)
+
+    @classmethod
+    def from_mobius(cls, m, s=None, k=None):
+        """
+            The capacity of a Möbius representation, see 'zeta_transform'.
+        """
+        return cls(zeta_transform(m, k), s)
+
+    def truncate(self, k):
+        """
+            The k-additive capacity with the Möbius coefficients of this one
+            up to the subsets of k elements.
+        """
+        return self.from_mobius(self.mobius(k), self.set)
+
+    @staticmethod
+    def additive(s):
+        """
+            The measure of every subset is the sum of its elements.
+        """
+        s = np.asarray(s, dtype=np.float64).ravel()
+        values = np.zeros(1)
+        for x in s:
+            values = np.concatenate((values, values + x))
+        return values
+
+    @staticmethod
+    def multiplicative(s, l):
+        """
+            The lambda measure (prod(1 + l * e) - 1) / l of every subset.
+        """
+        s = np.asarray(s, dtype=np.float64).ravel()
+        values = np.ones(1)
+        for x in s:
+            values = np.concatenate((values, values * (1. + l * x)))
+        return (values - 1.) / l
+
+    @classmethod
+    def from_measure(cls, func, s):
+        """
+            The capacity of a fuzzy measure function on the fixed set 's'.
+
+            The built-in measures are computed for all subsets at once, by
+            doubling the table over the elements of the set: 'lambda_meas'
+            solves its parameter once instead of once per subset. Any other
+            function 'func(e, s)' is evaluated on every subset.
+
+            Parameters
+            ----------
+                func : function
+                    The fuzzy measure function.
+                    Optional: dirac_meas, add_meas, sym_meas, lambda_meas
+                s : list or np.ndarray
+                    The fixed set.
+
+            Returns
+            -------
+                Capacity
+        """
+        s = np.asarray(s)
+        n = s.size
+        if func is add_meas:
+            assert np.round(np.sum(s), Approx.round) == 1, \
+                "ERROR: The sum of the measurements must be 1."
+            return cls(cls.additive(s), s)
+        if func is sym_meas:
+            return cls(cardinality(n) / n, s)
+        if func is dirac_meas:
+            # 固定集合的每个子集都包含于固定集合
+            return cls(np.ones(1 << n), s)
+        if func is lambda_meas:
+            return LambdaMeasure(s).capacity()
+
+        from .utils import subsets
+        return cls([func(e, s) for e in subsets(s.tolist())], s)
+
+
+class LambdaMeasure:
+    """
+        The Sugeno lambda fuzzy measure of a density vector.
+
+        The parameter lambda is the root in (-1, +inf) other than 0 of
+        prod(1 + lambda * s) = 1 + lambda, i.e. the root of the increasing
+        function g(lambda) = (prod(1 + lambda * s) - 1) / lambda - 1, whose
+        value at 0 is sum(s) - 1. So lambda > 0 when sum(s) < 1, lambda lies
+        in [-1, 0) when sum(s) > 1, and lambda = 0 (the additive measure)
+        when sum(s) = 1 or when less than two densities are nonzero (g is
+        then constant and has no root). The root is solved once by Brent's
+        method in this bracket and cached per density vector.
+
+        The measure of the subset A is (prod_{i in A}(1 + lambda * s_i) - 1) / lambda,
+        a batch of bitmasks is evaluated by summing log(1 + lambda * s) over
+        their bits.
+
+        Parameters
+        ----------
+            s : list or np.ndarray
+                The densities (the measures of the singletons), the fixed set.
+
+        Examples
+        --------
+            In [1]: m = LambdaMeasure([0.4,0.25,0.37,0.2])
+            In [2]: m.l
+            Out[2]: -0.4403002498696018
+            In [3]: m([0.4,0.25])
+            Out[3]: 0.6059699750130398
+            In [4]: m[np.array([0b011, 0b1111])]
+            Out[4]: array([0.60596998, 1.        ])
+    """
+    __roots = {}
+
+    def __init__(self, s):
+        s = np.asarray(s, dtype=np.float64).ravel()
+        assert np.all((s >= 0.) & (s <= 1.)), \
+            'ERROR: The densities must be in [0, 1].'
+        self.set = s
+        self.l = self.solve(s)
+        # 密度为 1 且 lambda = -1 时 log(0) 截断为有限值, expm1 后仍为 -1
+        with np.errstate(divide='ignore'):
+            self.__logs = np.maximum(np.log1p(self.l * s), np.log(np.finfo(np.float64).tiny))
+
+    @property
+    def n(self):
+        return self.set.size
+
+    def __repr__(self):
+        return f'LambdaMeasure(lambda={self.l}, s={self.set})'
+
+    @classmethod
+    def solve(cls, s):
+        """
+            The parameter lambda of the densities 's', cached per vector.
+        """
+        s = np.asarray(s, dtype=np.float64).ravel()
+        key = s.tobytes()
+        if key not in cls.__roots:
+            if len(cls.__roots) >= 1024:
+                cls.__roots.clear()
+            cls.__roots[key] = cls.__root(s)
+        return cls.__roots[key]
+
+    @staticmethod
+    def __root(s):
+        def g(lam):
+            if lam == 0.:
+                return np.sum(s) - 1.
+            with np.errstate(divide='ignore', over='ignore'):
+                return np.expm1(np.sum(np.log1p(lam * s))) / lam - 1.
+
+        total = np.sum(s)
+        # 少于两个非零密度时 g 为常数 sum(s) - 1, 没有非零根, 按可加测度计算
+        if np.round(total, Approx.round) == 1 or np.count_nonzero(s) < 2:
+            return 0.
+        if total > 1.:
+            # g(-1) = -prod(1 - s) <= 0 < g(0)
+            lo, hi = -1., 0.
+            if g(lo) == 0.:
+                return lo
+        else:
+            lo, hi = 0., 1.
+            while g(hi) <= 0.:
+                assert np.isfinite(hi * 2.), \
+                    'ERROR: The lambda equation of the densities has no finite root.'
+                lo, hi = hi, hi * 2.
+        from scipy.optimize import brentq
+        l = brentq(g, lo, hi, xtol=1e-15, rtol=4 * np.finfo(float).eps)
+        # 与 'lambda_meas' 一致, 近似为 0 的 lambda 按可加测度计算
+        return 0. if np.round(l, Approx.round) == 0 else float(l)
+
+    def __call__(self, e, *args):
+        e = np.asarray(e, dtype=np.float64)
+        if self.l == 0.:
+            return np.float_(np.sum(e))
+        with np.errstate(divide='ignore'):
+            return np.float_(np.expm1(np.sum(np.log1p(self.l * e))) / self.l)
+
+    def __getitem__(self, mask):
+        """
+            The measures of a bitmask or an array of bitmasks.
+        """
+        mask = np.asarray(mask, dtype=np.int64)
+        weights = self.set if self.l == 0. else self.__logs
+        total = np.zeros(mask.shape)
+        for i in range(self.n):
+            total += ((mask >> i) & 1) * weights[i]
+        if self.l == 0.:
+            return total
+        return np.expm1(total) / self.l
+
+    def capacity(self):
+        """
+            The bitmask capacity of all the 2^n subsets.
+        """
+        if self.l == 0.:
+            return Capacity(Capacity.additive(self.set), self.set)
+        return Capacity(Capacity.multiplicative(self.set, self.l), self.set)
@@ -107,16 +107,13 @@ def lambda_meas(e, s):
         The lambda fuzzy measure function.
             We have a subset of the fuzzy measure sets, then use the
             function to calculate the fuzzy measure of the subset.
-            In this function, an anonymous function is defined that
-            calculates the parameter lambda of lambda fuzzy measure,
-            which returns an anonymous function.
 
-            The calculation of lambda needs to use optimize.fsolve
-            optimization calculation of the scipy library, because
-            the equation is a high-order nonlinear equation.
-
-            The initial value of lambda optimization calculation
-            is usually 1, as shown in the example below.
+            The parameter lambda is the nonzero root of the high-order
+            equation prod(1 + lambda * s) = 1 + lambda. It is solved by
+            'LambdaMeasure' with a bracketed root finder: lambda > 0 when
+            the sum of the set is less than 1, and in (-1, 0) when it is
+            greater than 1. The root is cached per fixed set, so repeated
+            calls on the same set do not solve it again.
 
         Parameters
         ----------
@@ -137,28 +134,17 @@ def lambda_meas(e, s):
 
         Notes
         -----
-            The __lamda function is to calculate the parameter lambda.
-            This anonymous equation needs to be calculated using optimize.fsolve
-            with the scipy library. The calculation is as follows.
+            The parameter lambda of a fixed set is given by 'LambdaMeasure'.
 
             In [1]: x = [0.4,0.25,0.37,0.2]
-            In [2]: np.float_(scipy.optimize.fsolve(lamda(x), np.array(-1)))
-            Out[2]: -0.4403002498696017
+            In [2]: LambdaMeasure(x).l
+            Out[2]: -0.4403002498696018
     """
-
-    def __lamda(sets):
-        return lambda lam: np.prod(1 + lam * sets) - lam - 1
-
     assert len(np.setdiff1d(e, s)) == 0, \
         'ERROR: The element or list must be in the set.'
 
-    from scipy.optimize import fsolve
-    l = fsolve(__lamda(np.asarray(s)), np.array(-1))
-
-    if np.round(l, Approx.round) == 0:
-        return np.float_(np.sum(e))
-    else:
-        return np.float_((np.prod(1 + l * e) - 1) / l)
+    from .capacity import LambdaMeasure
+    return LambdaMeasure(s)(e)
 
 
 def mobius_rep(e: (list, np.ndarray), func, *args):
@@ -7,6 +7,8 @@
 
 import numpy as np
 
+CHOQUET_BLOCK = 2 ** 16
+
 
 def choquet(e: (list, np.ndarray), func, *args, measurable_func=None, info=False, summation=True):
     """
@@ -83,6 +85,66 @@ def choquet(e: (list, np.ndarray), func, *args, measurable_func=None, info=False
     return sum(integral) if summation else integral
 
 
+def choquet_batch(X, capacity, chunk=CHOQUET_BLOCK):
+    """
+        Choquet integrals of many alternatives with the same fuzzy measure.
+
+        Every row of X is sorted in descending order by one vectorized argsort,
+        the subsets of the nested chain of a row (the k largest criteria) are
+        the cumulative sums of the bits of the sorted criteria, so the capacity
+        values of all the chains are gathered by one fancy index, and the
+        integral of a row is sum_k x_(k) * (μ(A_k) - μ(A_(k-1))). The rows are
+        computed in blocks of 'chunk' rows to keep the memory bounded.
+
+        Parameters
+        ----------
+            X : list or np.ndarray
+                The (N, n) matrix of the alternatives, column i is the
+                criterion of bit i of the capacity.
+            capacity : Capacity, LambdaMeasure, list or np.ndarray
+                The fuzzy measure of the 2^n subsets, indexed by bitmask.
+            chunk : int
+                The number of rows of a block.
+
+        Returns
+        -------
+            np.ndarray
+                The N Choquet integrals.
+
+        Examples
+        --------
+            In [1]: from mohupy import measure as mm
+            In [2]: s = [0.4,0.25,0.37,0.2]
+            In [3]: mm.choquet_batch([s], mm.Capacity.from_measure(mm.lambda_meas, s))
+            Out[3]: array([0.3404428])
+    """
+    X = np.asarray(X, dtype=np.float64)
+    X = X[None, :] if X.ndim == 1 else X
+    assert X.ndim == 2, \
+        'ERROR: The alternatives must be a (N, n) matrix.'
+    capacity = np.asarray(capacity, dtype=np.float64) \
+        if isinstance(capacity, (list, tuple, np.ndarray)) else capacity
+    n = X.shape[1]
+    assert n < 63, \
+        'ERROR: The number of criteria must be less than 63.'
+    if isinstance(capacity, np.ndarray):
+        assert capacity.size == 1 << n, \
+            f'ERROR: The capacity must have 2^{n} values, not {capacity.size}.'
+    assert chunk >= 1, 'ERROR: The chunk must be at least 1.'
+
+    empty = capacity[0]
+    result = np.empty(X.shape[0])
+    for start in range(0, X.shape[0], chunk):
+        x = X[start:start + chunk]
+        order = np.argsort(-x, axis=1, kind='stable')
+        masks = np.cumsum(np.left_shift(1, order), axis=1)
+        mu = capacity[masks]
+        # 链上相邻子集的测度之差即为每个准则的权重
+        p = np.diff(mu, axis=1, prepend=np.full((x.shape[0], 1), empty))
+        result[start:start + chunk] = (np.take_along_axis(x, order, axis=1) * p).sum(axis=1)
+    return result
+
+
 def sugeno(e: (list, np.ndarray), func, *args, measurable_func=None):
     """
         Sugeno integral based on arbitrary fuzzy measures over a subset of a
@@ -355,7 +355,9 @@ class GetItemGrad(Operation):
     def forward(self, x):
         from ..corelib.lib.classConstruct import NegsConstruct
         gx = NegsConstruct(x.qrung)(*self.in_shape)
-        np.add.at(gx.array, self.slices, x.array)
+        garray = gx.array
+        np.add.at(garray, self.slices, x.array)
+        gx.array = garray
         return gx
 
     def backward(self, grad):